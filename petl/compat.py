@@ -46,6 +46,7 @@ if PY2:
     except ImportError:
         import pickle
     maxint = sys.maxint
+    from Queue import Queue
     long = long
     xrange = xrange
     reduce = reduce
@@ -70,6 +71,7 @@ else:
     from io import StringIO, BytesIO
     import pickle
     maxint = sys.maxsize
+    from queue import Queue
 
 try:
     advance_iterator = next
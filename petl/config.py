@@ -16,3 +16,9 @@ display_limit = 5
 display_index_header = False
 display_vrepr = text_type
 sort_buffersize = 100000
+parallel_chunksize = 10000
+parallel_csv_chunksize = 1 << 24  # bytes
+row_index_interval = 10000
+hash_buffersize = 1000000
+batch_size = 1000
+memoize_maxsize = 10000
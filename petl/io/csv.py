@@ -7,8 +7,12 @@ from petl.compat import PY2
 
 
 # internal dependencies
+from petl.errors import ArgumentError
 from petl.util.base import Table
-from petl.io.sources import read_source_from_arg, write_source_from_arg
+from petl.io.sources import read_source_from_arg, write_source_from_arg, \
+    FileSource
+from petl.io.rowindex import newlinebytes
+from petl.io.csv_utils import csvdialect
 if PY2:
     from petl.io.csv_py2 import fromcsv_impl, tocsv_impl, appendcsv_impl, \
         teecsv_impl
@@ -17,8 +21,9 @@ else:
         teecsv_impl
 
 
-def fromcsv(source=None, encoding=None, errors='strict', header=None, 
-            **csvargs):
+def fromcsv(source=None, encoding=None, errors='strict', header=None,
+            types=None, infer_types=False, fields=None, workers=None,
+            chunksize=None, ordered=True, index=None, **csvargs):
     """
     Extract a table from a delimited file. E.g.::
 
@@ -53,17 +58,116 @@ def fromcsv(source=None, encoding=None, errors='strict', header=None,
 
     Note that all data values are strings, and any intended numeric values will
     need to be converted, see also :func:`petl.transform.conversions.convert`.
+    Alternatively, values can be converted as they are read, via the `types`
+    argument, a dictionary mapping field names or indices to functions, e.g.,
+    ``types={'bar': int}``, or by giving ``infer_types=True``, in which case
+    fields whose non-empty values in a sample of the first 1000 rows (or
+    `infer_types` rows if an integer is given) can all be parsed as integers
+    or floats are converted to :func:`int` or :func:`float`. Types given
+    explicitly take precedence over inferred types. Values which can't be
+    converted, e.g., empty strings, are left as-is. E.g.::
+
+        >>> table3 = etl.fromcsv('example.csv', types={'bar': int})
+        >>> table3
+        +-----+-----+
+        | foo | bar |
+        +=====+=====+
+        | 'a' |   1 |
+        +-----+-----+
+        | 'b' |   2 |
+        +-----+-----+
+        | 'c' |   2 |
+        +-----+-----+
+
+    If `fields` is given, a list of field names or indices, only those fields
+    are kept, as if by :func:`petl.transform.basics.cut`, with short rows
+    padded with `None`. Types and inferred types are then only applied to the
+    kept fields, and for dialects where values are not escaped, lines which
+    contain no quote characters are split only as far as the last field
+    needed, so unneeded values at the end of long rows are never extracted.
+    Applying :func:`petl.transform.basics.cut` or
+    :func:`petl.transform.basics.cutout` directly to the table returned by
+    this function does the same. E.g.::
+
+        >>> table4 = etl.fromcsv('example.csv', fields=['bar'])
+        >>> table4
+        +-----+
+        | bar |
+        +=====+
+        | '1' |
+        +-----+
+        | '2' |
+        +-----+
+        | '2' |
+        +-----+
+
+    If `workers` is given, an uncompressed file can be read in parallel by a
+    pool of `workers` processes. The file is memory-mapped and split into
+    byte ranges of about `chunksize` bytes (by default
+    `petl.config.parallel_csv_chunksize`), each ending at a newline, which
+    are parsed (and any `types` applied) in the worker processes. Rows are
+    output in file order, or as each range is parsed if `ordered` is False.
+    N.B., values must not contain newlines, as ranges are split at any
+    newline, the encoding must be one in which a newline is encoded as a
+    single newline byte (e.g., UTF-8, Latin-1), functions given via `types`
+    must be picklable where processes are spawned rather than forked (e.g.,
+    on Windows), and parallel reading is only supported under Python 3.
+
+    If `index` is True, or an integer `n`, the byte offset of every `n`-th
+    row (by default every `petl.config.row_index_interval` rows) of an
+    uncompressed file is stored in a sidecar index file, named as the file
+    with the suffix ``.petlidx``. The index is built the first time it's
+    needed, by reading the file once, and rebuilt whenever the size or
+    modification time of the file changes. It is used by
+    :func:`petl.transform.basics.rowslice`, :func:`petl.transform.basics.tail`
+    and :func:`petl.util.counting.nrows` applied directly to the table, which
+    then seek to the nearest indexed row rather than reading the file from
+    the start. E.g.::
+
+        >>> table5 = etl.fromcsv('example.csv', index=True)
+        >>> table5.nrows()
+        3
+        >>> table5.rowslice(2, 3)
+        +-----+-----+
+        | foo | bar |
+        +=====+=====+
+        | 'c' | '2' |
+        +-----+-----+
+
+    As when reading in parallel, the encoding must be one in which a newline
+    is encoded as a single newline byte, and values must not be escaped other
+    than by quoting. The index isn't used if `infer_types` is given.
 
     """
 
     source = read_source_from_arg(source)
+    if workers and not isinstance(source, FileSource):
+        raise ArgumentError('only uncompressed files can be read in '
+                            'parallel')
     csvargs.setdefault('dialect', 'excel')
-    return fromcsv_impl(source=source, encoding=encoding, errors=errors, 
-                        header=header, **csvargs)
-
-
-def fromtsv(source=None, encoding=None, errors='strict', header=None, 
-            **csvargs):
+    if index:
+        if not isinstance(source, FileSource):
+            raise ArgumentError('only uncompressed files can be indexed')
+        if not newlinebytes(encoding):
+            raise ArgumentError('files can only be indexed where the '
+                                'encoding of a newline is a newline byte, '
+                                'not %r' % encoding)
+        # raises if values may be escaped
+        csvdialect(csvargs)
+    if fields is not None:
+        if isinstance(fields, (list, tuple)):
+            fields = tuple(fields)
+        else:
+            fields = (fields,)
+    return fromcsv_impl(source=source, encoding=encoding, errors=errors,
+                        header=header, types=types, infer_types=infer_types,
+                        fields=fields, workers=workers, chunksize=chunksize,
+                        ordered=ordered, index=index, **csvargs)
+
+
+def fromtsv(source=None, encoding=None, errors='strict', header=None,
+            types=None, infer_types=False, fields=None, workers=None,
+            chunksize=None, ordered=True, index=None, **csvargs):
     """
     Convenience function, as :func:`petl.io.csv.fromcsv` but with different
     default dialect (tab delimited).
@@ -71,7 +175,10 @@ def fromtsv(source=None, encoding=None, errors='strict', header=None,
     """
 
     csvargs.setdefault('dialect', 'excel-tab')
-    return fromcsv(source, encoding=encoding, errors=errors, **csvargs)
+    return fromcsv(source, encoding=encoding, errors=errors, header=header,
+                   types=types, infer_types=infer_types, fields=fields,
+                   workers=workers, chunksize=chunksize, ordered=ordered,
+                   index=index, **csvargs)
 
 
 def tocsv(table, source=None, encoding=None, errors='strict', write_header=True,
@@ -5,11 +5,16 @@ from __future__ import absolute_import, print_function, division
 # standard library dependencies
 import csv
 import cStringIO
+import itertools
+from contextlib import contextmanager
 
 
 # internal dependencies
+from petl.errors import ArgumentError
 from petl.util.base import Table, data
+from petl.util.batches import iterrowbatches
 from petl.io.base import getcodec
+from petl.io.csv_utils import itercsv, itercsvfrom, csvrowindex
 
 
 def fromcsv_impl(source, **kwargs):
@@ -18,16 +23,50 @@ def fromcsv_impl(source, **kwargs):
 
 class CSVView(Table):
 
-    def __init__(self, source=None, encoding=None, errors='strict', header=None, **csvargs):
+    def __init__(self, source=None, encoding=None, errors='strict',
+                 header=None, types=None, infer_types=False, fields=None,
+                 missing=None, complement=False, workers=None, chunksize=None,
+                 ordered=True, index=None, **csvargs):
+            if workers:
+                raise ArgumentError('files can only be read in parallel '
+                                    'under Python 3')
             self.source = source
             self.encoding = encoding
             self.errors = errors
             self.csvargs = csvargs
             self.header = header
+            self.types = types
+            self.infer_types = infer_types
+            self.fields = fields
+            self.missing = missing
+            self.complement = complement
+            self.workers = None
+            self.index = index
 
     def __iter__(self):
-        if self.header is not None:
-          yield tuple(self.header)
+        return itercsv(self._openreader, self.header, self.types,
+                       self.infer_types, self.fields, self.missing,
+                       self.complement)
+
+    def _project(self, spec, missing=None, complement=False):
+        # push down cut() and cutout(), unless already projected
+        if self.fields is not None:
+            return None
+        return CSVView(self.source, self.encoding, self.errors, self.header,
+                       types=self.types, infer_types=self.infer_types,
+                       fields=tuple(spec), missing=missing,
+                       complement=complement, index=self.index,
+                       **self.csvargs)
+
+    def _nrows(self):
+        index = csvrowindex(self)
+        return None if index is None else index.count
+
+    def _iterfrom(self, n):
+        return itercsvfrom(self, n)
+
+    @contextmanager
+    def _openreader(self, offset=None):
 
         # determine encoding
         codec = getcodec(self.encoding)
@@ -36,17 +75,29 @@ class CSVView(Table):
         if codec.name == 'ascii':
             # bypass encoding
             with self.source.open('rU') as csvfile:
-                reader = csv.reader(csvfile, **self.csvargs)
-                for row in reader:
-                    yield tuple(row)
+                if offset:
+                    csvfile.seek(offset)
+                yield csv.reader(csvfile, **self.csvargs)
 
         # non-ascii
         else:
             with self.source.open('rb') as buf:
-                reader = UnicodeReader(buf, encoding=self.encoding,
-                                       errors=self.errors, **self.csvargs)
-                for row in reader:
-                    yield tuple(row)
+                if offset:
+                    buf.seek(offset)
+                yield UnicodeReader(buf, encoding=self.encoding,
+                                    errors=self.errors, **self.csvargs)
+
+    def _iterbatches(self, size, missing):
+        if self.types or self.infer_types or self.fields is not None:
+            return iterrowbatches(self, size, missing)
+        return self._iterreaderbatches(size, missing)
+
+    def _iterreaderbatches(self, size, missing):
+        with self._openreader() as reader:
+            if self.header is not None:
+                reader = itertools.chain([self.header], reader)
+            for batch in iterrowbatches(reader, size, missing):
+                yield batch
 
 
 def tocsv_impl(table, source, **kwargs):
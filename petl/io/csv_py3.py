@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 import io
 import csv
+import itertools
 import logging
+from contextlib import contextmanager
 
 
 from petl.util.base import Table, data
+from petl.util.batches import iterrowbatches
+from petl.io.csv_utils import itercsv, iterparallelcsv, itercsvfrom, \
+    csvrowindex, splittable, SplitReader
 
 
 logger = logging.getLogger(__name__)
@@ -19,26 +24,83 @@ def fromcsv_impl(source, **kwargs):
 
 class CSVView(Table):
 
-    def __init__(self, source, encoding, errors, header, **csvargs):
+    def __init__(self, source, encoding, errors, header, types=None,
+                 infer_types=False, fields=None, missing=None,
+                 complement=False, workers=None, chunksize=None,
+                 ordered=True, index=None, **csvargs):
             self.source = source
             self.encoding = encoding
             self.errors = errors
             self.csvargs = csvargs
             self.header = header
+            self.types = types
+            self.infer_types = infer_types
+            self.fields = fields
+            self.missing = missing
+            self.complement = complement
+            self.workers = workers
+            self.chunksize = chunksize
+            self.ordered = ordered
+            self.index = index
 
     def __iter__(self):
-        if self.header is not None:
-          yield tuple(self.header)
+        if self.workers:
+            return iterparallelcsv(
+                self.source.filename, self.header, self.encoding,
+                self.errors, self.csvargs, self.types, self.infer_types,
+                self.fields, self.missing, self.complement, self.workers,
+                self.chunksize, self.ordered
+            )
+        return itercsv(self._openreader, self.header, self.types,
+                       self.infer_types, self.fields, self.missing,
+                       self.complement)
+
+    def _project(self, spec, missing=None, complement=False):
+        # push down cut() and cutout(), unless already projected
+        if self.fields is not None:
+            return None
+        return CSVView(self.source, self.encoding, self.errors, self.header,
+                       types=self.types, infer_types=self.infer_types,
+                       fields=tuple(spec), missing=missing,
+                       complement=complement, workers=self.workers,
+                       chunksize=self.chunksize, ordered=self.ordered,
+                       index=self.index, **self.csvargs)
+
+    def _nrows(self):
+        index = csvrowindex(self)
+        return None if index is None else index.count
+
+    def _iterfrom(self, n):
+        return itercsvfrom(self, n)
+
+    @contextmanager
+    def _openreader(self, offset=None):
         with self.source.open('rb') as buf:
+            if offset:
+                buf.seek(offset)
             csvfile = io.TextIOWrapper(buf, encoding=self.encoding,
                                        errors=self.errors, newline='')
             try:
-                reader = csv.reader(csvfile, **self.csvargs)
-                for row in reader:
-                    yield tuple(row)
+                if self.fields is not None and splittable(self.csvargs):
+                    yield SplitReader(csvfile, **self.csvargs)
+                else:
+                    yield csv.reader(csvfile, **self.csvargs)
             finally:
                 csvfile.detach()
 
+    def _iterbatches(self, size, missing):
+        if (self.types or self.infer_types or self.fields is not None
+                or self.workers):
+            return iterrowbatches(self, size, missing)
+        return self._iterreaderbatches(size, missing)
+
+    def _iterreaderbatches(self, size, missing):
+        with self._openreader() as reader:
+            if self.header is not None:
+                reader = itertools.chain([self.header], reader)
+            for batch in iterrowbatches(reader, size, missing):
+                yield batch
+
 
 def tocsv_impl(table, source, **kwargs):
     _writecsv(table, source=source, mode='wb', **kwargs)
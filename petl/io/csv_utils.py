@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, division
+
+
+# standard library dependencies
+import io
+import os
+import csv
+import mmap
+import locale
+from itertools import islice, chain
+from contextlib import contextmanager
+from petl.compat import next, text_type, integer_types
+
+
+# internal dependencies
+from petl.errors import FieldSelectionError, ArgumentError
+from petl.util.base import asindices
+from petl.transform.conversions import _rowconverter
+from petl.util.parallel import iterparallel
+from petl.io.rowindex import rowindex, newlinebytes, iterskip
+import petl.config as config
+
+
+def itercsv(openreader, header, types=None, infer_types=False, fields=None,
+            missing=None, complement=False):
+    # iterate over rows from a CSV reader, which is opened by calling
+    # openreader() as a context manager, converting values as given by types
+    # and infer_types, and keeping only the given fields (or all other fields
+    # if complement is true)
+    with openreader() as reader:
+        it = iter(reader)
+        if header is None:
+            try:
+                hdr = tuple(next(it))
+            except StopIteration:
+                # empty file
+                return
+        else:
+            hdr = tuple(header)
+
+        indices = _projection(hdr, fields, complement)
+        if indices is None:
+            yield hdr
+        else:
+            if indices and isinstance(reader, SplitReader):
+                # values after the last projected field aren't needed
+                reader.maxsplit = max(indices) + 1
+            yield tuple(hdr[i] for i in indices)
+
+        typefuns = dict()
+        if infer_types:
+            n = 1000 if infer_types is True else infer_types
+            sample = list(islice(it, n))
+            it = chain(sample, it)
+            typefuns = _infertypes(hdr, indices, sample)
+        typefuns.update(_typefunctions(hdr, types))
+
+        transform = _rowfunction(len(hdr), indices, typefuns, missing)
+        for row in it:
+            yield transform(row)
+
+
+def csvdialect(csvargs):
+    # the dialect of files read with the given arguments, if they can be
+    # indexed
+    dialect = csv.reader([], **csvargs).dialect
+    if dialect.escapechar is not None:
+        raise ArgumentError('files can only be indexed where values are not '
+                            'escaped')
+    return dialect
+
+
+def csvrowindex(view):
+    # the row index of the file read by a CSVView, if it can be used, values
+    # are only converted by inferred types when read from the start
+    if not view.index or view.workers or view.infer_types:
+        return None
+    return rowindex(view.source.filename, view.index,
+                    skip=1 if view.header is None else 0,
+                    dialect=csvdialect(view.csvargs),
+                    encoding=view.encoding)
+
+
+def itercsvfrom(view, n):
+    # iterate over the header then rows from row n of a CSVView, starting from
+    # the nearest indexed row, or return None if the view has no index
+    index = csvrowindex(view)
+    if index is None:
+        return None
+    offset, skip = index.locate(n)
+    hdr = view.header
+    if hdr is None:
+        with view._openreader() as reader:
+            hdr = next(iter(reader), None)
+        if hdr is None:
+            # empty file
+            return iter([])
+
+    @contextmanager
+    def openreader():
+        with view._openreader(offset) as reader:
+            yield reader
+
+    rows = itercsv(openreader, hdr, view.types, False, view.fields,
+                   view.missing, view.complement)
+    return iterskip(rows, skip)
+
+
+def iterparallelcsv(filename, header, encoding, errors, csvargs, types=None,
+                    infer_types=False, fields=None, missing=None,
+                    complement=False, workers=2, chunksize=None, ordered=True):
+    # iterate over rows from an uncompressed CSV file, parsing byte ranges of
+    # the file in worker processes, where ranges are split at newlines, so
+    # values must not contain newlines
+    if chunksize is None:
+        chunksize = config.parallel_csv_chunksize
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    if not newlinebytes(encoding):
+        raise ArgumentError('files can only be read in parallel where the '
+                            'encoding of a newline is a newline byte, not %r'
+                            % encoding)
+
+    with io.open(filename, 'rb') as f:
+        if header is None:
+            line = f.readline()
+            if not line:
+                # empty file
+                return
+            hdr = tuple(next(csv.reader(_textlines(line, encoding, errors),
+                                        **csvargs)))
+            start = f.tell()
+        else:
+            hdr = tuple(header)
+            start = 0
+
+        indices = _projection(hdr, fields, complement)
+        if indices is None:
+            yield hdr
+        else:
+            yield tuple(hdr[i] for i in indices)
+
+        typefuns = dict()
+        if infer_types:
+            n = 1000 if infer_types is True else infer_types
+            f.seek(start)
+            textfile = io.TextIOWrapper(f, encoding=encoding, errors=errors,
+                                        newline='')
+            try:
+                sample = list(islice(csv.reader(textfile, **csvargs), n))
+            finally:
+                textfile.detach()
+            typefuns = _infertypes(hdr, indices, sample)
+        typefuns.update(_typefunctions(hdr, types))
+
+        if os.fstat(f.fileno()).st_size <= start:
+            # no data rows
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            initargs = (filename, encoding, errors, csvargs, len(hdr),
+                        indices, typefuns, missing)
+            for rows in iterparallel(_readcsvrange,
+                                     _byteranges(mm, start, chunksize),
+                                     workers, initializer=_initcsvworker,
+                                     initargs=initargs, ordered=ordered):
+                for row in rows:
+                    yield row
+        finally:
+            mm.close()
+
+
+def _byteranges(mm, start, size):
+    # split the mapped file from start into (start, end) ranges of at least
+    # size bytes, ending after a newline or at the end of the file
+    n = len(mm)
+    while start < n:
+        end = mm.find(b'\n', start + max(size, 1) - 1)
+        end = n if end < 0 else end + 1
+        yield start, end
+        start = end
+
+
+def _textlines(data, encoding, errors):
+    return io.StringIO(data.decode(encoding, errors), newline='')
+
+
+# state of worker processes, see _initcsvworker
+_csvworker = dict()
+
+
+def _initcsvworker(filename, encoding, errors, csvargs, n, indices, typefuns,
+                   missing):
+    _csvworker['file'] = filename, encoding, errors, csvargs
+    _csvworker['transform'] = _rowfunction(n, indices, typefuns, missing)
+    if indices and splittable(csvargs):
+        _csvworker['maxsplit'] = max(indices) + 1
+    else:
+        _csvworker['maxsplit'] = None
+
+
+def _readcsvrange(byterange):
+    filename, encoding, errors, csvargs = _csvworker['file']
+    start, end = byterange
+    with io.open(filename, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    lines = _textlines(data, encoding, errors)
+    maxsplit = _csvworker['maxsplit']
+    if maxsplit is None:
+        reader = csv.reader(lines, **csvargs)
+    else:
+        reader = SplitReader(lines, **csvargs)
+        reader.maxsplit = maxsplit
+    transform = _csvworker['transform']
+    return [transform(row) for row in reader]
+
+
+def _projection(hdr, fields, complement):
+    # indices of the fields to keep, or None if all fields are kept
+    if fields is None:
+        return None
+    indices = asindices(hdr, fields)
+    if complement:
+        indices = [i for i in range(len(hdr)) if i not in indices]
+    return indices
+
+
+def _rowfunction(n, indices, typefuns, missing):
+    # returns a function transforming each data row read from the file
+    if indices is not None:
+        return _projector(indices, typefuns, missing)
+    elif typefuns:
+        return _typeconverter(n, typefuns)
+    else:
+        return tuple
+
+
+def _typefunctions(hdr, types):
+    # map field indices to type functions
+    typefuns = dict()
+    if not types:
+        return typefuns
+    flds = list(map(text_type, hdr))
+    for f, t in types.items():
+        if isinstance(f, integer_types):
+            i = f
+        elif f in flds:
+            i = flds.index(f)
+        else:
+            raise FieldSelectionError(f)
+        if t is not None:
+            typefuns[i] = t
+    return typefuns
+
+
+def _infertypes(hdr, indices, rows):
+    # choose a type for each field from a sample of rows, where all non-empty
+    # values can be converted
+    if indices is None:
+        indices = range(len(hdr))
+    typefuns = dict()
+    for i in indices:
+        values = [row[i] for row in rows if i < len(row) and row[i]]
+        if not values:
+            continue
+        for t in int, float:
+            try:
+                for v in values:
+                    t(v)
+            except ValueError:
+                continue
+            typefuns[i] = t
+            break
+    return typefuns
+
+
+def _typeconverter(n, typefuns):
+    # returns a function converting the values of a row, where values which
+    # can't be converted are left as-is
+    typefuns = dict((i, _lax(t)) for i, t in typefuns.items())
+
+    def convertany(row):
+        return tuple(typefuns[i](v) if i in typefuns else v
+                     for i, v in enumerate(row))
+
+    return _rowconverter(n, typefuns, True, None, False, convertany)
+
+
+def _lax(t):
+    def conv(v):
+        try:
+            return t(v)
+        except Exception:
+            return v
+    return conv
+
+
+def _projector(indices, typefuns, missing):
+    # returns a function selecting the values of a row at the given indices,
+    # converting values as given by typefuns, where values which can't be
+    # converted are left as-is, and short rows are padded with missing
+    typefuns = dict((i, _lax(t)) for i, t in typefuns.items()
+                    if i in indices)
+    namespace = dict()
+    exprs = list()
+    for i in indices:
+        if i in typefuns:
+            name = '_t%d' % i
+            namespace[name] = typefuns[i]
+            exprs.append('%s(row[%d])' % (name, i))
+        else:
+            exprs.append('row[%d]' % i)
+
+    def projectany(row):
+        n = len(row)
+        return tuple((typefuns[i](row[i]) if i in typefuns else row[i])
+                     if i < n else missing
+                     for i in indices)
+
+    namespace['_projectany'] = projectany
+    src = 'lambda row: (%s) if len(row) > %d else _projectany(row)' % (
+        ''.join(e + ', ' for e in exprs), max(indices) if indices else -1
+    )
+    return eval(src, namespace)
+
+
+def splittable(csvargs):
+    """Return True if rows in the given CSV dialect can be read by
+    :class:`SplitReader`, i.e., values are only quoted by the quote
+    character, and are not otherwise escaped, trimmed or converted."""
+
+    try:
+        dialect = csv.reader([], **csvargs).dialect
+    except (TypeError, csv.Error):
+        return False
+    return (dialect.escapechar is None
+            and not dialect.skipinitialspace
+            and dialect.quoting in (csv.QUOTE_MINIMAL, csv.QUOTE_ALL,
+                                    csv.QUOTE_NONE))
+
+
+class SplitReader(object):
+    """Read rows from lines of text by splitting on the delimiter, which is
+    faster than :func:`csv.reader` when few values are needed from long
+    rows. Lines containing the quote character are read by :func:`csv.reader`
+    instead, which also reads any continuation lines of quoted values. If
+    `maxsplit` is set, at most `maxsplit` values are split off the start of
+    each line, and the last value is the remainder of the line."""
+
+    def __init__(self, f, **csvargs):
+        self.f = f
+        self.csvargs = csvargs
+        dialect = csv.reader([], **csvargs).dialect
+        self.delimiter = dialect.delimiter
+        if dialect.quoting == csv.QUOTE_NONE:
+            self.quotechar = None
+        else:
+            self.quotechar = dialect.quotechar
+        self.maxsplit = -1
+
+    def __iter__(self):
+        it = iter(self.f)
+        delimiter = self.delimiter
+        quotechar = self.quotechar
+        for line in it:
+            if quotechar is not None and quotechar in line:
+                reader = csv.reader(chain([line], it), **self.csvargs)
+                yield next(reader)
+                continue
+            line = line.rstrip('\r\n')
+            if line:
+                yield line.split(delimiter, self.maxsplit)
+            else:
+                # as csv.reader
+                yield []
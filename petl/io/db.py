@@ -10,6 +10,8 @@ from petl.compat import next, text_type, string_types
 # internal dependencies
 from petl.errors import ArgumentError
 from petl.util.base import Table
+from petl.util.batches import iterbatches, iterrowbatches, batchrows, \
+    batchcolumns
 from petl.io.db_utils import _is_dbapi_connection, _is_dbapi_cursor, \
     _is_sqlalchemy_connection, _is_sqlalchemy_engine, _is_sqlalchemy_session, \
     _quote, _placeholders
@@ -91,6 +93,10 @@ def fromdb(dbo, query, *args, **kwargs):
 
 class DbView(Table):
 
+    # rows always have the same length as the header, see
+    # petl.util.batches.fixedrows()
+    _fixedrows = True
+
     def __init__(self, dbo, query, *args, **kwargs):
         self.dbo = dbo
         self.query = query
@@ -140,6 +146,13 @@ class DbView(Table):
 
         return _iter(self.dbo, self.query, *self.args, **self.kwargs)
 
+    def _iterbatches(self, size, missing):
+        if _is_dbapi_connection(self.dbo):
+            return _iterbatches_dbapi_connection(self.dbo, size, missing,
+                                                 self.query, *self.args,
+                                                 **self.kwargs)
+        return iterrowbatches(self, size, missing)
+
 
 def _iter_dbapi_mkcurs(mkcurs, query, *args, **kwargs):
     cursor = mkcurs()
@@ -178,6 +191,22 @@ def _iter_dbapi_cursor(cursor, query, *args, **kwargs):
         yield row  # don't wrap, return whatever the database engine returns
 
 
+def _iterbatches_dbapi_connection(connection, size, missing, query, *args,
+                                  **kwargs):
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query, *args, **kwargs)
+        # fetch rows before getting fields, see _iter_dbapi_cursor
+        rows = cursor.fetchmany(size)
+        hdr = tuple(d[0] for d in cursor.description)
+        yield hdr
+        while rows:
+            yield batchcolumns(rows, len(hdr), missing)
+            rows = cursor.fetchmany(size)
+    finally:
+        cursor.close()
+
+
 def _iter_sqlalchemy_engine(engine, query, *args, **kwargs):
     return _iter_sqlalchemy_connection(engine.contextual_connect(), query,
                                        *args, **kwargs)
@@ -404,8 +433,8 @@ def _todb_dbapi_connection(table, connection, tablename, schema=None,
     debug('tablename: %r', tablename)
 
     # sanitise field names
-    it = iter(table)
-    hdr = next(it)
+    batches = iterbatches(table, strict=True)
+    hdr = next(batches)
     flds = list(map(text_type, hdr))
     colnames = [_quote(n) for n in flds]
     debug('column names: %r', colnames)
@@ -430,7 +459,8 @@ def _todb_dbapi_connection(table, connection, tablename, schema=None,
     insertcolnames = ', '.join(colnames)
     insertquery = SQL_INSERT_QUERY % (tablename, insertcolnames, placeholders)
     debug('insert data via query %r' % insertquery)
-    cursor.executemany(insertquery, it)
+    for cols in batches:
+        cursor.executemany(insertquery, batchrows(cols))
 
     # finish up
     debug('close the cursor')
@@ -451,8 +481,8 @@ def _todb_dbapi_mkcurs(table, mkcurs, tablename, schema=None, commit=True,
     debug('tablename: %r', tablename)
 
     # sanitise field names
-    it = iter(table)
-    hdr = next(it)
+    batches = iterbatches(table, strict=True)
+    hdr = next(batches)
     flds = list(map(text_type, hdr))
     colnames = [_quote(n) for n in flds]
     debug('column names: %r', colnames)
@@ -481,7 +511,8 @@ def _todb_dbapi_mkcurs(table, mkcurs, tablename, schema=None, commit=True,
     insertcolnames = ', '.join(colnames)
     insertquery = SQL_INSERT_QUERY % (tablename, insertcolnames, placeholders)
     debug('insert data via query %r' % insertquery)
-    cursor.executemany(insertquery, it)
+    for cols in batches:
+        cursor.executemany(insertquery, batchrows(cols))
     cursor.close()
 
     if commit:
@@ -499,8 +530,8 @@ def _todb_dbapi_cursor(table, cursor, tablename, schema=None, commit=True,
     debug('tablename: %r', tablename)
 
     # sanitise field names
-    it = iter(table)
-    hdr = next(it)
+    batches = iterbatches(table, strict=True)
+    hdr = next(batches)
     flds = list(map(text_type, hdr))
     colnames = [_quote(n) for n in flds]
     debug('column names: %r', colnames)
@@ -525,7 +556,8 @@ def _todb_dbapi_cursor(table, cursor, tablename, schema=None, commit=True,
     insertcolnames = ', '.join(colnames)
     insertquery = SQL_INSERT_QUERY % (tablename, insertcolnames, placeholders)
     debug('insert data via query %r' % insertquery)
-    cursor.executemany(insertquery, it)
+    for cols in batches:
+        cursor.executemany(insertquery, batchrows(cols))
 
     # N.B., don't close the cursor, leave that to the application
 
@@ -2,9 +2,13 @@
 from __future__ import division, print_function, absolute_import
 
 
+from itertools import islice, chain
+
+
 from petl.compat import next, string_types
 from petl.util.base import iterpeek, ValuesView, Table
 from petl.util.materialise import columns
+from petl.util.batches import iterbatches, batchrows
 
 
 def infer_dtype(table):
@@ -81,18 +85,50 @@ def toarray(table, dtype=None, count=-1, sample=1000):
     If the dtype is not completely specified, `sample` rows will be
     examined to infer an appropriate dtype.
 
+    The table is loaded in column-oriented batches, see
+    :func:`petl.util.batches.iterbatches`. A :class:`ValueError` is raised if
+    any row is shorter or longer than the header.
+
     """
     
     import numpy as np
-    it = iter(table)
-    peek, it = iterpeek(it, sample)
-    hdr = next(it)
+    batches = iterbatches(table, strict=True)
+    hdr = next(batches)
     flds = list(map(str, hdr))
-    dtype = construct_dtype(flds, peek, dtype)
 
-    # numpy is fussy about having tuples, need to make sure
-    it = (tuple(row) for row in it)
-    sa = np.fromiter(it, dtype=dtype, count=count)
+    # peek at the first batches to sample rows, then reuse them, so the table
+    # is only read once
+    head = list()
+    n = 0
+    for cols in batches:
+        head.append(cols)
+        n += len(cols[0]) if cols else 0
+        if n >= sample:
+            break
+    peek = [hdr]
+    peek.extend(islice((row for cols in head for row in batchrows(cols)),
+                       sample))
+    dtype = np.dtype(construct_dtype(flds, peek, dtype))
+
+    # fill arrays a batch at a time, one column at a time
+    chunks = list()
+    n = 0
+    for cols in chain(head, batches):
+        if 0 <= count <= n:
+            break
+        chunk = np.empty(len(cols[0]), dtype=dtype)
+        for name, col in zip(dtype.names, cols):
+            chunk[name] = col
+        chunks.append(chunk)
+        n += len(chunk)
+    if 0 <= count:
+        if n < count:
+            raise ValueError('iterator too short')
+        if chunks:
+            chunks[-1] = chunks[-1][:len(chunks[-1]) - (n - count)]
+    if not chunks:
+        return np.empty(0, dtype=dtype)
+    sa = np.concatenate(chunks)
 
     return sa
 
@@ -142,6 +178,10 @@ def fromarray(a):
 
 
 class ArrayView(Table):
+
+    # rows always have the same length as the header, see
+    # petl.util.batches.fixedrows()
+    _fixedrows = True
     
     def __init__(self, a):
         self.a = a
@@ -151,6 +191,13 @@ class ArrayView(Table):
         for row in self.a:
             yield tuple(row)
 
+    def _iterbatches(self, size, missing):
+        names = self.a.dtype.names
+        yield tuple(names)
+        for i in range(0, len(self.a), size):
+            chunk = self.a[i:i + size]
+            yield [chunk[n].tolist() for n in names]
+
 
 def valuestoarray(vals, dtype=None, count=-1, sample=1000):
     """
@@ -5,7 +5,9 @@ from __future__ import division, print_function, absolute_import
 import inspect
 
 
+from petl.compat import OrderedDict, next
 from petl.util.base import Table
+from petl.util.batches import iterbatches, fixedrows
 
 
 def todataframe(table, index=None, exclude=None, columns=None,
@@ -26,8 +28,27 @@ def todataframe(table, index=None, exclude=None, columns=None,
         1  oranges    3  4.4
         2    pears    7  0.1
 
+    If the rows of the table always have the same length as its header
+    (see :func:`petl.util.batches.fixedrows`), and none of `index`,
+    `exclude`, `coerce_float` or `nrows` are given, the table is loaded in
+    column-oriented batches, see :func:`petl.util.batches.iterbatches`.
+
     """
     import pandas as pd
+    if fixedrows(table) and index is None and exclude is None \
+            and not coerce_float and nrows is None:
+        batches = iterbatches(table, strict=True)
+        hdr = next(batches)
+        cols = [list() for _ in hdr]
+        for batch in batches:
+            for col, values in zip(cols, batch):
+                col.extend(values)
+        if columns is None:
+            columns = hdr
+        # N.B., key columns by position in case of duplicate field names
+        df = pd.DataFrame(OrderedDict(enumerate(cols)))
+        df.columns = list(columns)
+        return df
     l = list(table)
     data = l[1:]
     if columns is None:
@@ -69,6 +90,10 @@ def fromdataframe(df, include_index=False):
 
 class DataFrameView(Table):
 
+    # rows always have the same length as the header, see
+    # petl.util.batches.fixedrows()
+    _fixedrows = True
+
     def __init__(self, df, include_index=False):
         assert hasattr(df, 'columns') \
             and hasattr(df, 'iterrows') \
@@ -86,3 +111,16 @@ class DataFrameView(Table):
             yield tuple(self.df.columns)
             for _, row in self.df.iterrows():
                 yield tuple(row)
+
+    def _iterbatches(self, size, missing):
+        df = self.df
+        if self.include_index:
+            yield ('index',) + tuple(df.columns)
+        else:
+            yield tuple(df.columns)
+        for i in range(0, len(df), size):
+            chunk = df.iloc[i:i + size]
+            cols = [chunk.iloc[:, j].tolist() for j in range(len(df.columns))]
+            if self.include_index:
+                cols.insert(0, chunk.index.tolist())
+            yield cols
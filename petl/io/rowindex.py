@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, division
+
+
+# standard library dependencies
+import io
+import os
+import csv
+import json
+import locale
+import logging
+from itertools import islice
+
+
+# internal dependencies
+from petl.compat import next, text_type
+import petl.config as config
+
+
+logger = logging.getLogger(__name__)
+warning = logger.warning
+
+
+def newlinebytes(encoding):
+    """Return True if a newline is encoded as a single newline byte in the
+    given encoding, so lines of a file can be found without decoding it."""
+
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    return u'\n\n'.encode(encoding).endswith(b'\n\n')
+
+
+class RowIndex(object):
+    """Byte offsets of every `interval`-th row of a file of `size` bytes,
+    where `count` is the number of rows, and `offsets[k]` is the offset of
+    row ``k * interval``, counting rows from zero after skipping any header
+    rows."""
+
+    def __init__(self, interval, count, offsets, size):
+        self.interval = interval
+        self.count = count
+        self.offsets = offsets
+        self.size = size
+
+    def locate(self, n):
+        """Return the offset of the last indexed row at or before row `n`, and
+        the number of rows to skip from there to reach row `n`."""
+
+        if n >= self.count:
+            # past the end of the file
+            return self.size, 0
+        k = n // self.interval
+        return self.offsets[k], n - k * self.interval
+
+    def __repr__(self):
+        return 'RowIndex(interval=%r, count=%r)' % (self.interval, self.count)
+
+
+def indexpath(filename):
+    """Path of the sidecar index file for the given file."""
+
+    return filename + '.petlidx'
+
+
+def rowindex(filename, interval=None, skip=0, dialect=None, encoding=None):
+    """Return a :class:`RowIndex` for the given file, loaded from the sidecar
+    index file if one exists which matches the size and modification time of
+    the file, otherwise built by reading the file once and then saved.
+
+    Rows are lines ending with a newline, except that if a csv `dialect` is
+    given, newlines inside quoted values don't end a row, values being quoted
+    as read by the :mod:`csv` module, i.e., only if the quote character
+    starts a field. The first `skip` rows (e.g., a header) are not counted. If
+    `interval` is not given, `petl.config.row_index_interval` is used.
+
+    """
+
+    if interval is None or interval is True:
+        interval = config.row_index_interval
+    quoting = None
+    if dialect is not None and dialect.quoting != csv.QUOTE_NONE:
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+        quoting = (dialect.quotechar.encode(encoding)[-1:],
+                   dialect.delimiter.encode(encoding)[-1:],
+                   bool(dialect.doublequote),
+                   bool(dialect.skipinitialspace))
+    st = os.stat(filename)
+    meta = dict(size=st.st_size, mtime=st.st_mtime, interval=interval,
+                skip=skip,
+                quoting=None if quoting is None else
+                [ord(quoting[0]), ord(quoting[1]), quoting[2], quoting[3]])
+    path = indexpath(filename)
+
+    # try the sidecar file
+    try:
+        with io.open(path, 'r') as f:
+            saved = json.load(f)
+    except (IOError, OSError, ValueError):
+        saved = None
+    if saved is not None and all(saved.get(k) == v for k, v in meta.items()):
+        return RowIndex(interval, saved['count'], saved['offsets'],
+                        st.st_size)
+
+    # build and save
+    with io.open(filename, 'rb') as f:
+        count, offsets = _buildindex(f, interval, skip, quoting)
+    meta['count'] = count
+    meta['offsets'] = offsets
+    try:
+        with io.open(path, 'w') as f:
+            f.write(text_type(json.dumps(meta, sort_keys=True)))
+    except (IOError, OSError) as e:
+        warning('could not save row index %r: %s', path, e)
+    return RowIndex(interval, count, offsets, st.st_size)
+
+
+def _buildindex(f, interval, skip, quoting):
+    # count rows and record the offset of every interval-th row, where a row
+    # starts at each line which doesn't continue a quoted value
+    offsets = list()
+    n = -skip
+    pos = 0
+    quoted = False
+    for line in f:
+        if not quoted:
+            if n >= 0 and n % interval == 0:
+                offsets.append(pos)
+            n += 1
+        if quoting is not None and quoting[0] in line:
+            quoted = _endquoted(line, quoted, *quoting)
+        pos += len(line)
+    return max(n, 0), offsets
+
+
+def _endquoted(line, quoted, quotechar, delimiter, doublequote,
+               skipinitialspace):
+    # whether the line ends inside a quoted value, given whether it starts
+    # inside one, where as in the csv module a quote opens a quoted value only
+    # at the start of a field, and otherwise closes it unless doubled
+    i = line.find(quotechar)
+    while i >= 0:
+        if quoted:
+            if doublequote and line[i + 1:i + 2] == quotechar:
+                i += 1
+            else:
+                quoted = False
+        else:
+            j = i
+            if skipinitialspace:
+                while j and line[j - 1:j] == b' ':
+                    j -= 1
+            quoted = j == 0 or line[j - 1:j] == delimiter
+        i = line.find(quotechar, i + 1)
+    return quoted
+
+
+def iterskip(rows, n):
+    """Yield the first row of `rows` (i.e., the header) then all rows after
+    the next `n` rows."""
+
+    it = iter(rows)
+    try:
+        yield next(it)
+    except StopIteration:
+        return
+    for row in islice(it, n, None):
+        yield row
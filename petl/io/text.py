@@ -10,11 +10,14 @@ from petl.compat import next, PY2, text_type
 # internal dependencies
 from petl.util.base import Table, asdict
 from petl.io.base import getcodec
-from petl.io.sources import read_source_from_arg, write_source_from_arg
+from petl.errors import ArgumentError
+from petl.io.sources import read_source_from_arg, write_source_from_arg, \
+    FileSource
+from petl.io.rowindex import rowindex, newlinebytes, iterskip
 
 
 def fromtext(source=None, encoding=None, errors='strict', strip=None,
-             header=('lines',)):
+             header=('lines',), index=None):
     """
     Extract a table from lines in the given text file. E.g.::
 
@@ -56,49 +59,96 @@ def fromtext(source=None, encoding=None, errors='strict', strip=None,
     characters to strip. Set the `strip` argument to `False` to disable this
     behaviour and leave line endings in place.
 
+    If `index` is True, or an integer, a sidecar index of line offsets is
+    used to seek directly to lines, as for the `index` argument to
+    :func:`petl.io.csv.fromcsv`.
+
     """
 
     source = read_source_from_arg(source)
+    if index:
+        if not isinstance(source, FileSource):
+            raise ArgumentError('only uncompressed files can be indexed')
+        if not newlinebytes(encoding):
+            raise ArgumentError('files can only be indexed where the '
+                                'encoding of a newline is a newline byte, '
+                                'not %r' % encoding)
     return TextView(source, header=header, encoding=encoding,
-                    errors=errors, strip=strip)
+                    errors=errors, strip=strip, index=index)
 
 
 class TextView(Table):
 
     def __init__(self, source, header=('lines',), encoding=None,
-                 errors='strict', strip=None):
+                 errors='strict', strip=None, index=None):
         self.source = source
         self.header = header
         self.encoding = encoding
         self.errors = errors
         self.strip = strip
+        self.index = index
 
     def __iter__(self):
-        with self.source.open('rb') as buf:
+        return itertext(self.source, self.header, self.encoding, self.errors,
+                        self.strip)
+
+    def _rowindex(self):
+        if not self.index:
+            return None
+        return rowindex(self.source.filename, self.index,
+                        skip=1 if self.header is None else 0,
+                        encoding=self.encoding)
+
+    def _nrows(self):
+        index = self._rowindex()
+        return None if index is None else index.count
+
+    def _iterfrom(self, n):
+        index = self._rowindex()
+        if index is None:
+            return None
+        offset, skip = index.locate(n)
+        hdr = self.header
+        if hdr is None:
+            # the first line
+            it = iter(self)
+            hdr = next(it, None)
+            it.close()
+            if hdr is None:
+                return iter([])
+        rows = itertext(self.source, hdr, self.encoding, self.errors,
+                        self.strip, offset)
+        return iterskip(rows, skip)
+
+
+def itertext(source, header, encoding, errors, strip, offset=None):
+    with source.open('rb') as buf:
+        if offset:
+            buf.seek(offset)
+
+        # deal with text encoding
+        if PY2:
+            codec = getcodec(encoding)
+            f = codec.streamreader(buf, errors=errors)
+        else:
+            f = io.TextIOWrapper(buf,
+                                 encoding=encoding,
+                                 errors=errors,
+                                 newline='')
 
-            # deal with text encoding
-            if PY2:
-                codec = getcodec(self.encoding)
-                f = codec.streamreader(buf, errors=self.errors)
+        # generate the table
+        try:
+            if header is not None:
+                yield tuple(header)
+            if strip is False:
+                for line in f:
+                    yield (line,)
             else:
-                f = io.TextIOWrapper(buf,
-                                     encoding=self.encoding,
-                                     errors=self.errors,
-                                     newline='')
-
-            # generate the table
-            try:
-                if self.header is not None:
-                    yield tuple(self.header)
-                if self.strip is False:
-                    for line in f:
-                        yield (line,)
-                else:
-                    for line in f:
-                        yield (line.strip(self.strip),)
-            finally:
-                if not PY2:
-                    f.detach()
+                for line in f:
+                    yield (line.strip(strip),)
+        finally:
+            if not PY2:
+                f.detach()
 
 
 def totext(table, source=None, encoding=None, errors='strict', template=None,
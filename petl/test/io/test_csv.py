@@ -10,7 +10,10 @@ from petl.compat import PY2
 
 
 from petl.test.helpers import ieq, eq_
+from petl.errors import ArgumentError
 from petl.io.csv import fromcsv, fromtsv, tocsv, appendcsv, totsv, appendtsv
+from petl.util.base import header, data
+from petl.util.batches import iterbatches
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +40,31 @@ def test_fromcsv():
     ieq(expect, actual)  # verify can iterate twice
 
 
+def test_fromcsv_batches():
+
+    data = [b'foo,bar',
+            b'a,1',
+            b'b',
+            b'c,2,x']
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.write(b'\n'.join(data))
+    f.close()
+
+    expect = [('foo', 'bar'),
+              [['a', 'b'], ['1', None]],
+              [['c'], ['2']]]
+    eq_(expect, list(iterbatches(fromcsv(f.name, encoding='ascii'), 2)))
+    eq_(expect, list(iterbatches(fromcsv(f.name), 2)))
+    expect = [('x', 'y'),
+              [['foo', 'a', 'b', 'c'], ['bar', '1', '', '2']]]
+    eq_(expect, list(iterbatches(fromcsv(f.name, header=['x', 'y']),
+                                 missing='')))
+
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.close()
+    eq_([], list(iterbatches(fromcsv(f.name))))
+
+
 def test_fromcsv_lineterminators():
 
     data = [b'foo,bar',
@@ -308,4 +336,211 @@ def test_fromcsv_header():
     actual = fromcsv(f.name, encoding='ascii', header=header)
     debug(actual)
     ieq(expect, actual)
-    ieq(expect, actual)  # verify can iterate twice
\ No newline at end of file
+    ieq(expect, actual)  # verify can iterate twice
+
+
+def test_fromcsv_types():
+
+    data = [b'foo,bar,baz,quux',
+            b'a,1,2.5,x',
+            b'b,,3,y',
+            b'c,2',
+            b'd,3,4,z,extra',
+            b'e,x,5,1']
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.write(b'\n'.join(data))
+    f.close()
+
+    expect = (('foo', 'bar', 'baz', 'quux'),
+              ('a', 1, 2.5, 'x'),
+              ('b', '', 3.0, 'y'),
+              ('c', 2),
+              ('d', 3, 4.0, 'z', 'extra'),
+              ('e', 'x', 5.0, '1'))
+    actual = fromcsv(f.name, encoding='ascii', types={'bar': int, 2: float})
+    ieq(expect, actual)
+    ieq(expect, actual)  # verify can iterate twice
+
+    # inferred from the first 4 rows, 'x' is left as-is
+    actual = fromcsv(f.name, encoding='ascii', infer_types=4)
+    expect = (('foo', 'bar', 'baz', 'quux'),
+              ('a', 1, 2.5, 'x'),
+              ('b', '', 3.0, 'y'),
+              ('c', 2),
+              ('d', 3, 4.0, 'z', 'extra'),
+              ('e', 'x', 5.0, '1'))
+    ieq(expect, actual)
+    ieq(iterbatches(actual), iterbatches(expect))
+
+    # explicit types take precedence
+    actual = fromtsv(f.name, encoding='ascii', infer_types=True,
+                     types={'bar': str}, delimiter=',')
+    ieq(['1', '', '2', '3', 'x'], actual.values('bar'))
+    ieq([2.5, 3.0, None, 4.0, 5.0], actual.values('baz'))
+
+
+def test_fromcsv_fields():
+
+    data = [b'foo,bar,baz,quux',
+            b'a,1,2.5,x',
+            b'b,"2,2",3,"y',
+            b'y"',
+            b'',
+            b'c,2',
+            b'd,3,4,z,extra']
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.write(b'\r\n'.join(data))
+    f.close()
+
+    expect = (('baz', 'bar'),
+              ('2.5', '1'),
+              ('3', '2,2'),
+              (None, None),
+              (None, '2'),
+              ('4', '3'))
+    actual = fromcsv(f.name, encoding='ascii', fields=['baz', 'bar'])
+    ieq(expect, actual)
+    ieq(expect, actual)  # verify can iterate twice
+    ieq(iterbatches(expect), iterbatches(actual))
+
+    # pushed down from cut and cutout
+    table = fromcsv(f.name, encoding='ascii')
+    actual = table.cut('baz', 1)
+    assert actual.fields == ('baz', 1)
+    ieq(expect, actual)
+    actual = table.cut('baz', missing='NA')
+    ieq(['2.5', '3', 'NA', 'NA', '4'], actual.values('baz'))
+    actual = table.cutout('foo', 'quux')
+    ieq((('bar', 'baz'),
+         ('1', '2.5'),
+         ('2,2', '3'),
+         (None, None),
+         ('2', None),
+         ('3', '4')), actual)
+
+    # types are applied to projected fields only
+    expect = (('quux', 'bar'),
+              ('x', 1),
+              ('y\r\ny', '2,2'),
+              (None, None),
+              (None, 2),
+              ('z', 3))
+    actual = fromcsv(f.name, encoding='ascii', fields=('quux', 'bar'),
+                     types={'bar': int, 'baz': float})
+    ieq(expect, actual)
+    actual = fromcsv(f.name, encoding='ascii', infer_types=True,
+                     fields='quux')
+    ieq(('x', 'y\r\ny', None, None, 'z'), actual.values('quux'))
+
+
+def test_fromcsv_workers():
+
+    lines = [b'foo,bar,baz']
+    lines.extend(('%s,%s,"%s"' % (chr(97 + i % 26), i, i * 2)).encode('ascii')
+                for i in range(100))
+    lines.append(b'short')
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.write(b'\r\n'.join(lines) + b'\r\n')
+    f.close()
+
+    expect = fromcsv(f.name, encoding='ascii')
+    actual = fromcsv(f.name, encoding='ascii', workers=2, chunksize=64)
+    ieq(expect, actual)
+    ieq(expect, actual)  # verify can iterate twice
+    ieq(iterbatches(expect), iterbatches(actual))
+    actual = fromcsv(f.name, encoding='ascii', workers=2, chunksize=64,
+                     ordered=False)
+    eq_(header(expect), header(actual))
+    eq_(sorted(data(expect)), sorted(data(actual)))
+
+    # types, fields and header are applied as when reading sequentially
+    for kwargs in (dict(types={'bar': int}),
+                   dict(infer_types=10, fields=['baz', 'foo']),
+                   dict(header=['x', 'y', 'z'], types={1: float})):
+        expect = fromcsv(f.name, encoding='ascii', **kwargs)
+        actual = fromcsv(f.name, encoding='ascii', workers=2, chunksize=100,
+                         **kwargs)
+        ieq(expect, actual)
+    actual = fromcsv(f.name, encoding='ascii', workers=2).cutout('bar')
+    ieq(fromcsv(f.name, encoding='ascii').cutout('bar'), actual)
+
+    # empty file
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.close()
+    ieq([], fromcsv(f.name, workers=2))
+    ieq([('foo',)], fromcsv(f.name, header=['foo'], workers=2))
+
+
+def test_fromcsv_workers_compressed():
+
+    try:
+        fromcsv('example.csv.gz', workers=2)
+    except ArgumentError:
+        pass
+    else:
+        assert False, 'exception expected'
+
+
+def test_fromcsv_index():
+
+    lines = [b'foo,bar']
+    lines.extend(('%s,%s' % (chr(97 + i % 26), i)).encode('ascii')
+                 for i in range(30))
+    lines[5] = b'e,"4\r\n4"'
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.write(b'\r\n'.join(lines))
+    f.close()
+
+    expect = fromcsv(f.name, encoding='ascii')
+    actual = fromcsv(f.name, encoding='ascii', index=4)
+    ieq(expect, actual)
+    eq_(30, actual.nrows())
+    assert os.path.exists(f.name + '.petlidx')
+    for sliceargs in ((3, 9), (4, None), (9, 10), (29, 40), (35, 40),
+                      (2, 20, 3), (5,)):
+        ieq(expect.rowslice(*sliceargs), actual.rowslice(*sliceargs))
+    ieq(expect.tail(7), actual.tail(7))
+    ieq(expect.tail(40), actual.tail(40))
+    for sliceargs in ((-1, 3), (2, -1), (2, 5, 0)):
+        try:
+            list(actual.rowslice(*sliceargs))
+        except ValueError:
+            pass  # expected, as without an index
+        else:
+            assert False, 'exception expected'
+
+    # header, types and projection
+    kwargs = dict(header=['x', 'y'], types={'y': int}, fields=['y'])
+    expect = fromcsv(f.name, encoding='ascii', **kwargs)
+    actual = fromcsv(f.name, encoding='ascii', index=True, **kwargs)
+    eq_(31, actual.nrows())
+    ieq(expect.rowslice(5, 8), actual.rowslice(5, 8))
+    ieq(expect.tail(3), actual.tail(3))
+    ieq(fromcsv(f.name, encoding='ascii').cut('bar').tail(3),
+        fromcsv(f.name, encoding='ascii', index=True).cut('bar').tail(3))
+
+    try:
+        fromcsv('example.csv.gz', index=True)
+    except ArgumentError:
+        pass
+    else:
+        assert False, 'exception expected'
+
+
+def test_fromcsv_index_quotes():
+
+    # quotes inside unquoted values don't start quoted values
+    lines = [b'foo,bar']
+    lines.extend(('%s,%s"inch' % (chr(97 + i % 26), i)).encode('ascii')
+                 for i in range(25))
+    lines[7] = b'g,"6\n6"" ""x"'
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.write(b'\n'.join(lines))
+    f.close()
+
+    expect = fromcsv(f.name, encoding='ascii')
+    actual = fromcsv(f.name, encoding='ascii', index=4)
+    eq_(25, actual.nrows())
+    for sliceargs in ((3, 9), (6, 8), (20, None), (24, 30)):
+        ieq(expect.rowslice(*sliceargs), actual.rowslice(*sliceargs))
+    ieq(expect.tail(5), actual.tail(5))
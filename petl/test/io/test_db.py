@@ -9,6 +9,7 @@ from petl.compat import next
 
 from petl.test.helpers import ieq, eq_
 from petl.io.db import fromdb, todb, appenddb
+from petl.util.batches import iterbatches
 
 
 # N.B., this file only tests the DB-related functions using sqlite3,
@@ -49,6 +50,29 @@ def test_fromdb():
     eq_(('b', 2), next(i1))
 
 
+def test_fromdb_batches():
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute('create table foobar (foo, bar)')
+    table = fromdb(connection, 'select * from foobar')
+    eq_([('foo', 'bar')], list(iterbatches(table, 2)))
+
+    rows = [('a', 1), ('b', 2), ('c', 2.0)]
+    connection.executemany('insert into foobar values (?, ?)', rows)
+    expect = [('foo', 'bar'),
+              [['a', 'b'], [1, 2]],
+              [['c'], [2.0]]]
+    eq_(expect, list(iterbatches(table, 2)))
+
+    # batches are written to the database
+    table = (('foo', 'bar'),
+             ('d', 7),
+             ('e', 9))
+    appenddb(table, connection, 'foobar')
+    actual = connection.execute('select * from foobar')
+    ieq(rows + [('d', 7), ('e', 9)], actual)
+
+
 def test_fromdb_mkcursor():
 
     # initial data
@@ -148,6 +172,24 @@ def test_todb_appenddb():
     ieq(expect, actual)
 
 
+def test_todb_row_lengths():
+
+    f = NamedTemporaryFile(delete=False)
+    conn = sqlite3.connect(f.name)
+    conn.execute('create table foobar (foo, bar)')
+    conn.commit()
+
+    # rows must not be silently padded or truncated
+    for table in ((('foo', 'bar'), ('a', 1), ('b',)),
+                  (('foo', 'bar'), ('a', 1), ('b', 2, True))):
+        try:
+            todb(table, conn, 'foobar')
+        except ValueError:
+            pass  # expected
+        else:
+            assert False, 'expected exception'
+
+
 def test_todb_appenddb_cursor():
 
     f = NamedTemporaryFile(delete=False)
@@ -57,6 +57,67 @@ else:
         assert_almost_equal(4.4, a['baz'][1], places=6)
         assert_almost_equal(.1, a['baz'][2], places=6)
 
+    def test_toarray_batches():
+        t = [('foo', 'bar', 'baz'),
+             ('apples', 1, 2.5),
+             ('oranges', 3, 4.4),
+             ('pears', 7, .1)]
+        for size in 1, 2, 100:
+            etl.config.batch_size, batch_size = size, etl.config.batch_size
+            try:
+                a = toarray(t, dtype='U7, i4, f8')
+                eq_(['apples', 'oranges', 'pears'], list(a['foo']))
+                eq_([1, 3, 7], list(a['bar']))
+                a = toarray(t, count=2)
+                eq_(2, len(a))
+                eq_([1, 3], list(a['bar']))
+                a = toarray(t, count=0)
+                eq_(0, len(a))
+                eq_(('foo', 'bar', 'baz'), a.dtype.names)
+                a = toarray(t[:1], dtype='U7, i4, f8')
+                eq_(0, len(a))
+            finally:
+                etl.config.batch_size = batch_size
+
+    def test_toarray_row_lengths():
+        for t in ([('foo', 'bar'), ('apples', 1), ('oranges',)],
+                  [('foo', 'bar'), ('apples', 1), ('oranges', 3, True)]):
+            try:
+                toarray(t, dtype='U7, i4')
+            except ValueError:
+                pass  # expected
+            else:
+                assert False, 'expected exception'
+
+    def test_toarray_reads_once():
+
+        class OneShot(etl.Table):
+            def __init__(self, rows):
+                self.rows = iter(rows)
+
+            def __iter__(self):
+                return self.rows
+
+        t = [('foo', 'bar'),
+             ('apples', 1),
+             ('oranges', 3),
+             ('pears', 7)]
+        a = toarray(OneShot(t), sample=2)
+        eq_(['apples', 'oranges', 'pears'], list(a['foo']))
+        eq_([1, 3, 7], list(a['bar']))
+
+    def test_fromarray_batches():
+        t = [('foo', 'bar', 'baz'),
+             ('apples', 1, 2.5),
+             ('oranges', 3, 4.4),
+             ('pears', 7, .1)]
+        a = np.array(t[1:], dtype='U8, i4, f8')
+        a.dtype.names = t[0]
+        eq_([t[0],
+             [['apples', 'oranges'], [1, 3], [2.5, 4.4]],
+             [['pears'], [7], [.1]]],
+            list(etl.iterbatches(fromarray(a), 2)))
+
     def test_torecarray():
         t = [('foo', 'bar', 'baz'),
              ('apples', 1, 2.5),
@@ -6,7 +6,7 @@ import sys
 
 
 import petl as etl
-from petl.test.helpers import ieq
+from petl.test.helpers import ieq, eq_
 from petl.io.pandas import todataframe, fromdataframe
 
 
@@ -36,6 +36,46 @@ else:
         ieq(tbl, fromdataframe(df))
         ieq(tbl, fromdataframe(df))
 
+    def test_todataframe_batches():
+        tbl = [('foo', 'bar', 'baz'),
+               ('apples', 1, 2.5),
+               ('oranges', 3, 4.4),
+               ('pears', 7, .1)]
+        expect = pd.DataFrame.from_records(tbl[1:], columns=['a', 'b', 'c'])
+        actual = todataframe(etl.cut(tbl, 'foo', 'bar', 'baz'),
+                             columns=['a', 'b', 'c'])
+        assert expect.equals(actual)
+
+    def test_todataframe_short_rows():
+        tbl = [('foo', 'bar', 'baz'),
+               ('apples', 1, 2.5),
+               ('oranges', 3)]
+        expect = pd.DataFrame.from_records(tbl[1:], columns=tbl[0])
+        assert expect.equals(todataframe(tbl))
+        tbl.append(('pears', 7, .1, True))
+        try:
+            todataframe(tbl)
+        except ValueError:
+            pass  # expected
+        else:
+            assert False, 'expected exception'
+
+    def test_fromdataframe_batches():
+        tbl = [('foo', 'bar', 'baz'),
+               ('apples', 1, 2.5),
+               ('oranges', 3, 4.4),
+               ('pears', 7, .1)]
+        df = pd.DataFrame.from_records(tbl[1:], columns=tbl[0])
+        expect = [tbl[0],
+                  [['apples', 'oranges'], [1, 3], [2.5, 4.4]],
+                  [['pears'], [7], [.1]]]
+        eq_(expect, list(etl.iterbatches(fromdataframe(df), 2)))
+        expect = [('index',) + tbl[0],
+                  [[0, 1, 2], ['apples', 'oranges', 'pears'], [1, 3, 7],
+                   [2.5, 4.4, .1]]]
+        eq_(expect, list(etl.iterbatches(fromdataframe(df,
+                                                       include_index=True))))
+
     def test_integration():
         tbl = [('foo', 'bar', 'baz'),
                ('apples', 1, 2.5),
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, print_function, division
+
+
+from tempfile import NamedTemporaryFile
+import os
+import csv
+import json
+
+
+from petl.test.helpers import eq_
+from petl.io.rowindex import rowindex, indexpath, iterskip
+
+
+def test_rowindex():
+
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.write(b'foo,bar\na,1\nb,"2\n2"\n\nc,3\nd,"""4"""')
+    f.close()
+
+    index = rowindex(f.name, 2, skip=1, dialect=csv.excel)
+    eq_(5, index.count)
+    eq_([8, 20, 25], index.offsets)
+    eq_((20, 1), index.locate(3))
+    eq_((len(b'foo,bar\na,1\nb,"2\n2"\n\nc,3\nd,"""4"""'), 0),
+        index.locate(5))
+
+    # saved next to the file
+    with open(indexpath(f.name)) as g:
+        eq_([8, 20, 25], json.load(g)['offsets'])
+    eq_(5, rowindex(f.name, 2, skip=1, dialect=csv.excel).count)
+
+    # without quotes every line is a row
+    index = rowindex(f.name, 2)
+    eq_(7, index.count)
+    eq_([0, 12, 20, 25], index.offsets)
+
+    # rebuilt if the file changes
+    with open(f.name, 'ab') as g:
+        g.write(b'\ne,5\n')
+    os.utime(f.name, (0, 0))
+    eq_(8, rowindex(f.name, 2).count)
+
+
+def test_rowindex_quotes():
+
+    # quotes only open a quoted value at the start of a field
+    data = (b'foo,bar\n'
+            b'p,5"inch\n'
+            b'q,"6"" ""x\ny"\n'
+            b'r,a"b"c\n'
+            b's, "7\n7"\n'
+            b't,8\n')
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.write(data)
+    f.close()
+    index = rowindex(f.name, 1, skip=1, dialect=csv.excel)
+    eq_(6, index.count)
+    eq_([8, 17, 31, 39, 45, 48], index.offsets)
+    eq_(len(list(csv.reader(data.decode('ascii').splitlines(True)))) - 1,
+        index.count)
+
+    class Dialect(csv.excel):
+        skipinitialspace = True
+
+    # not reused for a different dialect
+    index = rowindex(f.name, 1, skip=1, dialect=Dialect)
+    eq_(5, index.count)
+    eq_([8, 17, 31, 39, 48], index.offsets)
+    eq_(5, len(list(csv.reader(data.decode('ascii').splitlines(True),
+                               skipinitialspace=True))) - 1)
+
+
+def test_rowindex_empty():
+
+    f = NamedTemporaryFile(mode='wb', delete=False)
+    f.close()
+    index = rowindex(f.name, 10, skip=1)
+    eq_(0, index.count)
+    eq_([], index.offsets)
+    eq_((0, 0), index.locate(0))
+
+
+def test_iterskip():
+
+    eq_([0, 3, 4], list(iterskip(range(5), 2)))
+    eq_([], list(iterskip([], 2)))
@@ -174,3 +174,18 @@ def test_totext_gz():
         eq_(expect, actual)
     finally:
         o.close()
+
+
+def test_fromtext_index():
+
+    f = NamedTemporaryFile(delete=False, mode='wb')
+    f.write(b''.join(('line %s\n' % i).encode('ascii') for i in range(20)))
+    f.close()
+
+    for header in ('lines',), None:
+        expect = fromtext(f.name, encoding='ascii', header=header)
+        actual = fromtext(f.name, encoding='ascii', header=header, index=3)
+        ieq(expect, actual)
+        eq_(expect.nrows(), actual.nrows())
+        ieq(expect.rowslice(4, 11), actual.rowslice(4, 11))
+        ieq(expect.tail(4), actual.tail(4))
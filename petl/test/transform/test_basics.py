@@ -344,6 +344,16 @@ def test_addfield_uneven_rows():
     ieq(expectation, result)
 
 
+def test_addfield_workers():
+    table = [('foo', 'bar')] + [('abc'[i % 3], i) for i in range(100)]
+    table.append(('d',))
+    expectation = addfield(table, 'baz', expr('{foo} * 2'), index=1)
+    result = addfield(table, 'baz', expr('{foo} * 2'), index=1, workers=2,
+                      chunksize=7)
+    ieq(expectation, result)
+    ieq(expectation, result)
+
+
 def test_addfield_dupfield():
     table = (('foo', 'foo'),
              ('M', 12),
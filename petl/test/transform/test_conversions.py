@@ -1,9 +1,14 @@
 from __future__ import absolute_import, print_function, division
 
 
-from petl.test.helpers import ieq
+import datetime
+
+
+from petl.test.helpers import ieq, eq_
+from petl.errors import ArgumentError
+from petl.util.batches import iterbatches, iterbatchrows
 from petl.transform.conversions import convert, convertall, convertnumbers, \
-    replace, update, format, interpolate
+    convertdates, replace, update, format, interpolate
 
 
 def test_convert():
@@ -335,6 +340,117 @@ def test_replace_unhashable():
     ieq(expect, actual)
 
 
+def test_convert_row_lengths():
+
+    # rows the same length as the header take a specialised path
+    table1 = (('foo', 'bar', 'baz'),
+              ('A', '1', '2'),
+              ('B', 'x', '3'),
+              ('C',),
+              ('D', '4', '5', '6'),
+              ())
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, 2),
+              ('B', 'NA', 3),
+              ('C',),
+              ('D', 4, 5, '6'),
+              ())
+    actual = convert(table1, ('bar', 'baz'), int, errorvalue='NA')
+    ieq(expect, actual)
+
+    expect = (('foo', 'bar', 'baz'),
+              ('A', '1A', '2'),
+              ('B', 'x', '3'),
+              ('C',),
+              ('D', '4D', '5', '6'),
+              ())
+    actual = convert(table1, 'bar', lambda v, row: v + row.foo,
+                     pass_row=True, where=lambda row: row.bar != 'x')
+    ieq(expect, actual)
+
+    actual = convert(table1, 'bar', int, failonerror=True)
+    try:
+        list(actual)
+    except ValueError:
+        pass
+    else:
+        assert False, 'exception expected'
+
+
+def _double(v):
+    return v * 2
+
+
+def test_convert_memoize():
+
+    table1 = (('foo', 'bar', 'baz'),
+              ('a', '1', 'x'),
+              ('b', '2', 'x'),
+              ('a', '1'),
+              ('c', 'xyz', 'x'),
+              ('a', '2', 'x'))
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, 'x'),
+              ('B', 2, 'x'),
+              ('A', 1),
+              ('C', None, 'x'),
+              ('A', 2, 'x'))
+    table2 = convert(table1, {'foo': 'upper', 'bar': int}, memoize=True)
+    ieq(expect, table2)
+    eq_((2, 3), (table2.memos['foo'].hits, table2.memos['foo'].misses))
+    eq_((2, 3), (table2.memos['bar'].hits, table2.memos['bar'].misses))
+
+    # batches
+    table3 = convert(table1, {'foo': 'upper', 'bar': int})
+    ieq(iterbatchrows(iterbatches(table3, 2)),
+        iterbatchrows(iterbatches(table2, 2)))
+    eq_(2, table2.memos['bar'].hits)
+
+    actual = convert(table1, 'foo', 'upper', where=lambda r: r.bar == '1',
+                     memoize=2)
+    ieq(convert(table1, 'foo', 'upper', where=lambda r: r.bar == '1'),
+        actual)
+
+    try:
+        convert(table1, 'foo', lambda v, row: v, pass_row=True, memoize=True)
+    except ArgumentError:
+        pass
+    else:
+        assert False, 'exception expected'
+
+
+def test_convertdates():
+
+    table1 = (('foo', 'bar', 'baz', 'quux'),
+              ('a', '2002-12-25', '12/25/2002 00:00:00', 'x'),
+              ('b', '', '12/31/2002 13:45:00', '1'),
+              ('c', None, 'xyz'),
+              ('d', '2002-12-26', '01/01/2003 00:00:00', 2))
+    expect = (('foo', 'bar', 'baz', 'quux'),
+              ('a', datetime.date(2002, 12, 25),
+               datetime.datetime(2002, 12, 25), 'x'),
+              ('b', 'x', datetime.datetime(2002, 12, 31, 13, 45), '1'),
+              ('c', 'x', 'x'),
+              ('d', datetime.date(2002, 12, 26),
+               datetime.datetime(2003, 1, 1), 2))
+    actual = convertdates(table1, ('bar', 'baz', 'quux'), sample=2,
+                          errorvalue='x')
+    ieq(expect, actual)
+
+
+def test_convert_workers():
+
+    table1 = [('foo', 'bar')] + [('abc'[i % 3], str(i)) for i in range(100)]
+    expect = convert(table1, 'bar', int)
+    actual = convert(table1, 'bar', int, workers=2, chunksize=7)
+    ieq(expect, actual)
+    ieq(expect, actual)
+    expect = convert(table1, 'bar', _double, where='{foo} == "a"')
+    actual = convert(table1, 'bar', _double, where='{foo} == "a"',
+                     workers=2, chunksize=7)
+    ieq(expect, actual)
+
+
 def test_format():
 
     table = (('foo', 'bar'),
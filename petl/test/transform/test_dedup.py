@@ -1,9 +1,9 @@
 from __future__ import absolute_import, print_function, division
 
 
-from petl.test.helpers import ieq
+from petl.test.helpers import ieq, eq_
 from petl.transform.dedup import duplicates, unique, conflicts, distinct, \
-    isunique
+    isunique, hashdistinct, hashunique, hashduplicates, bloomdistinct
 
 
 def test_duplicates():
@@ -253,3 +253,139 @@ def test_isunique():
     table = (('foo', 'bar'), ('a', 1), ('b',), ('b', 2), ('c', 3, True))
     assert not isunique(table, 'foo')
     assert isunique(table, 'bar')
+
+
+def test_hashdistinct():
+
+    table = (('foo', 'bar', 'baz'),
+             ('B', 2, 3.4),
+             ('A', 1, 2),
+             ('B', 3, 7.8),
+             ('A', 1, 2),
+             ('D', 6, 9.3),
+             ('B', 2, 3.4))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('B', 2, 3.4),
+              ('A', 1, 2),
+              ('B', 3, 7.8),
+              ('D', 6, 9.3))
+    actual = hashdistinct(table)
+    ieq(expect, actual)
+    ieq(expect, actual)
+
+    expect = (('foo', 'bar', 'baz'),
+              ('B', 2, 3.4),
+              ('A', 1, 2),
+              ('D', 6, 9.3))
+    ieq(expect, hashdistinct(table, 'foo'))
+
+    expect = (('foo', 'bar', 'baz', 'n'),
+              ('B', 2, 3.4, 3),
+              ('A', 1, 2, 2),
+              ('D', 6, 9.3, 1))
+    ieq(expect, hashdistinct(table, 'foo', count='n'))
+
+    ieq((('foo', 'bar'),), hashdistinct((('foo', 'bar'),)))
+
+
+def test_hashunique_hashduplicates():
+
+    table = (('foo', 'bar', 'baz'),
+             ('B', 2, 3.4),
+             ('A', 1, 2),
+             ('B', 3, 7.8),
+             ('E', None, None),
+             ('D', 6, 9.3),
+             ('B', 2, 3.4),
+             ('D', 1, 2))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, 2),
+              ('E', None, None))
+    actual = hashunique(table, 'foo')
+    ieq(expect, actual)
+    ieq(expect, actual)
+
+    expect = (('foo', 'bar', 'baz'),
+              ('B', 2, 3.4),
+              ('B', 3, 7.8),
+              ('D', 6, 9.3),
+              ('B', 2, 3.4),
+              ('D', 1, 2))
+    ieq(expect, hashduplicates(table, 'foo'))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('B', 2, 3.4),
+              ('B', 2, 3.4))
+    ieq(expect, hashduplicates(table))
+
+
+def test_hashdedup_spill():
+
+    table = [('foo', 'bar')] + [((i * 7) % 23, i) for i in range(200)]
+
+    def firstseen(rows):
+        seen = set()
+        for row in rows:
+            if row[0] not in seen:
+                seen.add(row[0])
+                yield row
+
+    expect = [table[0]] + list(firstseen(table[1:]))
+    ieq(expect, hashdistinct(table, 'foo', buffersize=3))
+    ieq(hashdistinct(table, 'foo', count='n'),
+        hashdistinct(table, 'foo', count='n', buffersize=3))
+
+    table = table[:31]
+    keys = [row[0] for row in table[1:]]
+    expect = [table[0]] + [row for row in table[1:]
+                           if keys.count(row[0]) == 1]
+    ieq(expect, hashunique(table, 'foo', buffersize=2))
+    expect = [table[0]] + [row for row in table[1:]
+                           if keys.count(row[0]) > 1]
+    ieq(expect, hashduplicates(table, 'foo', buffersize=2))
+
+
+def test_bloomdistinct():
+
+    table = (('foo', 'bar'),
+             ('B', 2),
+             ('A', 1),
+             ('B', 3),
+             ('A', 1),
+             ('D', 6))
+
+    expect = (('foo', 'bar'),
+              ('B', 2),
+              ('A', 1),
+              ('B', 3),
+              ('D', 6))
+    actual = bloomdistinct(table)
+    ieq(expect, actual)
+    ieq(expect, actual)
+    eq_(1, actual.duplicates)
+
+    expect = (('foo', 'bar'),
+              ('B', 2),
+              ('A', 1),
+              ('D', 6))
+    ieq(expect, bloomdistinct(table, 'foo'))
+
+    # rotation forgets keys not seen since the previous rotation
+    table = [('foo',)] + [(i % 5,) for i in range(20)]
+    actual = bloomdistinct(table, 'foo', rotate=5)
+    ieq(table[:6], actual)
+    table = (('foo',), (0,), (1,), (2,), (3,), (0,))
+    ieq(table, bloomdistinct(table, 'foo', rotate=2))
+
+
+def test_bloomdistinct_capacity():
+
+    # filters are added when capacity is exceeded, keeping the error rate
+    table = [('foo',)] + [(i,) for i in range(2000)] * 2
+    actual = bloomdistinct(table, 'foo', capacity=100, error_rate=.01)
+    n = actual.nrows()
+    assert 1980 <= n <= 2000, n
+    eq_(4000 - n, actual.duplicates)
+    assert actual.falsepositives < 40, actual.falsepositives
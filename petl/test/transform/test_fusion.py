@@ -0,0 +1,90 @@
+from __future__ import absolute_import, print_function, division
+
+
+from petl.compat import OrderedDict
+from petl.test.helpers import ieq, eq_
+from petl.util.base import wrap
+from petl.transform.fusion import optimize, FusedView
+
+
+table1 = (('foo', 'bar', 'baz'),
+          ('A', '1', 2.7),
+          ('B', '2', 3.4),
+          ['C', '3', 7.8],
+          ('D', 'xyz'),
+          ('E', '12', 9.0, True))
+
+
+def test_optimize():
+
+    table2 = (wrap(table1)
+              .convert('bar', int)
+              .select(lambda rec: rec.bar != 2)
+              .cutout('baz')
+              .addfield('quux', lambda rec: rec['foo'] * 2)
+              .rename('foo', 'spong'))
+    expect = (('spong', 'bar', 'quux'),
+              ('A', 1, 'AA'),
+              ('C', 3, 'CC'),
+              ('D', None, 'DD'),
+              ('E', 12, 'EE'))
+    table3 = optimize(table2)
+    assert isinstance(table3, FusedView)
+    ieq(expect, table3)
+    ieq(expect, table3)  # verify can iterate twice
+    ieq(table2, table3)
+
+
+def test_optimize_rows():
+
+    # short and long rows, list rows and selects followed by nothing
+    table2 = (wrap(table1)
+              .cut('baz', 'foo')
+              .convert('baz', lambda v: v * 2, where=lambda r: r.foo != 'B')
+              .selectnotnone('baz')
+              .select('{foo} != "A"'))
+    table3 = table2.optimize()
+    ieq(table2, table3)
+    for row in table3:
+        eq_(tuple, type(row))
+
+    table2 = wrap(table1).select('foo', lambda v: v > 'B').setheader(
+        ['x', 'y', 'z'])
+    ieq(table2, table2.optimize())
+    table2 = (wrap(table1).addfield('n', 1, index=0).convert('bar', int)
+              .cut('n', 'bar', 'baz'))
+    ieq(table2, table2.optimize())
+
+
+def test_optimize_fieldmap():
+
+    mappings = OrderedDict()
+    mappings['foo'] = 'foo'
+    mappings['bar'] = 'bar', int
+    mappings['double'] = '{baz} * 2'
+    table2 = (wrap(table1)
+              .fieldmap(mappings)
+              .selectgt('bar', 1)
+              .convert('foo', 'lower'))
+    expect = (('foo', 'bar', 'double'),
+              ('b', 2, 6.8),
+              ('c', 3, 15.6),
+              ('e', 12, 18.0))
+    ieq(expect, table2.optimize())
+    ieq(table2, table2.optimize())
+
+
+def test_optimize_unfused():
+
+    # nothing to fuse
+    table2 = wrap(table1).cut('foo')
+    assert table2.optimize() is table2
+    table2 = wrap(table1).sort('foo').cut('foo')
+    assert table2.optimize() is table2
+
+    # fusion ends at the first table which can't be fused
+    table2 = wrap(table1).cut('foo', 'bar').sort('foo').cut('bar').convert(
+        'bar', int)
+    table3 = table2.optimize()
+    assert table3.source is table2.source.source
+    ieq(table2, table3)
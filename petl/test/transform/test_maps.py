@@ -2,7 +2,7 @@ from __future__ import absolute_import, print_function, division
 
 
 from petl.compat import OrderedDict
-from petl.test.helpers import ieq
+from petl.test.helpers import ieq, eq_
 from petl.transform.maps import fieldmap, rowmap, rowmapmany
 
 
@@ -252,3 +252,31 @@ def test_recordmapmany():
               (4, 'age_months', 21 * 12))
     ieq(expect, actual)
     ieq(expect, actual)  # can iteratate twice?
+
+
+def _square(v):
+    return v * v
+
+
+def test_fieldmap_workers():
+
+    table1 = [('foo', 'bar')] + [('abc'[i % 3], i) for i in range(100)]
+    mappings = OrderedDict()
+    mappings['foo'] = 'foo'
+    mappings['baz'] = 'bar', _square
+    mappings['quux'] = '{bar} + 1'
+    expect = fieldmap(table1, mappings)
+    actual = fieldmap(table1, mappings, workers=2, chunksize=7)
+    ieq(expect, actual)
+    ieq(expect, actual)
+
+
+def test_fieldmap_memoize():
+
+    table1 = [('foo', 'bar')] + [('abc'[i % 3], i) for i in range(10)]
+    mappings = OrderedDict()
+    mappings['foo'] = 'foo', str.upper
+    mappings['bar'] = 'bar'
+    table2 = fieldmap(table1, mappings, memoize=True)
+    ieq(fieldmap(table1, mappings), table2)
+    eq_((7, 3), (table2.memos['foo'].hits, table2.memos['foo'].misses))
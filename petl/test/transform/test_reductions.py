@@ -4,11 +4,17 @@ from __future__ import absolute_import, print_function, division
 import operator
 
 
+import petl.config
 from petl.compat import OrderedDict
 from petl.test.helpers import ieq
 from petl.util import strjoin
+from petl.util.aggregators import Count, Sum, Min, Mean, First, Last, \
+    ApproxCountDistinct, ApproxQuantiles, HeavyHitters
 from petl.transform.reductions import rowreduce, aggregate, \
-    mergeduplicates, Conflict, fold
+    mergeduplicates, Conflict, fold, hashrowreduce, hashaggregate, \
+    hashmergeduplicates, hashfold, groupselectfirst, groupselectlast, \
+    groupselectmin, groupselectmax, hashgroupselectfirst, \
+    hashgroupselectlast, hashgroupselectmin, hashgroupselectmax
 
 
 def test_rowreduce():
@@ -327,3 +333,347 @@ def test_fold():
     expect = (('key', 'value'), (1, 8), (2, 12))
     ieq(expect, t2)
     ieq(expect, t2)
+
+
+def test_hashrowreduce():
+
+    table1 = (('foo', 'bar'),
+              ('b', 2),
+              ('a', 3),
+              ('b', 1),
+              ('a', 7),
+              ('c', 4),
+              ('b', 9))
+
+    def sumbar(key, records):
+        return [key, sum(rec['bar'] for rec in records)]
+
+    table2 = hashrowreduce(table1, key='foo', reducer=sumbar,
+                           header=['foo', 'barsum'])
+    expect2 = (('foo', 'barsum'),
+               ('a', 10),
+               ('b', 12),
+               ('c', 4))
+    ieq(expect2, table2)
+    ieq(expect2, table2)
+
+    table3 = hashrowreduce(table1, key='foo', reducer=sumbar,
+                           header=['foo', 'barsum'], sortkeys=False)
+    expect3 = (('foo', 'barsum'),
+               ('b', 12),
+               ('a', 10),
+               ('c', 4))
+    ieq(expect3, table3)
+
+
+def test_hashrowreduce_empty():
+    table = (('foo', 'bar'),)
+    expect = (('foo', 'bar'),)
+    reducer = lambda key, rows: (key, [r[0] for r in rows])
+    actual = hashrowreduce(table, key='foo', reducer=reducer,
+                           header=('foo', 'bar'))
+    ieq(expect, actual)
+
+
+def test_hashaggregate_simple():
+
+    table1 = (('foo', 'bar', 'baz'),
+              ('b', 2, True),
+              ('a', 3, True),
+              ('b', 2, False),
+              ('c', 4, True),
+              ('a', 7, False),
+              ('b', 9, False))
+
+    table2 = hashaggregate(table1, 'foo', len)
+    expect2 = (('foo', 'value'),
+               ('a', 2),
+               ('b', 3),
+               ('c', 1))
+    ieq(expect2, table2)
+    ieq(expect2, table2)
+
+    table3 = hashaggregate(table1, 'foo', sum, 'bar', sortkeys=False)
+    expect3 = (('foo', 'value'),
+               ('b', 13),
+               ('a', 10),
+               ('c', 4))
+    ieq(expect3, table3)
+    ieq(expect3, table3)
+
+    table4 = hashaggregate(table1, key=('foo', 'bar'), aggregation=list,
+                           value=('bar', 'baz'))
+    expect4 = (('foo', 'bar', 'value'),
+               ('a', 3, [(3, True)]),
+               ('a', 7, [(7, False)]),
+               ('b', 2, [(2, True), (2, False)]),
+               ('b', 9, [(9, False)]),
+               ('c', 4, [(4, True)]))
+    ieq(expect4, table4)
+
+
+def test_hashaggregate_multifield():
+
+    table1 = (('foo', 'bar'),
+              ('b', 2),
+              ('a', 3),
+              ('b', 1),
+              ('a', 7),
+              ('c', 4),
+              ('b', 9))
+
+    aggregators = OrderedDict()
+    aggregators['count'] = len
+    aggregators['minbar'] = 'bar', min
+    aggregators['maxbar'] = 'bar', max
+    aggregators['sumbar'] = 'bar', sum
+    aggregators['listbar'] = 'bar'  # default aggregation is list
+    aggregators['bars'] = 'bar', strjoin(', ')
+
+    table2 = hashaggregate(table1, 'foo', aggregators)
+    expect2 = (('foo', 'count', 'minbar', 'maxbar', 'sumbar', 'listbar',
+                'bars'),
+               ('a', 2, 3, 7, 10, [3, 7], '3, 7'),
+               ('b', 3, 1, 9, 12, [2, 1, 9], '2, 1, 9'),
+               ('c', 1, 4, 4, 4, [4], '4'))
+    ieq(expect2, table2)
+    ieq(expect2, table2)  # check can iterate twice
+
+    # should match the sort-based implementation
+    ieq(aggregate(table1, 'foo', aggregators), table2)
+
+
+def test_hashaggregate_empty():
+
+    table = (('foo', 'bar'),)
+
+    aggregators = OrderedDict()
+    aggregators['minbar'] = 'bar', min
+    aggregators['sumbar'] = 'bar', sum
+
+    actual = hashaggregate(table, 'foo', aggregators)
+    expect = (('foo', 'minbar', 'sumbar'),)
+    ieq(expect, actual)
+
+
+def test_hashmergeduplicates():
+
+    table = (('foo', 'bar', 'baz'),
+             ('A', 1, 2),
+             ('B', '2', None),
+             ('D', 'xyz', 9.4),
+             ('B', None, u'7.8', True),
+             ('E', None, 42.),
+             ('D', 'xyz', 12.3),
+             ('A', 2, None))
+
+    result = hashmergeduplicates(table, 'foo', missing=None)
+    expectation = (('foo', 'bar', 'baz'),
+                   ('A', Conflict([1, 2]), 2),
+                   ('B', '2', u'7.8'),
+                   ('D', 'xyz', Conflict([9.4, 12.3])),
+                   ('E', None, 42.))
+    ieq(expectation, result)
+    ieq(mergeduplicates(table, 'foo'), result)
+
+
+def test_hashfold():
+
+    t1 = (('id', 'count'), (2, 4), (1, 3), (2, 8), (1, 5))
+    t2 = hashfold(t1, 'id', operator.add, 'count')
+    expect = (('key', 'value'), (1, 8), (2, 12))
+    ieq(expect, t2)
+    ieq(expect, t2)
+
+    t3 = hashfold(t1, 'id', operator.add, 'count', sortkeys=False)
+    expect = (('key', 'value'), (2, 12), (1, 8))
+    ieq(expect, t3)
+
+
+def test_aggregate_aggregators():
+
+    table1 = (('foo', 'bar'),
+              ('b', 2),
+              ('a', 3),
+              ('b', 1),
+              ('a', 7),
+              ('c', 4),
+              ('b', 9))
+
+    aggregators = OrderedDict()
+    aggregators['count'] = Count()
+    aggregators['minbar'] = 'bar', Min()
+    aggregators['meanbar'] = 'bar', Mean()
+    aggregators['firstbar'] = 'bar', First()
+    aggregators['lastbar'] = 'bar', Last()
+    aggregators['bars'] = 'bar', strjoin(', ')  # not incremental
+    expect = (('foo', 'count', 'minbar', 'meanbar', 'firstbar', 'lastbar',
+               'bars'),
+              ('a', 2, 3, 5.0, 3, 7, '3, 7'),
+              ('b', 3, 1, 4.0, 2, 9, '2, 1, 9'),
+              ('c', 1, 4, 4.0, 4, 4, '4'))
+
+    actual = aggregate(table1, 'foo', aggregators)
+    ieq(expect, actual)
+    ieq(expect, actual)
+    actual = hashaggregate(table1, 'foo', aggregators)
+    ieq(expect, actual)
+    ieq(expect, actual)
+
+    expect = (('foo', 'value'),
+              ('a', 10),
+              ('b', 12),
+              ('c', 4))
+    ieq(expect, aggregate(table1, 'foo', Sum(), 'bar'))
+    ieq(expect, hashaggregate(table1, 'foo', Sum(), 'bar'))
+
+    # approximate aggregators are exact for small groups
+    aggregators = OrderedDict()
+    aggregators['ndistinct'] = 'bar', ApproxCountDistinct()
+    aggregators['medianbar'] = 'bar', ApproxQuantiles()
+    aggregators['topbar'] = 'bar', HeavyHitters(n=1)
+    expect = (('foo', 'ndistinct', 'medianbar', 'topbar'),
+              ('a', 2, 3, [(3, 1)]),
+              ('b', 3, 2, [(2, 1)]),
+              ('c', 1, 4, [(4, 1)]))
+    ieq(expect, aggregate(table1, 'foo', aggregators))
+    ieq(expect, hashaggregate(table1, 'foo', aggregators))
+
+
+def _sumbar(key, rows):
+    return key, sum(row[1] for row in rows)
+
+
+def test_parallel_reductions():
+
+    table1 = [('foo', 'bar')] + [('abcdefg'[i % 7], i % 13)
+                                 for i in range(200)]
+
+    aggregators = OrderedDict()
+    aggregators['count'] = len
+    aggregators['sumbar'] = 'bar', Sum()
+    aggregators['firstbar'] = 'bar', First()
+    aggregators['lastbar'] = 'bar', Last()
+    aggregators['listbar'] = 'bar', list
+    expect = aggregate(table1, 'foo', aggregators)
+    chunksize = petl.config.parallel_chunksize
+    petl.config.parallel_chunksize = 16
+    try:
+        ieq(expect, aggregate(table1, 'foo', aggregators, workers=2))
+    finally:
+        petl.config.parallel_chunksize = chunksize
+
+    # not incremental, so rows are partitioned by key
+    aggregators['bars'] = 'bar', strjoin(', ')
+    expect = aggregate(table1, 'foo', aggregators)
+    ieq(expect, aggregate(table1, 'foo', aggregators, workers=2))
+
+    expect = aggregate(table1, 'foo', sum, 'bar')
+    ieq(expect, aggregate(table1, 'foo', sum, 'bar', workers=3))
+    expect = aggregate(table1, 'foo', strjoin(', '), 'bar')
+    ieq(expect, aggregate(table1, 'foo', strjoin(', '), 'bar', workers=3))
+
+    expect = rowreduce(table1, 'foo', _sumbar, header=('foo', 'barsum'))
+    actual = rowreduce(table1, 'foo', _sumbar, header=('foo', 'barsum'),
+                       workers=2)
+    ieq(expect, actual)
+    ieq(expect, actual)
+
+    expect = fold(table1, 'foo', operator.sub, 'bar')
+    ieq(expect, fold(table1, 'foo', operator.sub, 'bar', workers=2))
+
+
+def test_hash_reductions_spill():
+
+    table1 = [('foo', 'bar')] + [('abcdefg'[i % 7] + str(i % 5), i % 13)
+                                 for i in range(300)]
+
+    aggregators = OrderedDict()
+    aggregators['count'] = len
+    aggregators['sumbar'] = 'bar', Sum()
+    aggregators['firstbar'] = 'bar', First()
+    aggregators['lastbar'] = 'bar', Last()
+    aggregators['listbar'] = 'bar', list
+    aggregators['bars'] = 'bar', strjoin(', ')
+    for sortkeys in True, False:
+        expect = hashaggregate(table1, 'foo', aggregators, sortkeys=sortkeys)
+        actual = hashaggregate(table1, 'foo', aggregators, sortkeys=sortkeys,
+                               buffersize=4)
+        ieq(expect, actual)
+        ieq(expect, actual)
+
+        expect = hashaggregate(table1, 'foo', sum, 'bar', sortkeys=sortkeys)
+        actual = hashaggregate(table1, 'foo', sum, 'bar', sortkeys=sortkeys,
+                               buffersize=4)
+        ieq(expect, actual)
+
+        expect = hashrowreduce(table1, 'foo', _sumbar, sortkeys=sortkeys)
+        actual = hashrowreduce(table1, 'foo', _sumbar, sortkeys=sortkeys,
+                               buffersize=4)
+        ieq(expect, actual)
+
+        expect = hashmergeduplicates(table1, 'foo', sortkeys=sortkeys)
+        actual = hashmergeduplicates(table1, 'foo', sortkeys=sortkeys,
+                                     buffersize=4)
+        ieq(expect, actual)
+
+    ieq(aggregate(table1, 'foo', aggregators),
+        hashaggregate(table1, 'foo', aggregators, buffersize=4))
+
+    # budget taken from config
+    buffersize = petl.config.hash_buffersize
+    petl.config.hash_buffersize = 4
+    try:
+        ieq(aggregate(table1, 'foo', sum, 'bar'),
+            hashaggregate(table1, 'foo', sum, 'bar'))
+    finally:
+        petl.config.hash_buffersize = buffersize
+
+
+def test_hashgroupselect():
+
+    table1 = (('foo', 'bar', 'baz'),
+              ('C', 7, False),
+              ('A', 1, True),
+              ('B', 2, False),
+              ('C', 9, True),
+              ('A', 1, False),
+              ('C', None, True),
+              ('B', 5, True))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, True),
+              ('B', 2, False),
+              ('C', 7, False))
+    ieq(expect, groupselectfirst(table1, 'foo'))
+    ieq(expect, hashgroupselectfirst(table1, 'foo'))
+    expect = (('foo', 'bar', 'baz'),
+              ('C', 7, False),
+              ('A', 1, True),
+              ('B', 2, False))
+    ieq(expect, hashgroupselectfirst(table1, 'foo', sortkeys=False))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, False),
+              ('B', 5, True),
+              ('C', None, True))
+    ieq(expect, groupselectlast(table1, 'foo'))
+    ieq(expect, hashgroupselectlast(table1, 'foo'))
+
+    # ties go to the first row, None sorts lowest
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, True),
+              ('B', 2, False),
+              ('C', None, True))
+    ieq(expect, groupselectmin(table1, 'foo', 'bar'))
+    ieq(expect, hashgroupselectmin(table1, 'foo', 'bar'))
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, True),
+              ('B', 5, True),
+              ('C', 9, True))
+    ieq(expect, groupselectmax(table1, 'foo', 'bar'))
+    ieq(expect, hashgroupselectmax(table1, 'foo', 'bar'))
+    actual = hashgroupselectmax(table1, 'foo', lambda rec: rec['bar'],
+                                buffersize=1)
+    ieq(expect, actual)
+    ieq(expect, actual)
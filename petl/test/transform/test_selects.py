@@ -1,10 +1,20 @@
 from __future__ import absolute_import, print_function, division
 
 
+import os
+import shutil
+import tempfile
+
+
 from petl.test.helpers import ieq, eq_
 from petl.comparison import Comparable
 from petl.transform.selects import select, selectin, selectcontains, \
-    rowlenselect, selectusingcontext, facet, selectgt, selectlt
+    rowlenselect, selectusingcontext, facet, selectgt, selectlt, partition, \
+    bipartition, tofacets
+from petl.transform.selects import selecteq, selectle, selectge, \
+    selectrangeopen, selectrangeclosed, selectnotin, IndexSelectView
+from petl.util.materialise import indexed
+from petl.io.csv import fromcsv
 
 
 def test_select():
@@ -106,6 +116,69 @@ def test_select():
     ieq(expect, actual)  # check can iterate twice
 
 
+def test_select_expr_compiled():
+
+    table = (('foo', 'bar', 'baz'),
+             ('a', 4, 9.3),
+             ('a', 2, 88.2),
+             ('b', 1, 23.3),
+             ('c', 8),
+             ('d', 7, 100.9))
+
+    # short rows fall back to records, padded with missing values
+    actual = select(table, "{baz} is None or {baz} > 50", missing=None)
+    expect = (('foo', 'bar', 'baz'),
+              ('a', 2, 88.2),
+              ('c', 8),
+              ('d', 7, 100.9))
+    ieq(expect, actual)
+    ieq(expect, actual)
+
+    actual = select(table, "{baz} is None or {baz} > 50", complement=True)
+    expect = (('foo', 'bar', 'baz'),
+              ('a', 4, 9.3),
+              ('b', 1, 23.3))
+    ieq(expect, actual)
+
+    # expressions using the record itself are not compiled
+    actual = select(table, "{foo} == 'a' and rec.bar > 3")
+    expect = (('foo', 'bar', 'baz'),
+              ('a', 4, 9.3))
+    ieq(expect, actual)
+
+    # errors from full rows are raised, without evaluating again
+    calls = []
+    actual = select((('foo', 'bar'), ('a', calls)),
+                    "{bar}.append(1) or {foo}[5] == 'x'")
+    try:
+        list(actual)
+    except IndexError:
+        pass
+    else:
+        assert False, 'exception expected'
+    eq_([1], calls)
+
+
+def test_select_fused():
+
+    table = (('foo', 'bar', 'baz'),
+             ('a', 4, 9.3),
+             ('a', 2, 88.2),
+             ('b', 1, 23.3),
+             ('c', 8, 42.0),
+             ('d', 7, 100.9),
+             ('c', 2))
+
+    actual = select(selectgt(select(table, "{bar} > 1"), 'bar', 2),
+                    'foo', lambda v: v == 'a', complement=True)
+    eq_(3, len(actual.conditions))
+    expect = (('foo', 'bar', 'baz'),
+              ('c', 8, 42.0),
+              ('d', 7, 100.9))
+    ieq(expect, actual)
+    ieq(expect, actual)
+
+
 def test_select_empty():
     table = (('foo', 'bar'),)
     expect = (('foo', 'bar'),)
@@ -323,3 +396,139 @@ def test_facet_empty():
     table = (('foo', 'bar'),)
     actual = facet(table, 'foo')
     eq_(list(), list(actual.keys()))
+
+
+def test_partition():
+
+    table = (('foo', 'bar', 'baz'),
+             ('a', 4, 9.3),
+             ('a', 2, 88.2),
+             ('b', 1, 23.3),
+             ('c', 8, 42.0),
+             ('d', 7, 100.9),
+             ('c', 2))
+    expect_fcta = (('foo', 'bar', 'baz'),
+                   ('a', 4, 9.3),
+                   ('a', 2, 88.2))
+    expect_fctc = (('foo', 'bar', 'baz'),
+                   ('c', 8, 42.0),
+                   ('c', 2))
+
+    # in memory, and spilled to temporary files
+    for buffersize in None, 2, 1:
+        fct = partition(table, 'foo', buffersize=buffersize)
+        eq_(['a', 'b', 'c', 'd'], list(fct.keys()))
+        ieq(expect_fcta, fct['a'])
+        ieq(expect_fcta, fct['a'])  # check can iterate twice
+        ieq(expect_fctc, fct['c'])
+
+    fct = partition(table, ('foo', 'bar'), buffersize=3)
+    eq_(6, len(fct))
+    ieq((('foo', 'bar', 'baz'), ('c', 2)), fct[('c', 2)])
+
+
+def test_partition_empty():
+
+    table = (('foo', 'bar'),)
+    eq_(0, len(partition(table, 'foo')))
+    t1, t2 = bipartition(table, 'foo', lambda v: v == 'a')
+    ieq(table, t1)
+    ieq(table, t2)
+
+
+def test_bipartition():
+
+    table = (('foo', 'bar', 'baz'),
+             ('a', 4, 9.3),
+             ('a', 2, 88.2),
+             ('b', 1, 23.3),
+             ('c', 8, 42.0),
+             ('d', 7, 100.9),
+             ('c', 2))
+    expect1 = (('foo', 'bar', 'baz'),
+               ('a', 4, 9.3),
+               ('c', 8, 42.0),
+               ('d', 7, 100.9))
+    expect2 = (('foo', 'bar', 'baz'),
+               ('a', 2, 88.2),
+               ('b', 1, 23.3),
+               ('c', 2))
+    for buffersize in None, 2:
+        t1, t2 = bipartition(table, 'bar', lambda v: v > 3,
+                             buffersize=buffersize)
+        ieq(expect1, t1)
+        ieq(expect2, t2)
+        t1, t2 = bipartition(table, "{bar} > 3", buffersize=buffersize)
+        ieq(expect1, t1)
+        ieq(expect2, t2)
+
+
+def test_tofacets():
+
+    table = (('foo', 'bar'),
+             ('a', 1),
+             ('b', 2),
+             ('a', 3))
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for buffersize in None, 1:
+            tofacets(table, 'foo', os.path.join(tmpdir, '{}.csv'),
+                     buffersize=buffersize)
+            ieq((('foo', 'bar'), ('a', '1'), ('a', '3')),
+                fromcsv(os.path.join(tmpdir, 'a.csv')))
+            ieq((('foo', 'bar'), ('b', '2')),
+                fromcsv(os.path.join(tmpdir, 'b.csv')))
+
+        tofacets(table, 'foo', lambda k: os.path.join(tmpdir, k + '.tsv'),
+                 delimiter='\t')
+        ieq((('foo', 'bar'), ('a', '1'), ('a', '3')),
+            fromcsv(os.path.join(tmpdir, 'a.tsv'), delimiter='\t'))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_select_indexed():
+
+    table = (('foo', 'bar', 'baz'),
+             ('a', 4, 9.3),
+             ('a', 2, 88.2),
+             ('b', 1, 23.3),
+             ('c', 8, 42.0),
+             ('d', 7, 100.9),
+             ('c', 2))
+    tbl = indexed(table, 'foo').indexed('bar', kind='sorted')
+
+    actual = selecteq(tbl, 'foo', 'c')
+    assert isinstance(actual, IndexSelectView)
+    expect = (('foo', 'bar', 'baz'),
+              ('c', 8, 42.0),
+              ('c', 2))
+    ieq(expect, actual)
+    ieq(expect, actual)
+    expect = (('foo', 'bar', 'baz'),
+              ('a', 4, 9.3),
+              ('a', 2, 88.2),
+              ('d', 7, 100.9))
+    ieq(expect, selectin(tbl, 'foo', ['d', 'a', 'x']))
+    ieq(expect, selectin(tbl, 'foo', 'ad'))
+
+    # range selections use the sorted index
+    for f, args in ((selecteq, (2,)),
+                    (selectin, ((1, 8),)),
+                    (selectlt, (4,)),
+                    (selectle, (4,)),
+                    (selectgt, (2,)),
+                    (selectge, (2,)),
+                    (selectrangeopen, (2, 7)),
+                    (selectrangeclosed, (2, 7)),
+                    (selectrangeclosed, (7, 2))):
+        ieq(f(table, 'bar', *args), f(tbl, 'bar', *args))
+
+    # no matching index, or complement, scans as usual
+    assert not isinstance(selecteq(tbl, 'foo', 'a', complement=True),
+                          IndexSelectView)
+    ieq(selecteq(table, 'baz', 42.0), selecteq(tbl, 'baz', 42.0))
+    ieq(selecteq(table, 'foo', 'a', complement=True),
+        selecteq(tbl, 'foo', 'a', complement=True))
+    ieq(selectlt(table, 'foo', 'c'), selectlt(tbl, 'foo', 'c'))
+    ieq(selectnotin(table, 'foo', ['a']), selectnotin(tbl, 'foo', ['a']))
@@ -1,12 +1,16 @@
 from __future__ import absolute_import, print_function, division
 
 
+import os
+import tempfile
 from datetime import datetime
 
 
 from petl.test.helpers import ieq
+from petl.util.base import wrap
 from petl.transform.setops import complement, intersection, diff, \
-    recordcomplement, recorddiff, hashcomplement, hashintersection
+    recordcomplement, recorddiff, hashcomplement, hashintersection, \
+    capturechanges
 
 
 def _test_complement_1(complement_impl):
@@ -429,3 +433,193 @@ def test_hashcomplement():
 
 def test_hashintersection():
     _test_intersection(hashintersection)
+
+
+def _digest(f, digest=True):
+    # run the set operation in digest mode
+    def g(a, b, **kwargs):
+        return f(a, b, digest=digest, **kwargs)
+    return g
+
+
+def test_complement_digest():
+    _test_complement(_digest(complement))
+    _test_complement(_digest(hashcomplement))
+
+
+def test_intersection_digest():
+    _test_intersection(_digest(intersection))
+    _test_intersection(_digest(hashintersection))
+
+
+def test_digest_fields():
+
+    tablea = (('foo', 'bar', 'baz'),
+              ('C', 7, False),
+              ('A', 1, True),
+              ('B', 2, False),
+              ('C', 9, True))
+
+    tableb = (('x', 'y', 'z'),
+              ('B', 2, True),
+              ('A', 9, False),
+              ('B', 3, True),
+              ('C', 9, False))
+
+    # rows are returned in their original order
+    aminusb = (('foo', 'bar', 'baz'),
+               ('C', 7, False),
+               ('A', 1, True))
+    bminusa = (('x', 'y', 'z'),
+               ('A', 9, False),
+               ('B', 3, True))
+    added, subtracted = diff(tablea, tableb, digest=('foo', 'bar'))
+    ieq(bminusa, added)
+    ieq(aminusb, subtracted)
+    ieq(aminusb, hashcomplement(tablea, tableb, digest=[0, 1]))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('B', 2, False),
+              ('C', 9, True))
+    ieq(expect, intersection(tablea, tableb, digest=('foo', 'bar')))
+    ieq(expect, hashintersection(tablea, tableb, digest=('foo', 'bar')))
+
+    tableb = (('bar', 'foo', 'baz'),
+              (7, 'C', False),
+              (1, 'A', False))
+    added, subtracted = recorddiff(tablea, tableb, digest=True)
+    ieq((('bar', 'foo', 'baz'), (1, 'A', False)), added)
+    ieq((('foo', 'bar', 'baz'),
+         ('A', 1, True),
+         ('B', 2, False),
+         ('C', 9, True)), subtracted)
+
+
+def test_capturechanges():
+
+    f = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    f.close()
+    try:
+        table1 = (('id', 'foo', 'bar'),
+                  (1, 'a', True),
+                  (2, 'b', False),
+                  (3, 'c', True))
+        expect = (('id', 'foo', 'bar', 'change'),
+                  (1, 'a', True, 'inserted'),
+                  (2, 'b', False, 'inserted'),
+                  (3, 'c', True, 'inserted'))
+        ieq(expect, capturechanges(table1, 'id', f.name))
+
+        # nothing changed
+        ieq((('id', 'foo', 'bar', 'change'),),
+            capturechanges(table1, 'id', f.name))
+
+        table2 = (('id', 'foo', 'bar'),
+                  (3, 'c', False),
+                  (1, 'a', True),
+                  (4, 'd', True))
+        expect = (('id', 'foo', 'bar', 'change'),
+                  (3, 'c', False, 'updated'),
+                  (1, 'a', True, 'unchanged'),
+                  (4, 'd', True, 'inserted'),
+                  (2, '', '', 'deleted'))
+        ieq(expect, capturechanges(table2, 'id', f.name, unchanged=True,
+                                   missing=''))
+
+        # store was updated, abandoned iteration is rolled back
+        table3 = (('id', 'foo', 'bar'),
+                  (3, 'c', True),
+                  (4, 'd', True))
+        it = iter(capturechanges(table3, 'id', f.name))
+        next(it)
+        next(it)
+        del it
+        expect = (('id', 'foo', 'bar', 'change'),
+                  (3, 'c', True, 'updated'),
+                  (1, None, None, 'deleted'))
+        ieq(expect, capturechanges(table3, 'id', f.name))
+
+        # separately named snapshots, compound keys
+        table4 = (('x', 'y', 'z'),
+                  ('a', 1, 2.5))
+        expect = (('x', 'y', 'z', 'change'),
+                  ('a', 1, 2.5, 'inserted'))
+        ieq(expect, capturechanges(table4, ('x', 'y'), f.name, name='other',
+                                   changefield='change'))
+        expect = (('x', 'y', 'z', 'change'),
+                  ('a', 1, None, 'deleted'))
+        ieq(expect, capturechanges(table4[:1], ('x', 'y'), f.name,
+                                   name='other'))
+
+    finally:
+        os.remove(f.name)
+
+
+def test_hashcomplement_key():
+
+    tablea = (('foo', 'bar', 'baz'),
+              ('A', 1, True),
+              ('B', 2, False),
+              ('B', 2, True),
+              ('C', 7, False))
+    tableb = (('bar', 'foo'),
+              (2, 'B'),
+              (9, 'C'))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, True),
+              ('B', 2, True),
+              ('C', 7, False))
+    ieq(expect, hashcomplement(tablea, tableb, key=('foo', 'bar')))
+    ieq(expect, hashcomplement(tablea, tableb, key=('foo', 'bar'),
+                               digest=True))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('A', 1, True))
+    ieq(expect, hashcomplement(tablea, tableb, key='foo', strict=True))
+
+    expect = (('foo', 'bar', 'baz'),
+              ('B', 2, False),
+              ('C', 7, False))
+    ieq(expect, hashintersection(tablea, tableb, key='foo'))
+    ieq(expect, hashintersection(tablea, tableb, key='foo', digest=True))
+
+
+def test_hashintersection_multi():
+
+    tablea = (('foo', 'bar'),
+              ('A', 1),
+              ('B', 2),
+              ('B', 2),
+              ('C', 3),
+              ('D', 4))
+    tableb = (('foo', 'bar'),
+              ('B', 2),
+              ('B', 2),
+              ('C', 3),
+              ('D', 4))
+    tablec = (('foo', 'bar'),
+              ('D', 4),
+              ('B', 2),
+              ('B', 2),
+              ('A', 1))
+    tabled = (('foo', 'bar'),
+              ('B', 2),
+              ('D', 4),
+              ('B', 2),
+              ('B', 2))
+
+    expect = (('foo', 'bar'),
+              ('B', 2),
+              ('B', 2),
+              ('D', 4))
+    ieq(expect, hashintersection(tablea, tableb, tablec, tabled))
+    ieq(expect, hashintersection(tablea, tableb, tablec, tabled,
+                                 digest=True))
+    ieq(expect, wrap(tablea).hashintersection(tableb, tablec, tabled,
+                                              key='foo'))
+
+    expect = (('foo', 'bar'),
+              ('B', 2),
+              ('D', 4))
+    ieq(expect, hashintersection(tablea, tableb, tablec, tabled[:3]))
@@ -0,0 +1,106 @@
+from __future__ import absolute_import, print_function, division
+
+
+from petl.test.helpers import ieq
+from petl.transform.windows import window, RowNumber, Rank, Lag, Lead, \
+    RollingSum, RollingMean, CumSum
+
+
+def test_window():
+
+    table1 = (('foo', 'day', 'bar'),
+              ('b', 2, 1),
+              ('a', 2, 7),
+              ('a', 1, 3),
+              ('b', 1, 2),
+              ('a', 3, 5),
+              ('b', 3, 9),
+              ('c', 1, 4))
+
+    windows = [('n', RowNumber()),
+               ('lag', Lag('bar')),
+               ('lag2', Lag('bar', n=2, missing=0)),
+               ('lead', Lead('bar')),
+               ('lead2', Lead('bar', n=2, missing=0)),
+               ('rollsum', RollingSum('bar', 2)),
+               ('rollmean', RollingMean('bar', 2)),
+               ('cumsum', CumSum('bar'))]
+    expect = (('foo', 'day', 'bar', 'n', 'lag', 'lag2', 'lead', 'lead2',
+               'rollsum', 'rollmean', 'cumsum'),
+              ('a', 1, 3, 1, None, 0, 7, 5, 3, 3.0, 3),
+              ('a', 2, 7, 2, 3, 0, 5, 0, 10, 5.0, 10),
+              ('a', 3, 5, 3, 7, 3, None, 0, 12, 6.0, 15),
+              ('b', 1, 2, 1, None, 0, 1, 9, 2, 2.0, 2),
+              ('b', 2, 1, 2, 2, 0, 9, 0, 3, 1.5, 3),
+              ('b', 3, 9, 3, 1, 2, None, 0, 10, 5.0, 12),
+              ('c', 1, 4, 1, None, 0, None, 0, 4, 4.0, 4))
+    actual = window(table1, 'foo', windows, order='day')
+    ieq(expect, actual)
+    ieq(expect, actual)
+
+
+def test_window_nokey():
+
+    table1 = (('foo', 'bar'),
+              ('a', 3),
+              ('b', 1),
+              ('c', 3),
+              ('d', 7),
+              ('e', 3))
+
+    windows = [('rank', Rank()),
+               ('denserank', Rank(dense=True)),
+               ('lead', Lead('foo'))]
+    expect = (('foo', 'bar', 'rank', 'denserank', 'lead'),
+              ('b', 1, 1, 1, 'a'),
+              ('a', 3, 2, 2, 'c'),
+              ('c', 3, 2, 2, 'e'),
+              ('e', 3, 2, 2, 'd'),
+              ('d', 7, 5, 3, None))
+    ieq(expect, window(table1, None, windows, order='bar'))
+
+    # presorted, whole rows
+    windows = [('prev', Lag(None)), ('rank', Rank('bar'))]
+    expect = (('foo', 'bar', 'prev', 'rank'),
+              ('a', 3, None, 1),
+              ('b', 1, ('a', 3), 2),
+              ('c', 3, ('b', 1), 3),
+              ('d', 7, ('c', 3), 4),
+              ('e', 3, ('d', 7), 5))
+    ieq(expect, window(table1, None, windows))
+
+
+def test_window_empty():
+
+    table1 = (('foo', 'bar'),)
+    expect = (('foo', 'bar', 'n'),)
+    ieq(expect, window(table1, 'foo', {'n': RowNumber()}, order='bar'))
+
+
+def test_window_rolling_floats():
+
+    table1 = (('foo', 'bar'),
+              ('a', 1e16),
+              ('b', 1.0),
+              ('c', 1.0),
+              ('d', .1),
+              ('e', .2))
+    windows = [('sum', RollingSum('bar', 2)), ('mean', RollingMean('bar', 2))]
+    expect = (('foo', 'bar', 'sum', 'mean'),
+              ('a', 1e16, 1e16, 1e16),
+              ('b', 1.0, 1e16 + 1.0, (1e16 + 1.0) / 2),
+              ('c', 1.0, 2.0, 1.0),
+              ('d', .1, 1.1, .55),
+              ('e', .2, .1 + .2, (.1 + .2) / 2))
+    ieq(expect, window(table1, None, windows))
+
+
+def test_window_n():
+
+    for cls in Lag, Lead, RollingSum:
+        try:
+            cls('bar', 0)
+        except AssertionError:
+            pass
+        else:
+            assert False, 'exception expected'
@@ -0,0 +1,124 @@
+from __future__ import absolute_import, print_function, division
+
+
+from petl.test.helpers import eq_, assert_almost_equal
+from petl.util.aggregators import Count, Sum, Min, Max, Mean, Variance, \
+    First, Last, CountDistinct, CollectList, ApproxCountDistinct, \
+    ApproxQuantiles, HeavyHitters, asaggregator
+
+
+def _merged(agg, *parts):
+    # aggregate each part separately then merge the partial states
+    states = list()
+    for part in parts:
+        state = agg.init()
+        for v in part:
+            state = agg.add(state, v)
+        states.append(state)
+    state = states[0]
+    for other in states[1:]:
+        state = agg.merge(state, other)
+    return agg.finalize(state)
+
+
+def test_aggregators():
+
+    values = [3, 1, 4, 1, 5, 9, 2, 6]
+    eq_(8, Count()(values))
+    eq_(31, Sum()(values))
+    eq_(1, Min()(values))
+    eq_(9, Max()(values))
+    eq_(31/8, Mean()(values))
+    eq_(3, First()(values))
+    eq_(6, Last()(values))
+    eq_(7, CountDistinct()(values))
+    eq_(values, CollectList()(values))
+
+    mean = 31/8
+    m2 = sum((v - mean)**2 for v in values)
+    assert_almost_equal(m2/7, Variance()(values))
+    assert_almost_equal(m2/8, Variance(population=True)(values))
+
+
+def test_aggregators_empty():
+
+    eq_(0, Count()([]))
+    eq_(0, Sum()([]))
+    eq_(None, Min()([]))
+    eq_(None, Max()([]))
+    eq_(None, Mean()([]))
+    eq_(None, Variance()([1]))
+    eq_(None, First()([]))
+    eq_(None, Last()([]))
+    eq_(0, CountDistinct()([]))
+    eq_([], CollectList()([]))
+
+
+def test_aggregators_merge():
+
+    values = [3, 1, 4, 1, 5, 9, 2, 6]
+    parts = [3, 1, 4], [], [1, 5], [9, 2, 6]
+    for agg in (Count(), Sum(), Sum(start=10), Min(), Max(), Mean(), First(),
+                Last(), CountDistinct(), CollectList()):
+        eq_(agg(values), _merged(agg, *parts))
+    assert_almost_equal(Variance()(values), _merged(Variance(), *parts))
+
+
+def test_asaggregator():
+
+    assert isinstance(asaggregator(len), Count)
+    assert isinstance(asaggregator(sum), Sum)
+    assert isinstance(asaggregator(list), CollectList)
+    agg = Mean()
+    assert asaggregator(agg) is agg
+    assert asaggregator(sorted) is None
+
+
+def test_approxcountdistinct():
+
+    values = [i % 3000 for i in range(10000)]
+    agg = ApproxCountDistinct()
+    eq_(0, agg([]))
+    eq_(100, agg(values[:100]))
+    estimate = agg(values)
+    assert abs(estimate - 3000) < 3000 * .05, estimate
+    # merging is exact, whether registers are sparse or dense
+    eq_(estimate, _merged(agg, values[:10], values[10:5000], values[5000:]))
+    estimate = ApproxCountDistinct(precision=8)(values)
+    assert abs(estimate - 3000) < 3000 * .3, estimate
+
+
+def test_approxquantiles():
+
+    values = list(range(101))
+    eq_(50, ApproxQuantiles()(values))
+    eq_((10, 50, 90), ApproxQuantiles(q=(.1, .5, .9))(values))
+    eq_(None, ApproxQuantiles()([]))
+    eq_((None, None), ApproxQuantiles(q=(.1, .9))([]))
+
+    values = [(i * 7919) % 10007 for i in range(10007)]
+    agg = ApproxQuantiles(q=(.1, .5, .9), k=100)
+    for result in (agg(values), _merged(agg, values[:3000], values[3000:])):
+        for q, v in zip((.1, .5, .9), result):
+            assert abs(v - q * 10007) < 10007 * .05, result
+
+
+def test_heavyhitters():
+
+    values = [1] * 50 + list(range(100, 1000)) + [2] * 30 + [3] * 20
+    expect = [(1, 50), (2, 30), (3, 20)]
+    eq_(expect, HeavyHitters(n=3)(values))
+    eq_(expect, _merged(HeavyHitters(n=3), values[:500], values[500:]))
+    eq_([], HeavyHitters()([]))
+
+    # counts are overestimated rather than underestimated
+    for v, c in HeavyHitters(n=3, width=16, depth=2)(values):
+        assert c >= values.count(v)
+
+    # counters are only allocated for the values added
+    agg = HeavyHitters()
+    state = agg.init()
+    for v in 'aab':
+        state = agg.add(state, v)
+    assert len(state[0]) <= 2 * agg.depth
+    eq_([('a', 2), ('b', 1)], agg.finalize(state))
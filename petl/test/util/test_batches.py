@@ -0,0 +1,121 @@
+from __future__ import absolute_import, print_function, division
+
+
+from petl.test.helpers import ieq, eq_
+from petl.compat import next
+from petl.util.base import wrap
+from petl.util.batches import iterbatches, iterbatchrows, batchcolumns
+from petl.transform.basics import cut, cutout, addfield, stack
+from petl.transform.conversions import convert
+from petl.transform.selects import select, selectgt
+from petl.transform.headers import rename, setheader
+
+
+def _check_batches(expect, table, sizes=(1, 2, 100)):
+    for size in sizes:
+        batches = list(iterbatches(table, size))
+        for cols in batches[1:]:
+            assert 0 < len(cols[0]) <= size
+            assert all(len(c) == len(cols[0]) for c in cols)
+        ieq(expect, iterbatchrows(batches))
+
+
+def test_iterbatches():
+
+    table = (('foo', 'bar'),
+             ('a', 1),
+             ('b', 2),
+             ('c',),
+             ('d', 4, True))
+    it = iterbatches(table, 2)
+    eq_(('foo', 'bar'), next(it))
+    eq_([['a', 'b'], [1, 2]], next(it))
+    eq_([['c', 'd'], [None, 4]], next(it))
+    eq_([], list(it))
+
+    eq_([('foo', 'bar'), [['c'], [0]]],
+        list(iterbatches(table[:1] + table[3:4], missing=0)))
+    _check_batches(stack(table), table)
+    eq_([], list(iterbatches([])))
+
+
+def test_batchcolumns():
+
+    eq_([['a', 'b'], [1, None]], batchcolumns([('a', 1), ('b',)], 2))
+    eq_([['a'], [None], [None]], batchcolumns([('a',)], 3))
+    eq_([[None, None]], batchcolumns([(), ()], 1))
+    eq_([['a', 'b'], [1, 2]], batchcolumns([('a', 1), ('b', 2)], 2,
+                                           strict=True))
+    for rows in [('a', 1), ('b',)], [('a', 1), ('b', 2, True)]:
+        try:
+            batchcolumns(rows, 2, strict=True)
+        except ValueError:
+            pass  # expected
+        else:
+            assert False, 'expected exception'
+
+
+def test_iterbatches_strict():
+
+    table = (('foo', 'bar'),
+             ('a', 1),
+             ('b',))
+    for t in table, convert(table, 'bar', str):
+        it = iterbatches(t, 1, strict=True)
+        eq_(('foo', 'bar'), next(it))
+        eq_([['a'], [1 if t is table else '1']], next(it))
+        try:
+            next(it)
+        except ValueError:
+            pass  # expected
+        else:
+            assert False, 'expected exception'
+
+    # rows of cut tables are padded anyway
+    eq_([('foo', 'bar'), [['a', 'b'], [1, None]]],
+        list(iterbatches(cut(table, 'foo', 'bar'), strict=True)))
+
+
+def test_transform_batches():
+
+    table = (('foo', 'bar', 'baz'),
+             ('a', 4, 9.3),
+             ('a', 2, 88.2),
+             ('b', 1, 23.3),
+             ('c', 8, 42.0),
+             ('d', 7, 100.9),
+             ('c', 2))
+
+    t1 = convert(cut(table, 'bar', 'foo'), 'bar', lambda v: v * 10)
+    _check_batches(t1, t1)
+    t2 = cutout(t1, 'foo')
+    _check_batches(t2, t2)
+    t3 = addfield(t1, 'quux', lambda rec: rec.foo * 2)
+    _check_batches(t3, t3)
+    t4 = addfield(t1, 'quux', 42, index=0)
+    _check_batches(t4, t4)
+    t5 = selectgt(select(t4, "{foo} != 'b'"), 'bar', 20)
+    _check_batches(t5, t5)
+    t6 = rename(setheader(t5, ('a', 'b', 'c')), 'a', 'x')
+    eq_(('x', 'b', 'c'), next(iterbatches(t6)))
+    _check_batches(t6, t6)
+
+    # errors in conversions, N.B., short rows are padded before conversion
+    t7 = convert(table, 'baz', int, errorvalue='NA')
+    ieq(convert(stack(table), 'baz', int, errorvalue='NA'),
+        iterbatchrows(iterbatches(t7, 2)))
+    t7 = convert(table[:-1], 'baz', lambda v: int(v) // 0, errorvalue='NA')
+    _check_batches(stack(t7), t7)
+
+    # conversions using whole rows fall back to row iteration
+    t8 = convert(table, 'bar', lambda v, row: row.foo * v, pass_row=True)
+    _check_batches(stack(t8), t8)
+    t9 = convert(table, 'bar', lambda v: -v, where="{foo} == 'c'")
+    _check_batches(stack(t9), t9)
+
+
+def test_table_iterbatches():
+
+    table = wrap((('foo', 'bar'), ('a', 1), ('b', 2)))
+    eq_([('foo', 'bar'), [['a', 'b'], [1, 2]]],
+        list(table.cut('foo', 'bar').iterbatches(10)))
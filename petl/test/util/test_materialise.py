@@ -1,8 +1,8 @@
 from __future__ import absolute_import, print_function, division
 
 
-from petl.test.helpers import eq_
-from petl.util.materialise import columns, facetcolumns
+from petl.test.helpers import eq_, ieq
+from petl.util.materialise import columns, facetcolumns, indexed
 
 
 def test_columns():
@@ -27,3 +27,35 @@ def test_facetcolumns():
     eq_(['b', 'b'], fc['b']['foo'])
     eq_([2, 3], fc['b']['bar'])
     eq_([True, None], fc['b']['baz'])
+
+
+def test_indexed():
+
+    table = [('foo', 'bar'), ('a', 1), ('b', 2), ('b', 3), ('c',)]
+    calls = [0]
+
+    def source():
+        calls[0] += 1
+        return iter(table)
+
+    class Source(object):
+        def __iter__(self):
+            return source()
+
+    tbl = indexed(Source(), 'foo')
+    ieq(table, tbl)
+    ieq(table, tbl)
+    eq_(1, calls[0])
+    eq_([1, 2], tbl.getindex('foo').eq('b'))
+    eq_([1, 2, 3], tbl.getindex(0).isin(['b', 'c']))
+    assert tbl.getindex('foo', kinds=('sorted',)) is None
+    assert tbl.getindex('bar') is None
+
+    # indexes share cached rows
+    tbl2 = tbl.indexed('bar', kind='sorted')
+    ieq(table, tbl2)
+    eq_(1, calls[0])
+    index = tbl2.getindex('bar')
+    eq_([0, 1, 3], index.range(None, (3,), False, False))
+    eq_([1, 2], index.range((2,), None, True, False))
+    eq_([3], index.eq(None))
@@ -0,0 +1,69 @@
+from __future__ import absolute_import, print_function, division
+
+
+from petl.test.helpers import eq_
+from petl.errors import ArgumentError
+from petl.util.parallel import iterchunks, iterparallel, iterparallelmap, \
+    _checkpicklable
+
+
+def _square(x):
+    return x * x
+
+
+def test_iterchunks():
+
+    eq_([[0, 1, 2], [3, 4, 5], [6]], list(iterchunks(range(7), 3)))
+    eq_([], list(iterchunks([], 3)))
+
+
+def test_iterparallel():
+
+    actual = list(iterparallel(_square, range(20), 2, maxinflight=3))
+    eq_([x * x for x in range(20)], actual)
+
+    # closing early should not hang
+    it = iterparallel(_square, range(20), 2)
+    eq_(0, next(it))
+    it.close()
+
+
+def _reciprocal(x):
+    return 1 / x
+
+
+def test_iterparallel_unordered():
+
+    actual = list(iterparallel(_square, range(20), 2, maxinflight=3,
+                               ordered=False))
+    eq_([x * x for x in range(20)], sorted(actual))
+
+    # errors are raised in the calling process
+    try:
+        list(iterparallel(_reciprocal, [1, 2, 0, 4], 2, ordered=False))
+    except ZeroDivisionError:
+        pass
+    else:
+        assert False, 'exception expected'
+
+
+def _adder(n):
+    return lambda x: x + n
+
+
+def test_iterparallelmap():
+
+    actual = list(iterparallelmap(_adder, (2,), range(20), 2, chunksize=3))
+    eq_([x + 2 for x in range(20)], actual)
+    eq_([], list(iterparallelmap(_adder, (2,), [], 2)))
+
+
+def test_checkpicklable():
+
+    _checkpicklable((_adder, (2,)))
+    try:
+        _checkpicklable((lambda x: x, ()))
+    except ArgumentError:
+        pass
+    else:
+        assert False, 'exception expected'
@@ -1,9 +1,15 @@
 from __future__ import absolute_import, print_function, division
 
 
+import datetime
+
+
 from petl.compat import maxint
+from petl.errors import ArgumentError
 from petl.test.helpers import eq_
-from petl.util.parsers import numparser, datetimeparser
+from petl.util.parsers import numparser, datetimeparser, dateparser, \
+    timeparser, memoized, isodatetimeparser, isodateparser, isotimeparser, \
+    MemoizedFunction, _fromisoformat
 
 
 def test_numparser():
@@ -55,3 +61,142 @@ def test_laxparsers():
         assert False, 'did not expect exception'
     else:
         eq_('2002-12-25 00:00:00', v)
+
+
+def test_memoized():
+
+    calls = []
+
+    def f(v):
+        calls.append(v)
+        return int(v)
+
+    g = memoized(f, maxsize=2)
+    eq_([1, 2, 1, 1, 3, 1, 2], [g(v) for v in '1211312'])
+    eq_(['1', '2', '3', '2'], calls)
+    eq_((3, 4), (g.hits, g.misses))
+    eq_(3 / 7, g.hitrate)
+
+    # values of different types and unhashable values are kept apart
+    g = memoized(repr)
+    eq_(['1', '1.0', 'True', '[1]', '[1]'],
+        [g(v) for v in (1, 1.0, True, [1], [1])])
+    eq_(0, g.hits)
+
+    # errors are not cached
+    g = memoized(f)
+    for _ in range(2):
+        try:
+            g('x')
+        except ValueError:
+            pass
+        else:
+            assert False, 'exception expected'
+    eq_(2, g.misses)
+
+
+def test_memoize_sizes():
+
+    # a size of 0 is off, as for convert()
+    parse = numparser(memoize=0)
+    eq_(1, parse('1'))
+    assert not isinstance(parse, MemoizedFunction)
+    eq_(2, numparser(memoize=1)('2'))
+    for f, kwargs in ((numparser, dict(memoize=-1)),
+                      (memoized, dict(f=int, maxsize=0))):
+        try:
+            f(**kwargs)
+        except ArgumentError:
+            pass
+        else:
+            assert False, 'exception expected'
+
+    parsenumber = numparser(memoize=True)
+    eq_([1, 2.5, 1], [parsenumber(v) for v in ('1', '2.5', '1')])
+    eq_(1, parsenumber.hits)
+
+
+def test_fixedwidthparsers():
+
+    # fixed width formats are parsed by slicing, other values by strptime
+    cases = (('%Y-%m-%d %H:%M:%S', datetimeparser,
+              ('2002-12-25 13:45:59', ' 2002-12-25 13:45:59 ',
+               '2002-12-25  13:45:59', '2002-1-5 3:04:05',
+               '2002-12-25 24:00:00', '2002-02-30 00:00:00',
+               '2002-12-25 13:45', 'x')),
+             ('%Y%m%d', dateparser, ('20021225', '2002125', '20021325', '')),
+             ('%d/%m/%Y', dateparser,
+              ('25/12/2002', '5/1/2002', '31/02/2002')),
+             ('%H%M', timeparser, ('1345', '2500', '13:45')),
+             ('%Y%%%m', dateparser, ('2002%12', '2002-12')),
+             # fields not returned are still checked
+             ('%Y-%m-%d %H:%M:%S', dateparser,
+              ('2002-12-25 13:45:59', '2002-12-25 25:00:00')),
+             ('%Y-%m-%d %H:%M:%S', timeparser,
+              ('2002-12-25 10:00:00', '2002-13-45 10:00:00')))
+    for fmt, f, values in cases:
+        parse = f(fmt)
+        for v in values:
+            try:
+                expect = datetime.datetime.strptime(v.strip(), fmt)
+            except ValueError:
+                try:
+                    parse(v)
+                except ValueError:
+                    pass
+                else:
+                    assert False, 'exception expected for %r' % v
+            else:
+                if f is dateparser:
+                    expect = expect.date()
+                elif f is timeparser:
+                    expect = expect.time()
+                eq_(expect, parse(v))
+
+    eq_('x', datetimeparser('%Y%m%d', strict=False)('x'))
+
+
+def test_isoparsers():
+
+    eq_(datetime.datetime(2002, 12, 25, 13, 45, 0, 500000),
+        isodatetimeparser()(' 2002-12-25T13:45:00.5 '))
+    eq_(datetime.date(2002, 12, 25), isodateparser()('2002-12-25'))
+    eq_(datetime.time(13, 45), isotimeparser()('13:45'))
+    eq_('x', isodateparser(strict=False)('x'))
+    try:
+        isodateparser()('x')
+    except ValueError:
+        pass
+    else:
+        assert False, 'exception expected'
+
+    # only the documented forms, whichever forms fromisoformat accepts
+    for v in ('2002-W52-3', '20021225T1345', '2002-12-25T13:45+00:00',
+              '2002-12-25x13:45', '2002-12-25T13', u'\uff12002-12-25'):
+        try:
+            isodatetimeparser()(v)
+        except ValueError:
+            pass
+        else:
+            assert False, 'exception expected'
+    eq_(datetime.datetime(2002, 12, 25, 13, 45, 0, 123000),
+        isodatetimeparser()('2002-12-25T13:45:00.123'))
+    eq_(datetime.time(13, 45, 0, 12), isotimeparser()('13:45:00.000012'))
+
+    # fallback where fromisoformat is not available
+    parse = _fromisoformat(datetime.datetime, native=False)
+    eq_(datetime.datetime(2002, 12, 25), parse('2002-12-25'))
+    eq_(datetime.datetime(2002, 12, 25, 13, 45), parse('2002-12-25 13:45'))
+    eq_(datetime.datetime(2002, 12, 25, 13, 45, 1, 120000),
+        parse('2002-12-25T13:45:01.12'))
+    eq_(datetime.date(2002, 12, 25),
+        _fromisoformat(datetime.date, native=False)('2002-12-25'))
+    eq_(datetime.time(13, 45, 1, 1),
+        _fromisoformat(datetime.time, native=False)('13:45:01.000001'))
+    for v in ('2002-12-25x', '2002-12-32'):
+        try:
+            parse(v)
+        except ValueError:
+            pass
+        else:
+            assert False, 'exception expected'
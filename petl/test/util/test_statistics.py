@@ -2,7 +2,8 @@ from __future__ import absolute_import, print_function, division
 
 
 from petl.test.helpers import eq_
-from petl.util.statistics import stats
+from petl.util.statistics import stats, approxcountdistinct, \
+    approxquantiles, heavyhitters
 
 
 def test_stats():
@@ -23,3 +24,13 @@ def test_stats():
     eq_(2.0, result.mean)
     eq_(2/3, result.pvariance)
     eq_((2/3)**.5, result.pstdev)
+
+
+def test_approx_statistics():
+
+    table = [('foo', 'bar')] + [('a', i % 10) for i in range(100)]
+    eq_(10, approxcountdistinct(table, 'bar'))
+    eq_((2, 4, 7), approxquantiles(table, 'bar'))
+    eq_(9, approxquantiles(table, 'bar', q=1))
+    eq_(10, len(heavyhitters(table, 'bar')))
+    eq_([10], list(set(c for _, c in heavyhitters(table, 'bar'))))
@@ -8,8 +8,8 @@ from petl.transform.headers import rename, setheader, extendheader, \
     pushheader, skip, prefixheader, suffixheader, sortheader
 
 from petl.transform.conversions import convert, convertall, replace, \
-    replaceall, update, convertnumbers, format, formatall, interpolate, \
-    interpolateall
+    replaceall, update, convertnumbers, convertdates, format, formatall, \
+    interpolate, interpolateall
 
 from petl.transform.sorts import sort, mergesort, issorted
 
@@ -18,7 +18,8 @@ from petl.transform.selects import select, selectop, selectcontains, \
     selectisinstance, selectisnot, selectle, selectlt, selectne, selectnone, \
     selectnotin, selectnotnone, selectrangeclosed, selectrangeopen, \
     selectrangeopenleft, selectrangeopenright, selecttrue, \
-    selectusingcontext, rowlenselect, facet, biselect
+    selectusingcontext, rowlenselect, facet, biselect, partition, \
+    bipartition, tofacets
 
 from petl.transform.joins import join, leftjoin, rightjoin, outerjoin, \
     crossjoin, antijoin, lookupjoin, unjoin
@@ -28,7 +29,12 @@ from petl.transform.hashjoins import hashjoin, hashleftjoin, hashrightjoin, \
 
 from petl.transform.reductions import rowreduce, mergeduplicates,\
     aggregate, groupcountdistinctvalues, groupselectfirst, groupselectmax, \
-    groupselectmin, merge, fold, Conflict, groupselectlast
+    groupselectmin, merge, fold, Conflict, groupselectlast, hashrowreduce, \
+    hashaggregate, hashmergeduplicates, hashfold, hashgroupselectfirst, \
+    hashgroupselectlast, hashgroupselectmin, hashgroupselectmax
+
+from petl.transform.windows import window, WindowFunction, RowNumber, Rank, \
+    Lag, Lead, RollingSum, RollingMean, CumSum
 
 from petl.transform.fills import filldown, fillright, fillleft
 
@@ -43,10 +49,11 @@ from petl.transform.maps import fieldmap, rowmap, rowmapmany, rowgroupmap
 from petl.transform.unpacks import unpack, unpackdict
 
 from petl.transform.dedup import duplicates, unique, distinct, conflicts, \
-    isunique
+    isunique, hashdistinct, hashunique, hashduplicates, bloomdistinct
 
 from petl.transform.setops import complement, intersection, \
-    recordcomplement, diff, recorddiff, hashintersection, hashcomplement
+    recordcomplement, diff, recorddiff, hashintersection, hashcomplement, \
+    capturechanges
 
 from petl.transform.intervals import intervaljoin, intervalleftjoin, \
     intervaljoinvalues, intervalantijoin, intervallookup, intervallookupone, \
@@ -55,3 +62,5 @@ from petl.transform.intervals import intervaljoin, intervalleftjoin, \
     facetintervalrecordlookupone, collapsedintervals
 
 from petl.transform.validation import validate
+
+from petl.transform.fusion import optimize
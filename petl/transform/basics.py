@@ -4,11 +4,14 @@ from __future__ import absolute_import, print_function, division
 # standard library dependencies
 from itertools import islice, chain
 from collections import deque
-from petl.compat import izip, izip_longest, next, count, string_types, text_type
+from petl.compat import izip, izip_longest, next, count, string_types, \
+    text_type, integer_types
 
 
 # internal dependencies
 from petl.util.base import asindices, rowgetter, Record, Table
+from petl.util.batches import iterbatches, iterrowbatches, batchrows
+from petl.util.parallel import iterparallelmap
 
 
 import logging
@@ -99,6 +102,11 @@ def cut(table, *args, **kwargs):
     Note that any short rows will be padded with `None` values (or whatever is
     provided via the `missing` keyword argument).
 
+    If the table is read directly from a delimited file via
+    :func:`petl.io.csv.fromcsv`, the file is read keeping only the chosen
+    fields, see the `fields` argument to :func:`petl.io.csv.fromcsv`. The
+    same is done for :func:`petl.transform.basics.cutout`.
+
     See also :func:`petl.transform.basics.cutout`.
 
     """
@@ -107,6 +115,13 @@ def cut(table, *args, **kwargs):
     if len(args) == 1 and isinstance(args[0], (list, tuple)):
         args = args[0]
 
+    # tables which can read only some fields do so, e.g., fromcsv()
+    project = getattr(table, '_project', None)
+    if project is not None:
+        projected = project(args, **kwargs)
+        if projected is not None:
+            return projected
+
     return CutView(table, args, **kwargs)
 
 
@@ -115,6 +130,10 @@ Table.cut = cut
 
 class CutView(Table):
 
+    # rows always have the same length as the header, see
+    # petl.util.batches.fixedrows()
+    _fixedrows = True
+
     def __init__(self, source, spec, missing=None):
         self.source = source
         self.spec = spec
@@ -123,6 +142,21 @@ class CutView(Table):
     def __iter__(self):
         return itercut(self.source, self.spec, self.missing)
 
+    def _iterbatches(self, size, missing):
+        batches = iterbatches(self.source, size, self.missing)
+        hdr = next(batches)
+        indices = asindices(hdr, tuple(self.spec))
+        return _itercutbatches(batches, hdr, indices)
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        spec, missing = tuple(self.spec), self.missing
+
+        def steps(hdr):
+            return _cutsteps(hdr, asindices(hdr, spec), missing)
+
+        return self.source, steps
+
 
 def itercut(source, spec, missing=None):
     it = iter(source)
@@ -148,6 +182,26 @@ def itercut(source, spec, missing=None):
             yield tuple(row[i] if i < len(row) else missing for i in indices)
 
 
+def _cutsteps(hdr, indices, missing):
+    # output header and row function for fused cut or cutout
+    transform = rowgetter(*indices)
+
+    def cutrow(row):
+        try:
+            return transform(row)
+        except IndexError:
+            # short row, fill in any missing fields
+            return tuple(row[i] if i < len(row) else missing for i in indices)
+
+    return transform(hdr), [(False, cutrow)]
+
+
+def _itercutbatches(batches, hdr, indices):
+    yield tuple(hdr[i] for i in indices)
+    for cols in batches:
+        yield [cols[i] for i in indices]
+
+
 def cutout(table, *args, **kwargs):
     """
     Remove fields. E.g.::
@@ -179,6 +233,12 @@ def cutout(table, *args, **kwargs):
 
     """
 
+    project = getattr(table, '_project', None)
+    if project is not None:
+        projected = project(args, complement=True, **kwargs)
+        if projected is not None:
+            return projected
+
     return CutOutView(table, args, **kwargs)
 
 
@@ -187,6 +247,10 @@ Table.cutout = cutout
 
 class CutOutView(Table):
 
+    # rows always have the same length as the header, see
+    # petl.util.batches.fixedrows()
+    _fixedrows = True
+
     def __init__(self, source, spec, missing=None):
         self.source = source
         self.spec = spec
@@ -195,6 +259,24 @@ class CutOutView(Table):
     def __iter__(self):
         return itercutout(self.source, self.spec, self.missing)
 
+    def _iterbatches(self, size, missing):
+        batches = iterbatches(self.source, size, self.missing)
+        hdr = next(batches)
+        indicesout = asindices(hdr, tuple(self.spec))
+        indices = [i for i in range(len(hdr)) if i not in indicesout]
+        return _itercutbatches(batches, hdr, indices)
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        spec, missing = tuple(self.spec), self.missing
+
+        def steps(hdr):
+            indicesout = asindices(hdr, spec)
+            indices = [i for i in range(len(hdr)) if i not in indicesout]
+            return _cutsteps(hdr, indices, missing)
+
+        return self.source, steps
+
 
 def itercutout(source, spec, missing=None):
     it = iter(source)
@@ -464,7 +546,8 @@ def iterstack(sources, missing, trim, pad):
             yield outrow
 
 
-def addfield(table, field, value=None, index=None, missing=None):
+def addfield(table, field, value=None, index=None, missing=None,
+             workers=None, chunksize=None):
     """
     Add a field with a fixed or calculated value. E.g.::
 
@@ -501,10 +584,16 @@ def addfield(table, field, value=None, index=None, missing=None):
 
     Use the `index` parameter to control the position of the inserted field.
 
+    If `workers` is given, calculated values are computed in parallel by a
+    pool of `workers` processes, in chunks of `chunksize` rows (by default
+    `petl.config.parallel_chunksize`), and rows are output in the same order
+    as the input. The function must be picklable where processes are spawned
+    rather than forked (e.g., on Windows).
+
     """
 
     return AddFieldView(table, field, value=value, index=index,
-                        missing=missing)
+                        missing=missing, workers=workers, chunksize=chunksize)
 
 
 Table.addfield = addfield
@@ -512,18 +601,47 @@ Table.addfield = addfield
 
 class AddFieldView(Table):
 
-    def __init__(self, source, field, value=None, index=None, missing=None):
+    def __init__(self, source, field, value=None, index=None, missing=None,
+                 workers=None, chunksize=None):
         # ensure rows are all the same length
         self.source = stack(source, missing=missing)
         self.field = field
         self.value = value
         self.index = index
+        self.missing = missing
+        self.workers = workers
+        self.chunksize = chunksize
 
     def __iter__(self):
-        return iteraddfield(self.source, self.field, self.value, self.index)
-
-
-def iteraddfield(source, field, value, index):
+        return iteraddfield(self.source, self.field, self.value, self.index,
+                            self.missing, self.workers, self.chunksize)
+
+    def _iterbatches(self, size, missing):
+        if self.workers:
+            return iterrowbatches(self, size, missing)
+        # N.B., batches are padded to the header length like stack()
+        return iteraddfieldbatches(self.source.sources[0], self.field,
+                                   self.value, self.index, size,
+                                   self.missing)
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        if self.workers:
+            return None
+
+        def steps(hdr):
+            outhdr = list(hdr)
+            outhdr.insert(len(hdr) if self.index is None else self.index,
+                          self.field)
+            return tuple(outhdr), [(False, _addfielder(
+                hdr, self.value, self.index, self.missing
+            ))]
+
+        return self.source.sources[0], steps
+
+
+def iteraddfield(source, field, value, index, missing=None, workers=None,
+                 chunksize=None):
     it = iter(source)
     hdr = next(it)
     flds = list(map(text_type, hdr))
@@ -537,7 +655,11 @@ def iteraddfield(source, field, value, index):
     outhdr.insert(index, field)
     yield tuple(outhdr)
 
-    if callable(value):
+    if workers:
+        args = (hdr, value, index, missing)
+        for row in iterparallelmap(_addfielder, args, it, workers, chunksize):
+            yield row
+    elif callable(value):
         # wrap rows as records if using calculated value
         it = (Record(row, flds) for row in it)
         for row in it:
@@ -552,6 +674,48 @@ def iteraddfield(source, field, value, index):
             yield tuple(outrow)
 
 
+def _addfielder(hdr, value, index, missing):
+    # returns a function adding a value to a data row, where rows are padded or
+    # truncated like stack()
+    flds = list(map(text_type, hdr))
+    n = len(hdr)
+    if index is None:
+        index = n
+
+    def addfieldrow(row):
+        outrow = list(row[:n])
+        if len(outrow) < n:
+            outrow.extend([missing] * (n - len(outrow)))
+        if callable(value):
+            v = value(Record(outrow, flds))
+        else:
+            v = value
+        outrow.insert(index, v)
+        return tuple(outrow)
+
+    return addfieldrow
+
+
+def iteraddfieldbatches(source, field, value, index, size, missing):
+    batches = iterbatches(source, size, missing)
+    hdr = next(batches)
+    flds = list(map(text_type, hdr))
+    if index is None:
+        index = len(hdr)
+    outhdr = list(hdr)
+    outhdr.insert(index, field)
+    yield tuple(outhdr)
+
+    for cols in batches:
+        if callable(value):
+            col = [value(Record(row, flds)) for row in batchrows(cols)]
+        else:
+            col = [value] * len(cols[0]) if cols else []
+        cols = list(cols)
+        cols.insert(index, col)
+        yield cols
+
+
 def rowslice(table, *sliceargs):
     """
     Choose a subsequence of data rows. E.g.::
@@ -600,6 +764,10 @@ def rowslice(table, *sliceargs):
     Positional arguments are used to slice the data rows. The `sliceargs` are
     passed through to :func:`itertools.islice`.
 
+    If the table is read from a file with a row index, e.g., via the `index`
+    argument to :func:`petl.io.csv.fromcsv`, reading starts from the nearest
+    indexed row before the start of the slice.
+
     See also :func:`petl.transform.basics.head`,
     :func:`petl.transform.basics.tail`.
 
@@ -625,12 +793,45 @@ class RowSliceView(Table):
 
 
 def iterrowslice(source, sliceargs):
-    it = iter(source)
+    s = slice(*sliceargs)
+    it = None
+    if _isindex(s.start) and s.start > 0 \
+            and (s.stop is None or _isindex(s.stop)):
+        # tables with a row index can start reading at the first row needed,
+        # other arguments (e.g., negative) are left to islice() to reject
+        it = _iterfrom(source, s.start)
+    if it is None:
+        it = iter(source)
+    else:
+        stop = None if s.stop is None else max(s.stop - s.start, 0)
+        sliceargs = 0, stop, s.step
     yield tuple(next(it))  # fields
     for row in islice(it, *sliceargs):
         yield tuple(row)
 
 
+def _isindex(v):
+    return isinstance(v, integer_types) and v >= 0
+
+
+def _nrows(source):
+    # the number of data rows, if the table can count them without reading
+    # them, otherwise None
+    nrows = getattr(source, '_nrows', None)
+    if nrows is None:
+        return None
+    return nrows()
+
+
+def _iterfrom(source, n):
+    # iterate over the header then data rows from row n, if the table can do
+    # so without reading the rows before n, otherwise return None
+    iterfrom = getattr(source, '_iterfrom', None)
+    if iterfrom is None:
+        return None
+    return iterfrom(n)
+
+
 def head(table, n=5):
     """
     Select the first `n` data rows. E.g.::
@@ -699,6 +900,9 @@ def tail(table, n=5):
         | 'q' |   2 |
         +-----+-----+
 
+    If the table is read from a file with a row index, e.g., via the `index`
+    argument to :func:`petl.io.csv.fromcsv`, only the last rows are read.
+
     See also :func:`petl.transform.basics.head`,
     :func:`petl.transform.basics.rowslice`.
 
@@ -721,7 +925,12 @@ class TailView(Table):
 
 
 def itertail(source, n):
-    it = iter(source)
+    it = None
+    count = _nrows(source)
+    if count is not None:
+        it = _iterfrom(source, max(count - n, 0))
+    if it is None:
+        it = iter(source)
     yield tuple(next(it))  # fields
     cache = deque()
     for row in it:
@@ -1,12 +1,16 @@
 from __future__ import absolute_import, print_function, division
 
 
+from itertools import islice
 from petl.compat import next, integer_types, string_types, text_type
 
 
 from petl.errors import ArgumentError, FieldSelectionError
-from petl.util.base import Table, expr, header, Record
-from petl.util.parsers import numparser
+from petl.util.base import Table, expr, header, Record, asindices
+from petl.util.batches import iterbatches, iterrowbatches
+from petl.util.parsers import numparser, dateparser, datetimeparser, \
+    isodateparser, isodatetimeparser, isotimeparser, _memoize
+from petl.util.parallel import iterparallelmap
 
 
 def convert(table, *args, **kwargs):
@@ -165,6 +169,27 @@ def convert(table, *args, **kwargs):
     arguments to the conversion function (so, i.e., the conversion function
     should accept two arguments).
 
+    The ``memoize`` keyword argument can be given as True or a cache size, in
+    which case the results of each conversion function are cached for the
+    most recently converted distinct values of each field, saving repeated
+    conversion of the same values, see :func:`petl.util.parsers.memoized`.
+    The caches of the most recent iteration over the table are available via
+    its ``memos`` attribute, a dictionary mapping field names to memoized
+    functions with cache statistics. E.g.::
+
+        >>> table2 = etl.convert(table1, 'bar', float, memoize=True)
+        >>> etl.nrows(table2)
+        3
+        >>> table2.memos['bar'].hits, table2.memos['bar'].misses
+        (0, 3)
+
+    The ``workers`` keyword argument can be given, in which case rows are
+    converted in parallel by a pool of `workers` processes, in chunks of
+    ``chunksize`` rows (by default `petl.config.parallel_chunksize`), and
+    output in the same order as the input. Conversion functions must be
+    picklable where processes are spawned rather than forked (e.g., on
+    Windows), and rows and converted values must be picklable.
+
     """
 
     converters = None
@@ -284,10 +309,85 @@ def convertnumbers(table, strict=False, **kwargs):
 Table.convertnumbers = convertnumbers
 
 
+def convertdates(table, fields, sample=1000, **kwargs):
+    """
+    Convenience function to convert date, datetime or time strings under the
+    given field(s), choosing a parser for each field which can parse all
+    values in a sample of the rows. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar', 'baz'],
+        ...           ['a', '2002-12-25', '25/12/2002'],
+        ...           ['b', '2002-12-26 09:30:00', '31/12/2002'],
+        ...           ['c', '', None]]
+        >>> table2 = etl.convertdates(table1, ('bar', 'baz'))
+        >>> for row in table2:
+        ...     print(row)
+        ...
+        ('foo', 'bar', 'baz')
+        ('a', datetime.datetime(2002, 12, 25, 0, 0), datetime.date(2002, 12, 25))
+        ('b', datetime.datetime(2002, 12, 26, 9, 30), datetime.date(2002, 12, 31))
+        ('c', None, None)
+
+    The first `sample` rows are read to choose parsers. Candidate parsers are
+    tried in order, fastest first: ISO 8601 dates, then ISO 8601 datetimes
+    (see :func:`petl.util.parsers.isodateparser` and
+    :func:`petl.util.parsers.isodatetimeparser`), then the fixed width
+    formats ``%Y%m%d``, ``%d/%m/%Y``, ``%m/%d/%Y``, ``%Y/%m/%d``,
+    ``%d.%m.%Y``, ``%Y%m%d%H%M%S``, ``%d/%m/%Y %H:%M:%S``,
+    ``%m/%d/%Y %H:%M:%S`` and ``%Y/%m/%d %H:%M:%S``, then ISO 8601 times.
+    Empty strings and values which are not strings are ignored when
+    choosing a parser. Fields for which no candidate can parse all sampled
+    values are not converted.
+
+    Any keyword arguments are passed through to
+    :func:`petl.transform.conversions.convert`, e.g., `errorvalue` for values
+    which can't be parsed by the chosen parser (by default None), or
+    `memoize`.
+
+    """
+
+    it = iter(table)
+    hdr = next(it)
+    rows = list(islice(it, sample))
+    converters = dict()
+    for i in asindices(hdr, fields):
+        values = [row[i] for row in rows
+                  if i < len(row) and isinstance(row[i], string_types)
+                  and row[i].strip()]
+        if not values:
+            continue
+        for parser in _dateparsers():
+            try:
+                for v in values:
+                    parser(v)
+            except Exception:
+                continue
+            converters[i] = parser
+            break
+    return convert(table, converters, **kwargs)
+
+
+Table.convertdates = convertdates
+
+
+def _dateparsers():
+    # candidate parsers for convertdates(), fastest first
+    yield isodateparser()
+    yield isodatetimeparser()
+    for fmt in ('%Y%m%d', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d', '%d.%m.%Y'):
+        yield dateparser(fmt)
+    for fmt in ('%Y%m%d%H%M%S', '%d/%m/%Y %H:%M:%S', '%m/%d/%Y %H:%M:%S',
+                '%Y/%m/%d %H:%M:%S'):
+        yield datetimeparser(fmt)
+    yield isotimeparser()
+
+
 class FieldConvertView(Table):
 
     def __init__(self, source, converters=None, failonerror=False,
-                 errorvalue=None, where=None, pass_row=False):
+                 errorvalue=None, where=None, pass_row=False, workers=None,
+                 chunksize=None, memoize=False):
         self.source = source
         if converters is None:
             self.converters = dict()
@@ -301,25 +401,194 @@ class FieldConvertView(Table):
         self.errorvalue = errorvalue
         self.where = where
         self.pass_row = pass_row
+        self.workers = workers
+        self.chunksize = chunksize
+        if memoize and pass_row:
+            raise ArgumentError('cannot memoize converters passed rows')
+        self.memoize = memoize
+        # memoized converters by field, from the most recent iteration
+        self.memos = dict()
 
     def __iter__(self):
         return iterfieldconvert(self.source, self.converters, self.failonerror,
-                                self.errorvalue, self.where, self.pass_row)
+                                self.errorvalue, self.where, self.pass_row,
+                                self.workers, self.chunksize, self.memoize,
+                                self.memos)
+
+    def _iterbatches(self, size, missing):
+        if self.where is not None or self.pass_row or self.workers:
+            # conversion depends on whole rows, or is done in parallel
+            return iterrowbatches(self, size, missing)
+        return iterfieldconvertbatches(self.source, self.converters,
+                                       self.failonerror, self.errorvalue,
+                                       size, missing, self.memoize,
+                                       self.memos)
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        if self.workers:
+            return None
+
+        def steps(hdr):
+            return tuple(hdr), [(False, _fieldconverter(
+                hdr, self.converters, self.failonerror, self.errorvalue,
+                self.where, self.pass_row, self.memoize, self.memos
+            ))]
+
+        return self.source, steps
 
     def __setitem__(self, key, value):
         self.converters[key] = value
 
 
 def iterfieldconvert(source, converters, failonerror, errorvalue, where,
-                     pass_row):
+                     pass_row, workers=None, chunksize=None, memoize=False,
+                     memos=None):
 
     # grab the fields in the source table
     it = iter(source)
     hdr = next(it)
-    flds = list(map(text_type, hdr))
     yield tuple(hdr)  # these are not modified
 
+    # construct the data rows
+    args = (hdr, converters, failonerror, errorvalue, where, pass_row, memoize)
+    if workers:
+        # N.B., converters are memoized separately by each worker process
+        for row in iterparallelmap(_fieldconverter, args, it, workers,
+                                   chunksize):
+            yield row
+    else:
+        convertrow = _fieldconverter(*(args + (memos,)))
+        for row in it:
+            yield convertrow(row)
+
+
+def _fieldconverter(hdr, converters, failonerror, errorvalue, where,
+                    pass_row, memoize=False, memos=None):
+    # returns a function converting a data row
+    flds = list(map(text_type, hdr))
+
     # build converter functions
+    converter_functions = _converterfunctions(flds, converters, memoize, memos)
+
+    # define a function to transform a value
+    def transform_value(i, v, *args):
+        if i not in converter_functions:
+            # no converter defined on this field, return value as-is
+            return v
+        else:
+            try:
+                return converter_functions[i](v, *args)
+            except Exception as e:
+                if failonerror:
+                    raise e
+                else:
+                    return errorvalue
+
+    # define a function to transform a row of any length
+    if pass_row:
+        def transform_any(_row):
+            return tuple(transform_value(i, v, _row)
+                         for i, v in enumerate(_row))
+    else:
+        def transform_any(_row):
+            return tuple(transform_value(i, v)
+                         for i, v in enumerate(_row))
+
+    # define a function to transform a row, specialised for rows the same
+    # length as the header
+    transform_row = _rowconverter(len(hdr), converter_functions, failonerror,
+                                  errorvalue, pass_row, transform_any)
+
+    # prepare where function
+    if isinstance(where, string_types):
+        where = expr(where)
+    elif where is not None:
+        assert callable(where), 'expected callable for "where" argument, ' \
+                                'found %r' % where
+
+    if where is None and not pass_row:
+        # simple case, transform all rows
+        return transform_row
+
+    # wrap rows as records
+    if where is None:
+        def convert_row(_row):
+            return transform_row(Record(_row, flds))
+    else:
+        # conditionally transform rows
+        def convert_row(_row):
+            _row = Record(_row, flds)
+            if where(_row):
+                return transform_row(_row)
+            else:
+                return _row
+
+    return convert_row
+
+
+def iterfieldconvertbatches(source, converters, failonerror, errorvalue, size,
+                            missing, memoize=False, memos=None):
+    batches = iterbatches(source, size, missing)
+    hdr = next(batches)
+    yield tuple(hdr)
+    flds = list(map(text_type, hdr))
+    converter_functions = _converterfunctions(flds, converters, memoize, memos)
+    for cols in batches:
+        cols = list(cols)
+        for i, f in converter_functions.items():
+            if i < len(cols):
+                cols[i] = _convertcolumn(f, cols[i], failonerror, errorvalue)
+        yield cols
+
+
+def _rowconverter(n, converter_functions, failonerror, errorvalue, pass_row,
+                  fallback):
+    # generate a function converting the values of a row with n values,
+    # which calls converters only for converted fields and copies the others
+    # positionally, calling fallback for rows of any other length
+    namespace = {'fallback': fallback}
+    values = list()
+    for i in range(n):
+        if i in converter_functions:
+            f = converter_functions[i]
+            if not failonerror:
+                f = _errorvalueconverter(f, errorvalue)
+            namespace['_c%d' % i] = f
+            if pass_row:
+                values.append('_c%d(row[%d], row)' % (i, i))
+            else:
+                values.append('_c%d(row[%d])' % (i, i))
+        else:
+            values.append('row[%d]' % i)
+    src = 'lambda row: (%s) if len(row) == %d else fallback(row)' \
+          % (''.join(v + ', ' for v in values), n)
+    return eval(src, namespace)
+
+
+def _errorvalueconverter(f, errorvalue):
+    def conv(v, *args):
+        try:
+            return f(v, *args)
+        except Exception:
+            return errorvalue
+    return conv
+
+
+def _convertcolumn(f, col, failonerror, errorvalue):
+    if failonerror:
+        return [f(v) for v in col]
+    out = list()
+    for v in col:
+        try:
+            out.append(f(v))
+        except Exception:
+            out.append(errorvalue)
+    return out
+
+
+def _converterfunctions(flds, converters, memoize=False, memos=None):
+    # map row indices to converter functions
     converter_functions = dict()
     for k, c in converters.items():
 
@@ -357,54 +626,15 @@ def iterfieldconvert(source, converters, failonerror, errorvalue, where,
                 'unexpected converter specification on field %r: %r' % (k, c)
             )
 
-    # define a function to transform a value
-    def transform_value(i, v, *args):
-        if i not in converter_functions:
-            # no converter defined on this field, return value as-is
-            return v
-        else:
-            try:
-                return converter_functions[i](v, *args)
-            except Exception as e:
-                if failonerror:
-                    raise e
-                else:
-                    return errorvalue
-
-    # define a function to transform a row
-    if pass_row:
-        def transform_row(_row):
-            return tuple(transform_value(i, v, _row)
-                         for i, v in enumerate(_row))
-    else:
-        def transform_row(_row):
-            return tuple(transform_value(i, v)
-                         for i, v in enumerate(_row))
+    if memoize:
+        # separate cache for each field
+        for k, f in converter_functions.items():
+            f = _memoize(f, memoize)
+            converter_functions[k] = f
+            if memos is not None:
+                memos[flds[k] if k < len(flds) else k] = f
 
-    # prepare where function
-    if isinstance(where, string_types):
-        where = expr(where)
-    elif where is not None:
-        assert callable(where), 'expected callable for "where" argument, ' \
-                                'found %r' % where
-
-    # prepare iterator
-    if pass_row or where:
-        # wrap rows as records
-        it = (Record(row, flds) for row in it)
-
-    # construct the data rows
-    if where is None:
-        # simple case, transform all rows
-        for row in it:
-            yield transform_row(row)
-    else:
-        # conditionally transform rows
-        for row in it:
-            if where(row):
-                yield transform_row(row)
-            else:
-                yield row
+    return converter_functions
 
 
 def methodcaller(nm, *args):
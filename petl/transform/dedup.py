@@ -1,12 +1,25 @@
 from __future__ import absolute_import, print_function, division
 
 
+import sys
+import math
+import time
+import struct
+import hashlib
+import logging
 import operator
+from functools import partial
 from petl.compat import text_type
 
 
+import petl.config as config
 from petl.util.base import Table, asindices, itervalues
-from petl.transform.sorts import sort
+from petl.transform.sorts import sort, _iterchunk, _HashPartitions, \
+    _itermergepartitions, _spilldepth
+
+
+logger = logging.getLogger(__name__)
+debug = logger.debug
 
 
 def duplicates(table, key=None, presorted=False, buffersize=None, tempdir=None, 
@@ -476,3 +489,495 @@ def isunique(table, field):
 
 
 Table.isunique = isunique
+
+
+def hashdistinct(table, key=None, count=None, buffersize=None, tempdir=None):
+    """
+    Alternative implementation of :func:`petl.transform.dedup.distinct`,
+    where the first row for each distinct key (or each distinct row where no
+    key is given) is returned, in input order, via a set of the keys seen so
+    far, rather than by sorting the table. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar', 'baz'],
+        ...           ['B', 2, 3.4],
+        ...           ['A', 1, 2.0],
+        ...           ['B', 3, 7.8],
+        ...           ['D', 6, 9.3],
+        ...           ['B', 2, 12.3],
+        ...           ['A', 1, 2.0]]
+        >>> table2 = etl.hashdistinct(table1, 'foo')
+        >>> table2
+        +-----+-----+-----+
+        | foo | bar | baz |
+        +=====+=====+=====+
+        | 'B' |   2 | 3.4 |
+        +-----+-----+-----+
+        | 'A' |   1 | 2.0 |
+        +-----+-----+-----+
+        | 'D' |   6 | 9.3 |
+        +-----+-----+-----+
+
+        >>> table3 = etl.hashdistinct(table1, count='n')
+        >>> table3
+        +-----+-----+------+---+
+        | foo | bar | baz  | n |
+        +=====+=====+======+===+
+        | 'B' |   2 |  3.4 | 1 |
+        +-----+-----+------+---+
+        | 'A' |   1 |  2.0 | 2 |
+        +-----+-----+------+---+
+        | 'B' |   3 |  7.8 | 1 |
+        +-----+-----+------+---+
+        | 'D' |   6 |  9.3 | 1 |
+        +-----+-----+------+---+
+        | 'B' |   2 | 12.3 | 1 |
+        +-----+-----+------+---+
+
+    Rows are output as soon as they are found to be distinct, in a single pass
+    over the table, unless the `count` argument is given, in which case the
+    table is iterated twice, first to count each key. Key values must be
+    hashable.
+
+    If the number of distinct keys exceeds `buffersize` (by default
+    `petl.config.hash_buffersize`), the rows not yet known to be distinct are
+    spilled to temporary files in `tempdir`, partitioned by the hash of the
+    key, and each partition is deduplicated in turn, so memory use is bounded
+    while input order is still preserved. The number of keys held and
+    partitions spilled are logged at debug level.
+
+    """
+
+    return HashDistinctView(table, key=key, count=count,
+                            buffersize=buffersize, tempdir=tempdir)
+
+
+Table.hashdistinct = hashdistinct
+
+
+class HashDistinctView(Table):
+
+    def __init__(self, table, key=None, count=None, buffersize=None,
+                 tempdir=None):
+        self.table = table
+        self.key = key
+        self.count = count
+        self.buffersize = buffersize
+        self.tempdir = tempdir
+
+    def __iter__(self):
+        return iterhashdistinct(self.table, self.key, self.count,
+                                self.buffersize, self.tempdir)
+
+
+def iterhashdistinct(table, key, count, buffersize, tempdir):
+    it = iter(table)
+    hdr = next(it)
+    if buffersize is None:
+        buffersize = config.hash_buffersize
+    getkey = _dedupgetter(hdr, key)
+
+    if count:
+        yield tuple(hdr) + (count,)
+        items = _itercounted(_dedupitems(table, getkey), buffersize, tempdir,
+                             0)
+        for (_, _, row), n, first in items:
+            if first:
+                yield tuple(row) + (n,)
+    else:
+        yield tuple(hdr)
+        items = ((i, getkey(row), row) for i, row in enumerate(it))
+        for _, _, row in _iterfirstseen(items, buffersize, tempdir, 0):
+            yield tuple(row)
+
+
+def hashunique(table, key=None, buffersize=None, tempdir=None):
+    """
+    Alternative implementation of :func:`petl.transform.dedup.unique`, where
+    rows with unique values under a given key (or unique rows if no key is
+    given) are selected by counting each key in a dict, rather than by
+    sorting the table. Rows are output in input order. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar', 'baz'],
+        ...           ['F', 7, 2.3],
+        ...           ['B', '2', '3.4'],
+        ...           ['A', 1, 2],
+        ...           ['B', u'3', u'7.8'],
+        ...           ['E', None, None]]
+        >>> table2 = etl.hashunique(table1, 'foo')
+        >>> table2
+        +-----+------+------+
+        | foo | bar  | baz  |
+        +=====+======+======+
+        | 'F' |    7 |  2.3 |
+        +-----+------+------+
+        | 'A' |    1 |    2 |
+        +-----+------+------+
+        | 'E' | None | None |
+        +-----+------+------+
+
+    The table is iterated twice, first to count each key. If the number of
+    distinct keys exceeds `buffersize`, rows are spilled to temporary files
+    in `tempdir`, as for :func:`petl.transform.dedup.hashdistinct`.
+
+    """
+
+    return HashUniqueView(table, key=key, buffersize=buffersize,
+                          tempdir=tempdir)
+
+
+Table.hashunique = hashunique
+
+
+class HashUniqueView(Table):
+
+    def __init__(self, table, key=None, buffersize=None, tempdir=None,
+                 duplicates=False):
+        self.table = table
+        self.key = key
+        self.buffersize = buffersize
+        self.tempdir = tempdir
+        self.duplicates = duplicates
+
+    def __iter__(self):
+        return iterhashunique(self.table, self.key, self.buffersize,
+                              self.tempdir, self.duplicates)
+
+
+def iterhashunique(table, key, buffersize, tempdir, duplicates=False):
+    it = iter(table)
+    hdr = next(it)
+    yield tuple(hdr)
+    if buffersize is None:
+        buffersize = config.hash_buffersize
+    getkey = _dedupgetter(hdr, key)
+
+    items = _itercounted(_dedupitems(table, getkey), buffersize, tempdir, 0)
+    for (_, _, row), n, _ in items:
+        if (n > 1) == duplicates:
+            yield tuple(row)
+
+
+def hashduplicates(table, key=None, buffersize=None, tempdir=None):
+    """
+    Alternative implementation of :func:`petl.transform.dedup.duplicates`,
+    where rows with duplicate values under a given key (or duplicate rows
+    where no key is given) are selected by counting each key in a dict,
+    rather than by sorting the table. Rows are output in input order. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar', 'baz'],
+        ...           ['D', 6, 9.3],
+        ...           ['A', 1, 2.0],
+        ...           ['B', 2, 3.4],
+        ...           ['B', 3, 7.8],
+        ...           ['D', 4, 14.5],
+        ...           ['B', 2, 12.3]]
+        >>> table2 = etl.hashduplicates(table1, 'foo')
+        >>> table2
+        +-----+-----+------+
+        | foo | bar | baz  |
+        +=====+=====+======+
+        | 'D' |   6 |  9.3 |
+        +-----+-----+------+
+        | 'B' |   2 |  3.4 |
+        +-----+-----+------+
+        | 'B' |   3 |  7.8 |
+        +-----+-----+------+
+        | 'D' |   4 | 14.5 |
+        +-----+-----+------+
+        | 'B' |   2 | 12.3 |
+        +-----+-----+------+
+
+    The table is iterated twice, first to count each key. If the number of
+    distinct keys exceeds `buffersize`, rows are spilled to temporary files
+    in `tempdir`, as for :func:`petl.transform.dedup.hashdistinct`.
+
+    """
+
+    return HashUniqueView(table, key=key, buffersize=buffersize,
+                          tempdir=tempdir, duplicates=True)
+
+
+Table.hashduplicates = hashduplicates
+
+
+def _dedupgetter(hdr, key):
+    # N.B., this may raise an exception on short rows, depending on the field
+    # selection
+    if key is None:
+        return tuple
+    return operator.itemgetter(*asindices(hdr, key))
+
+
+def _dedupitems(table, getkey):
+    # returns a function which iterates over (seq, key, row) items, where seq
+    # is the position of the row in the table
+    def getitems():
+        it = iter(table)
+        next(it)  # skip header
+        for i, row in enumerate(it):
+            yield i, getkey(row), row
+    return getitems
+
+
+def _iterfirstseen(items, buffersize, tempdir, depth):
+    # yield the first (seq, key, row) item for each key, in input order,
+    # holding a set of no more than `buffersize` keys, after which items with
+    # new keys are partitioned by key and each partition processed in turn
+    seen = set()
+    spill = None
+    for item in items:
+        k = item[1]
+        if k in seen:
+            continue
+        if spill is None:
+            if (buffersize is None or len(seen) < buffersize
+                    or depth >= _spilldepth):
+                seen.add(k)
+                yield item
+                continue
+            debug('hashdistinct: %s keys held in memory (~%s bytes), '
+                  'spilling at depth %s', len(seen), sys.getsizeof(seen),
+                  depth)
+            spill = _HashPartitions(depth, tempdir)
+        spill.dump(k, item)
+    debug('hashdistinct: %s keys held in memory', len(seen))
+    seen = None
+
+    if spill is not None:
+        spill.close()
+        process = lambda fn: _iterfirstseen(_iterchunk(fn), buffersize,
+                                            tempdir, depth + 1)
+        # N.B., items spilled all follow items already yielded
+        for item in _itermergepartitions(spill, process,
+                                         operator.itemgetter(0), tempdir):
+            yield item
+
+
+def _itercounted(getitems, buffersize, tempdir, depth):
+    # yield (item, count, first) for each (seq, key, row) item returned by
+    # `getitems`, in input order, where count is the number of items with the
+    # same key and first is True for the first such item, by counting keys in
+    # a first pass over the items then annotating items in a second pass; if
+    # there are more than `buffersize` keys, items are instead partitioned by
+    # key and each partition processed in turn
+    counts = dict()
+    for _, k, _ in getitems():
+        if k in counts:
+            counts[k] += 1
+        elif (buffersize is not None and len(counts) >= buffersize
+                and depth < _spilldepth):
+            debug('hashunique: %s keys held in memory (~%s bytes), '
+                  'spilling at depth %s', len(counts), sys.getsizeof(counts),
+                  depth)
+            counts = None
+            break
+        else:
+            counts[k] = 1
+
+    if counts is not None:
+        debug('hashunique: %s keys held in memory', len(counts))
+        for item in getitems():
+            k = item[1]
+            n = counts[k]
+            if n > 0:
+                # mark key as seen
+                counts[k] = -n
+                yield item, n, True
+            else:
+                yield item, -n, False
+
+    else:
+        spill = _HashPartitions(depth, tempdir)
+        for item in getitems():
+            spill.dump(item[1], item)
+        spill.close()
+        process = lambda fn: _itercounted(partial(_iterchunk, fn), buffersize,
+                                          tempdir, depth + 1)
+        getorder = lambda annotated: annotated[0][0]
+        for annotated in _itermergepartitions(spill, process, getorder,
+                                              tempdir):
+            yield annotated
+
+
+def bloomdistinct(table, key=None, capacity=100000, error_rate=.001,
+                  rotate=None, rotateinterval=None):
+    """
+    Return rows with distinct values under a given key (or distinct rows if
+    no key is given), using a scalable Bloom filter to remember the keys seen
+    so far, so that unbounded streams can be deduplicated in a single pass
+    with bounded memory. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar'],
+        ...           ['B', 2],
+        ...           ['A', 1],
+        ...           ['B', 3],
+        ...           ['A', 1],
+        ...           ['D', 6]]
+        >>> table2 = etl.bloomdistinct(table1, 'foo')
+        >>> table2
+        +-----+-----+
+        | foo | bar |
+        +=====+=====+
+        | 'B' |   2 |
+        +-----+-----+
+        | 'A' |   1 |
+        +-----+-----+
+        | 'D' |   6 |
+        +-----+-----+
+
+        >>> table2.duplicates
+        2
+
+    Rows are output in input order as soon as they are found to be distinct.
+    The filter is sized for `capacity` keys with a false positive probability
+    of `error_rate`, i.e., the probability that a row with a new key is
+    wrongly dropped as a duplicate. If more keys are seen, further filters
+    are added, each twice as large as the last with a tighter error rate, so
+    that the overall false positive probability stays below `error_rate`.
+    Keys are distinguished by their :func:`repr`.
+
+    To bound memory for unbounded inputs, the filter can be rotated after
+    every `rotate` rows and/or every `rotateinterval` seconds. The previous
+    filter is still consulted until the next rotation, so a key is remembered
+    for at least one rotation period, and keys seen again are carried over
+    into the new filter.
+
+    After (or during) iteration, the `duplicates` attribute of the view holds
+    the number of rows dropped, and the `falsepositives` attribute holds an
+    estimate of how many of those were wrongly dropped, i.e., the sum of the
+    false positive probability of the filter at the time each row was
+    dropped, which tends to overestimate where most dropped rows are true
+    duplicates.
+
+    See also :func:`petl.transform.dedup.hashdistinct`, which is exact.
+
+    """
+
+    return BloomDistinctView(table, key=key, capacity=capacity,
+                             error_rate=error_rate, rotate=rotate,
+                             rotateinterval=rotateinterval)
+
+
+Table.bloomdistinct = bloomdistinct
+
+
+class BloomDistinctView(Table):
+
+    def __init__(self, table, key=None, capacity=100000, error_rate=.001,
+                 rotate=None, rotateinterval=None):
+        self.table = table
+        self.key = key
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rotate = rotate
+        self.rotateinterval = rotateinterval
+        self.duplicates = 0
+        self.falsepositives = 0
+
+    def __iter__(self):
+        self.duplicates = 0
+        self.falsepositives = 0
+        it = iter(self.table)
+        hdr = next(it)
+        yield tuple(hdr)
+        getkey = _dedupgetter(hdr, self.key)
+
+        newfilter = partial(_ScalableBloomFilter, self.capacity,
+                            self.error_rate)
+        current = newfilter()
+        previous = None
+        rotated = time.time()
+        for i, row in enumerate(it):
+            if (self.rotate and i and not i % self.rotate) or \
+                    (self.rotateinterval and
+                     time.time() - rotated >= self.rotateinterval):
+                debug('bloomdistinct: rotating filter at row %s', i)
+                previous, current = current, newfilter()
+                rotated = time.time()
+            hashes = _bloomhashes(getkey(row))
+            if hashes in current:
+                self.duplicates += 1
+                self.falsepositives += current.error()
+            elif previous is not None and hashes in previous:
+                self.duplicates += 1
+                self.falsepositives += previous.error()
+                current.add(hashes)
+            else:
+                current.add(hashes)
+                yield tuple(row)
+
+
+def _bloomhashes(k):
+    # a pair of 64-bit hashes, from which bit positions are derived by double
+    # hashing, N.B., stable between processes
+    r = repr(k)
+    if not isinstance(r, bytes):
+        r = r.encode('utf-8')
+    return struct.unpack('<QQ', hashlib.md5(r).digest())
+
+
+class _BloomFilter(object):
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # optimal number of bits and hash functions
+        self.nbits = max(8, int(math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2
+        )))
+        self.nhashes = max(1, int(math.ceil(-math.log(error_rate, 2))))
+        self.bits = bytearray((self.nbits + 7) // 8)
+        self.count = 0
+        self.bitsset = 0
+
+    def _positions(self, hashes):
+        h1, h2 = hashes
+        nbits = self.nbits
+        return [(h1 + i * h2) % nbits for i in range(self.nhashes)]
+
+    def __contains__(self, hashes):
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7))
+                   for p in self._positions(hashes))
+
+    def add(self, hashes):
+        bits = self.bits
+        for p in self._positions(hashes):
+            mask = 1 << (p & 7)
+            if not bits[p >> 3] & mask:
+                bits[p >> 3] |= mask
+                self.bitsset += 1
+        self.count += 1
+
+    def error(self):
+        # current false positive probability, from the proportion of bits set
+        return (self.bitsset / self.nbits) ** self.nhashes
+
+
+class _ScalableBloomFilter(object):
+    # a series of Bloom filters, where a new filter is added when the last
+    # is full, with twice the capacity and half the error rate, so that the
+    # total error rate is bounded by `error_rate`
+
+    def __init__(self, capacity, error_rate):
+        self.filters = [_BloomFilter(capacity, error_rate / 2)]
+
+    def __contains__(self, hashes):
+        return any(hashes in f for f in self.filters)
+
+    def add(self, hashes):
+        last = self.filters[-1]
+        if last.count >= last.capacity:
+            last = _BloomFilter(last.capacity * 2, last.error_rate / 2)
+            self.filters.append(last)
+        last.add(hashes)
+
+    def error(self):
+        p = 1
+        for f in self.filters:
+            p *= 1 - f.error()
+        return 1 - p
@@ -0,0 +1,124 @@
+from __future__ import absolute_import, print_function, division
+
+
+from petl.compat import next
+
+
+from petl.util.base import Table
+from petl.util.batches import iterbatches
+
+
+def optimize(table):
+    """
+    Fuse a chain of row-wise transformations into a single step. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar', 'baz'],
+        ...           ['a', '1', 'x'],
+        ...           ['b', '2', 'y'],
+        ...           ['c', '3', 'z']]
+        >>> table2 = (etl
+        ...           .convert(table1, 'bar', int)
+        ...           .select(lambda rec: rec.bar > 1)
+        ...           .cut('foo', 'bar')
+        ...           .addfield('quux', lambda rec: rec.bar * 2))
+        >>> table3 = etl.optimize(table2)
+        >>> table3
+        +-----+-----+------+
+        | foo | bar | quux |
+        +=====+=====+======+
+        | 'b' |   2 |    4 |
+        +-----+-----+------+
+        | 'c' |   3 |    6 |
+        +-----+-----+------+
+
+    Iterating over a chain of transformations normally passes each row
+    through one generator per transformation. The returned table instead
+    iterates over the source of the chain with a single generator, generated
+    when the header is read, which applies the row functions of all the
+    transformations in turn. The output is the same as the original table.
+
+    Chains of :func:`petl.transform.basics.cut`,
+    :func:`petl.transform.basics.cutout`,
+    :func:`petl.transform.basics.addfield`,
+    :func:`petl.transform.conversions.convert`,
+    :func:`petl.transform.selects.select` (and related functions which
+    don't use an index), :func:`petl.transform.maps.fieldmap`,
+    :func:`petl.transform.headers.rename` and
+    :func:`petl.transform.headers.setheader` are fused, ending at the first
+    table which is not one of these. If the chain has fewer than two
+    transformations the table is returned unchanged.
+
+    N.B., the tables in the chain are found when this function is called,
+    but their row functions are only built when the fused table is iterated
+    over, so converters added via item assignment are still applied.
+
+    """
+
+    stages = list()
+    source = table
+    while hasattr(source, '_fuse'):
+        fused = source._fuse()
+        if fused is None:
+            # e.g., transformation is done in parallel
+            break
+        source, steps = fused
+        stages.append(steps)
+    if len(stages) < 2:
+        return table
+    stages.reverse()
+    return FusedView(table, source, stages)
+
+
+Table.optimize = optimize
+
+
+class FusedView(Table):
+
+    def __init__(self, table, source, stages):
+        self.table = table
+        self.source = source
+        self.stages = stages
+
+    def __iter__(self):
+        return iterfused(self.source, self.stages)
+
+    def _iterbatches(self, size, missing):
+        # the unfused table may transform whole batches
+        return iterbatches(self.table, size, missing)
+
+
+def iterfused(source, stages):
+    it = iter(source)
+    hdr = next(it)
+    steps = list()
+    for stage in stages:
+        hdr, s = stage(hdr)
+        steps.extend(s)
+    yield tuple(hdr)
+    for row in _fusesteps(steps)(it):
+        yield row
+
+
+def _fusesteps(steps):
+    # generate a generator function applying each step to each row in turn,
+    # where a step is a pair (isfilter, function), filters testing whether a
+    # row is selected and other functions transforming a row
+    namespace = dict()
+    lines = ['def fused(it):',
+             '    for row in it:']
+    for i, (isfilter, f) in enumerate(steps):
+        name = '_step%d' % i
+        namespace[name] = f
+        if isfilter:
+            lines.append('        if not %s(row):' % name)
+            lines.append('            continue')
+        else:
+            lines.append('        row = %s(row)' % name)
+    if not steps or steps[-1][0]:
+        # selected rows are output as tuples
+        lines.append('        yield tuple(row)')
+    else:
+        lines.append('        yield row')
+    exec('\n'.join(lines), namespace)
+    return namespace['fused']
@@ -7,6 +7,7 @@ from petl.errors import FieldSelectionError
 
 
 from petl.util.base import Table, asindices, rowgetter
+from petl.util.batches import iterbatches
 
 
 def rename(table, *args, **kwargs):
@@ -73,6 +74,20 @@ class RenameView(Table):
     def __iter__(self):
         return iterrename(self.source, self.spec, self.strict)
 
+    def _iterbatches(self, size, missing):
+        batches = iterbatches(self.source, size, missing)
+        hdr = next(batches)
+        yield next(iterrename([hdr], self.spec, self.strict))
+        for cols in batches:
+            yield cols
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        def steps(hdr):
+            return next(iterrename([hdr], self.spec, self.strict)), []
+
+        return self.source, steps
+
     def __setitem__(self, key, value):
         self.spec[key] = value
 
@@ -135,6 +150,20 @@ class SetHeaderView(Table):
     def __iter__(self):
         return itersetheader(self.source, self.header)
 
+    def _iterbatches(self, size, missing):
+        batches = iterbatches(self.source, size, missing)
+        next(batches)  # discard source header
+        yield tuple(self.header)
+        for cols in batches:
+            yield cols
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        def steps(hdr):
+            return tuple(self.header), []
+
+        return self.source, steps
+
 
 def itersetheader(source, header):
     it = iter(source)
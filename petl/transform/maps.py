@@ -7,10 +7,13 @@ from petl.compat import OrderedDict, next, string_types, text_type
 
 from petl.errors import ArgumentError
 from petl.util.base import Table, expr, rowgroupby, Record
+from petl.util.parallel import iterparallelmap
+from petl.util.parsers import _memoize
 from petl.transform.sorts import sort
 
 
-def fieldmap(table, mappings=None, failonerror=False, errorvalue=None):
+def fieldmap(table, mappings=None, failonerror=False, errorvalue=None,
+             workers=None, chunksize=None, memoize=False):
     """
     Transform a table, mapping fields arbitrarily between input and output.
     E.g.::
@@ -52,10 +55,24 @@ def fieldmap(table, mappings=None, failonerror=False, errorvalue=None):
     Note also that the mapping value can be an expression string, which will be
     converted to a lambda function via :func:`petl.util.base.expr`.
 
+    If `memoize` is True or a cache size, the results of functions applied to
+    a single field, e.g., ``mappings['age_months']`` above, are cached for
+    the most recently mapped distinct values of the field, see
+    :func:`petl.util.parsers.memoized`. The caches of the most recent
+    iteration are available via the ``memos`` attribute of the returned
+    table, a dictionary mapping output fields to memoized functions.
+
+    If `workers` is given, rows are mapped in parallel by a pool of `workers`
+    processes, in chunks of `chunksize` rows (by default
+    `petl.config.parallel_chunksize`), and output in the same order as the
+    input. Mapping functions must be picklable where processes are spawned
+    rather than forked (e.g., on Windows).
+
     """
 
     return FieldMapView(table, mappings=mappings, failonerror=failonerror,
-                        errorvalue=errorvalue)
+                        errorvalue=errorvalue, workers=workers,
+                        chunksize=chunksize, memoize=memoize)
 
 
 Table.fieldmap = fieldmap
@@ -64,7 +81,8 @@ Table.fieldmap = fieldmap
 class FieldMapView(Table):
 
     def __init__(self, source, mappings=None, failonerror=False,
-                 errorvalue=None):
+                 errorvalue=None, workers=None, chunksize=None,
+                 memoize=False):
         self.source = source
         if mappings is None:
             self.mappings = OrderedDict()
@@ -72,22 +90,59 @@ class FieldMapView(Table):
             self.mappings = mappings
         self.failonerror = failonerror
         self.errorvalue = errorvalue
+        self.workers = workers
+        self.chunksize = chunksize
+        self.memoize = memoize
+        # memoized functions by output field, from the most recent iteration
+        self.memos = dict()
 
     def __setitem__(self, key, value):
         self.mappings[key] = value
 
     def __iter__(self):
         return iterfieldmap(self.source, self.mappings, self.failonerror,
-                            self.errorvalue)
+                            self.errorvalue, self.workers, self.chunksize,
+                            self.memoize, self.memos)
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        if self.workers:
+            return None
+
+        def steps(hdr):
+            return tuple(self.mappings.keys()), [(False, _fieldmapper(
+                hdr, self.mappings, self.failonerror, self.errorvalue,
+                self.memoize, self.memos
+            ))]
 
+        return self.source, steps
 
-def iterfieldmap(source, mappings, failonerror, errorvalue):
+
+def iterfieldmap(source, mappings, failonerror, errorvalue, workers=None,
+                 chunksize=None, memoize=False, memos=None):
     it = iter(source)
     hdr = next(it)
-    flds = list(map(text_type, hdr))
     outhdr = mappings.keys()
     yield tuple(outhdr)
 
+    args = (hdr, mappings, failonerror, errorvalue, memoize)
+    if workers:
+        # N.B., functions are memoized separately by each worker process
+        for row in iterparallelmap(_fieldmapper, args, it, workers,
+                                   chunksize):
+            yield row
+    else:
+        maprow = _fieldmapper(*(args + (memos,)))
+        for row in it:
+            yield maprow(row)
+
+
+def _fieldmapper(hdr, mappings, failonerror, errorvalue, memoize=False,
+                 memos=None):
+    # returns a function mapping a data row to an output row
+    flds = list(map(text_type, hdr))
+    outhdr = mappings.keys()
+
     mapfuns = dict()
     for outfld, m in mappings.items():
         if m in hdr:
@@ -102,6 +157,10 @@ def iterfieldmap(source, mappings, failonerror, errorvalue):
             srcfld = m[0]
             fm = m[1]
             if callable(fm):
+                if memoize:
+                    fm = _memoize(fm, memoize)
+                    if memos is not None:
+                        memos[outfld] = fm
                 mapfuns[outfld] = composefun(fm, srcfld)
             elif isinstance(fm, dict):
                 mapfuns[outfld] = composedict(fm, srcfld)
@@ -110,9 +169,9 @@ def iterfieldmap(source, mappings, failonerror, errorvalue):
         else:
             raise ArgumentError('invalid mapping %r: %r' % (outfld, m))
 
-    # wrap rows as records
-    it = (Record(row, flds) for row in it)
-    for row in it:
+    def maprow(row):
+        # wrap rows as records
+        row = Record(row, flds)
         outrow = list()
         for outfld in outhdr:
             try:
@@ -123,7 +182,9 @@ def iterfieldmap(source, mappings, failonerror, errorvalue):
                 else:
                     val = errorvalue
             outrow.append(val)
-        yield tuple(outrow)
+        return tuple(outrow)
+
+    return maprow
 
 
 def composefun(f, srcfld):
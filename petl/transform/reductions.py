@@ -6,15 +6,21 @@ import operator
 from petl.compat import OrderedDict, next, string_types, reduce, text_type
 
 
+import petl.config as config
 from petl.errors import ArgumentError
-from petl.util.base import Table, iterpeek, rowgroupby
-from petl.transform.sorts import sort, mergesort
+from petl.comparison import Comparable
+from petl.util.base import Table, Record, asindices, iterpeek, rowgroupby
+from petl.util.aggregators import Aggregator, CollectList, First, Last, \
+    asaggregator
+from petl.util.parallel import iterchunks, iterparallel
+from petl.transform.sorts import sort, mergesort, _iterchunk, \
+    _HashPartitions, _itermergepartitions, _spilldepth
 from petl.transform.basics import cut
 from petl.transform.dedup import distinct
 
 
 def rowreduce(table, key, reducer, header=None, presorted=False,
-              buffersize=None, tempdir=None, cache=True):
+              buffersize=None, tempdir=None, cache=True, workers=None):
     """
     Group rows under the given key then apply `reducer` to produce a single
     output row for each input group of rows. E.g.::
@@ -47,7 +53,11 @@ def rowreduce(table, key, reducer, header=None, presorted=False,
     :func:`reduce` function, i.e., the `reducer` function is *not* applied 
     recursively to values within a group, rather it is applied once to each row 
     group as a whole.
-    
+
+    If `workers` is given, the sort is skipped and groups are instead reduced
+    in parallel by a pool of `workers` processes, see
+    :func:`petl.transform.reductions.aggregate`.
+
     See also :func:`petl.transform.reductions.aggregate` and
     :func:`petl.transform.reductions.fold`.
     
@@ -55,7 +65,8 @@ def rowreduce(table, key, reducer, header=None, presorted=False,
 
     return RowReduceView(table, key, reducer, header=header,
                          presorted=presorted, 
-                         buffersize=buffersize, tempdir=tempdir, cache=cache)
+                         buffersize=buffersize, tempdir=tempdir, cache=cache,
+                         workers=workers)
 
 
 Table.rowreduce = rowreduce
@@ -64,8 +75,9 @@ Table.rowreduce = rowreduce
 class RowReduceView(Table):
     
     def __init__(self, source, key, reducer, header=None,
-                 presorted=False, buffersize=None, tempdir=None, cache=True):
-        if presorted:
+                 presorted=False, buffersize=None, tempdir=None, cache=True,
+                 workers=None):
+        if presorted or workers:
             self.source = source
         else:
             self.source = sort(source, key, buffersize=buffersize, 
@@ -73,8 +85,14 @@ class RowReduceView(Table):
         self.key = key
         self.header = header
         self.reducer = reducer
+        self.tempdir = tempdir
+        self.workers = workers
 
     def __iter__(self):
+        if self.workers:
+            return iterhashrowreduce(self.source, self.key, self.reducer,
+                                     self.header, True, workers=self.workers,
+                                     tempdir=self.tempdir)
         return iterrowreduce(self.source, self.key, self.reducer, self.header)
 
     
@@ -88,7 +106,7 @@ def iterrowreduce(source, key, reducer, header):
         
 
 def aggregate(table, key, aggregation=None, value=None, presorted=False,
-              buffersize=None, tempdir=None, cache=True):
+              buffersize=None, tempdir=None, cache=True, workers=None):
     """Group rows under the given key then apply aggregation functions.
     E.g.::
 
@@ -176,18 +194,40 @@ def aggregate(table, key, aggregation=None, value=None, presorted=False,
     `buffersize`, `tempdir` and `cache` arguments under the
     :func:`petl.transform.sorts.sort` function.
 
+    Aggregation functions may also be instances of
+    :class:`petl.util.aggregators.Aggregator` (e.g., :class:`Count`,
+    :class:`Sum`, :class:`Mean`, :class:`Variance`), which aggregate values
+    incrementally. The builtin functions :func:`len`, :func:`sum`,
+    :func:`min`, :func:`max` and :func:`list` are replaced by their
+    incremental equivalents when aggregating multiple fields, so if all
+    aggregation functions are incremental the rows within each group are
+    never held in memory all at once.
+
+    If `workers` is given, the sort is skipped and rows are instead aggregated
+    in parallel by a pool of `workers` processes, producing the same output as
+    the serial implementation, including the order of keys. If all
+    aggregation functions are incremental, chunks of rows (of
+    `petl.config.parallel_chunksize` rows) are aggregated by the processes
+    and the partial aggregates are merged in input order. Otherwise rows are
+    partitioned between the processes by hashing the key, via temporary files
+    created in `tempdir`, so that all rows for any key are aggregated by the
+    same process. Functions must be picklable where processes are spawned
+    rather than forked (e.g., on Windows). N.B., merging partial sums of
+    floating point values may introduce small rounding differences.
+
     """
 
     if callable(aggregation):
         return SimpleAggregateView(table, key, aggregation=aggregation, 
                                    value=value, presorted=presorted, 
                                    buffersize=buffersize, tempdir=tempdir, 
-                                   cache=cache)
+                                   cache=cache, workers=workers)
     elif aggregation is None or isinstance(aggregation, (list, tuple, dict)):
         # ignore value arg
         return MultiAggregateView(table, key, aggregation=aggregation,  
                                   presorted=presorted, buffersize=buffersize, 
-                                  tempdir=tempdir, cache=cache)
+                                  tempdir=tempdir, cache=cache,
+                                  workers=workers)
     else:
         raise ArgumentError('expected aggregation is callable, list, tuple, dict '
                         'or None')
@@ -199,8 +239,9 @@ Table.aggregate = aggregate
 class SimpleAggregateView(Table):
     
     def __init__(self, table, key, aggregation=list, value=None, 
-                 presorted=False, buffersize=None, tempdir=None, cache=True):
-        if presorted:
+                 presorted=False, buffersize=None, tempdir=None, cache=True,
+                 workers=None):
+        if presorted or workers:
             self.table = table
         else:
             self.table = sort(table, key, buffersize=buffersize, 
@@ -208,8 +249,15 @@ class SimpleAggregateView(Table):
         self.key = key
         self.aggregation = aggregation
         self.value = value
+        self.tempdir = tempdir
+        self.workers = workers
         
     def __iter__(self):
+        if self.workers:
+            return iterhashsimpleaggregate(self.table, self.key,
+                                           self.aggregation, self.value, True,
+                                           workers=self.workers,
+                                           tempdir=self.tempdir)
         return itersimpleaggregate(self.table, self.key, self.aggregation, 
                                    self.value)
 
@@ -221,13 +269,7 @@ def itersimpleaggregate(table, key, aggregation, value):
         aggregation = lambda g: sum(1 for _ in g)  # count length of iterable
 
     # determine output header
-    if isinstance(key, (list, tuple)):
-        outhdr = tuple(key) + ('value',)
-    elif callable(key):
-        outhdr = ('key', 'value')
-    else:
-        outhdr = (key, 'value')
-    yield outhdr
+    yield _aggregateheader(key, ('value',))
 
     # generate data
     if isinstance(key, (list, tuple)):
@@ -241,13 +283,15 @@ def itersimpleaggregate(table, key, aggregation, value):
 class MultiAggregateView(Table):
     
     def __init__(self, source, key, aggregation=None, presorted=False, 
-                 buffersize=None, tempdir=None, cache=True):
-        if presorted:
+                 buffersize=None, tempdir=None, cache=True, workers=None):
+        if presorted or workers:
             self.source = source
         else:
             self.source = sort(source, key, buffersize=buffersize, 
                                tempdir=tempdir, cache=cache)
         self.key = key
+        self.tempdir = tempdir
+        self.workers = workers
         if aggregation is None:
             self.aggregation = OrderedDict()
         elif isinstance(aggregation, (list, tuple)):
@@ -263,6 +307,11 @@ class MultiAggregateView(Table):
             )
 
     def __iter__(self):
+        if self.workers:
+            return iterhashmultiaggregate(self.source, self.key,
+                                          self.aggregation, True,
+                                          workers=self.workers,
+                                          tempdir=self.tempdir)
         return itermultiaggregate(self.source, self.key, self.aggregation)
     
     def __setitem__(self, key, value):
@@ -270,13 +319,30 @@ class MultiAggregateView(Table):
 
     
 def itermultiaggregate(source, key, aggregation):
-    aggregation = OrderedDict(aggregation.items())  # take a copy
     it = iter(source)
     hdr = next(it)
     # push back header to ensure we iterate only once
     it = itertools.chain([hdr], it)
 
-    # normalise aggregators
+    aggregation = _normaggregation(aggregation)
+    aggregator = _multiaggregator(hdr, aggregation)
+    yield _aggregateheader(key, aggregation)
+
+    # generate data
+    for k, rows in rowgroupby(it, key):
+        # handle compound key
+        if isinstance(key, (list, tuple)):
+            outrow = list(k)
+        else:
+            outrow = [k]
+        # N.B., a single pass over the rows, so if all aggregation functions
+        # are incremental the group is never held in memory
+        outrow.extend(aggregator(rows))
+        yield tuple(outrow)
+
+
+def _normaggregation(aggregation):
+    aggregation = OrderedDict(aggregation.items())  # take a copy
     for outfld in aggregation:
         agg = aggregation[outfld]
         if callable(agg):
@@ -291,45 +357,81 @@ def itermultiaggregate(source, key, aggregation):
             pass  # no need to normalise
         else:
             raise ArgumentError('invalid aggregation: %r, %r' % (outfld, agg))
+    return aggregation
 
-    # determine output header
+
+def _aggregateheader(key, aggregation):
     if isinstance(key, (list, tuple)):
         outhdr = list(key)
     elif callable(key):
         outhdr = ['key']
     else:
         outhdr = [key]
+    outhdr.extend(aggregation)
+    return tuple(outhdr)
+
+
+def _multiaggregator(hdr, aggregation):
+    # combine normalised aggregations into a single aggregator over rows
+    aggregators = list()
+    getters = list()
     for outfld in aggregation:
-        outhdr.append(outfld)
-    yield tuple(outhdr)
-    
-    # generate data
-    for k, rows in rowgroupby(it, key):
-        rows = list(rows)  # may need to iterate over these more than once
-        # handle compound key
-        if isinstance(key, (list, tuple)):
-            outrow = list(k)
+        srcfld, aggfun = aggregation[outfld]
+        agg = asaggregator(aggfun)
+        if agg is None:
+            # not incremental, so collect values and apply aggfun at the end;
+            # whole rows are passed as a list as they may be iterated more
+            # than once
+            agg = _CollectAggregator(aggfun, aslist=srcfld is None)
+        aggregators.append(agg)
+        if srcfld is None:
+            getters.append(None)
+        elif isinstance(srcfld, (list, tuple)):
+            idxs = [hdr.index(f) for f in srcfld]
+            getters.append(operator.itemgetter(*idxs))
         else:
-            outrow = [k]
-        for outfld in aggregation:
-            srcfld, aggfun = aggregation[outfld]
-            if srcfld is None:
-                aggval = aggfun(rows)
-                outrow.append(aggval)
-            elif isinstance(srcfld, (list, tuple)):
-                idxs = [hdr.index(f) for f in srcfld]
-                valgetter = operator.itemgetter(*idxs)
-                vals = (valgetter(row) for row in rows)
-                aggval = aggfun(vals)
-                outrow.append(aggval)
-            else:
-                idx = hdr.index(srcfld)
-                # try using generator comprehension
-                vals = (row[idx] for row in rows)
-                aggval = aggfun(vals)
-                outrow.append(aggval)
-        yield tuple(outrow)
-            
+            getters.append(operator.itemgetter(hdr.index(srcfld)))
+    return _MultiAggregator(aggregators, getters)
+
+
+class _CollectAggregator(CollectList):
+    # wraps a non-incremental aggregation function by collecting values
+
+    def __init__(self, f, aslist=False):
+        self.f = f
+        self.aslist = aslist
+
+    def finalize(self, state):
+        if self.aslist:
+            return self.f(state)
+        return self.f(iter(state))
+
+
+class _MultiAggregator(Aggregator):
+    # holds a state per aggregation, each of which is updated with the values
+    # obtained from each row via the corresponding getter
+
+    def __init__(self, aggregators, getters):
+        self.aggregators = aggregators
+        self.getters = getters
+        self._parts = list(enumerate(zip(aggregators, getters)))
+
+    def init(self):
+        return [agg.init() for agg in self.aggregators]
+
+    def add(self, state, row):
+        for i, (agg, getter) in self._parts:
+            v = row if getter is None else getter(row)
+            state[i] = agg.add(state[i], v)
+        return state
+
+    def merge(self, state, other):
+        return [agg.merge(s, o)
+                for agg, s, o in zip(self.aggregators, state, other)]
+
+    def finalize(self, state):
+        return [agg.finalize(s) for agg, s in zip(self.aggregators, state)]
+
 
 def groupcountdistinctvalues(table, key, value):
     """Group by the `key` field then count the number of distinct values in the
@@ -368,7 +470,8 @@ def groupselectfirst(table, key, presorted=False, buffersize=None,
         +-----+-----+-------+
 
     See also :func:`petl.transform.reductions.groupselectlast`,
-    :func:`petl.transform.dedup.distinct`.
+    :func:`petl.transform.dedup.distinct`,
+    :func:`petl.transform.reductions.hashgroupselectfirst`.
 
     """
 
@@ -406,7 +509,8 @@ def groupselectlast(table, key, presorted=False, buffersize=None,
         +-----+-----+-------+
 
     See also :func:`petl.transform.reductions.groupselectfirst`,
-    :func:`petl.transform.dedup.distinct`.
+    :func:`petl.transform.dedup.distinct`,
+    :func:`petl.transform.reductions.hashgroupselectlast`.
 
     .. versionadded:: 1.1.0
 
@@ -521,6 +625,20 @@ class MergeDuplicatesView(Table):
 def itermergeduplicates(table, key, missing):
     it = iter(table)
     hdr, it = iterpeek(it)
+    outhdr, aggregator = _mergeduplicatesaggregator(hdr, key, missing)
+    yield tuple(outhdr)
+
+    # do the work
+    for k, grp in rowgroupby(it, key):
+        if isinstance(key, string_types):
+            outrow = [k]
+        else:
+            outrow = list(k)
+        outrow.extend(aggregator(grp))
+        yield tuple(outrow)
+
+
+def _mergeduplicatesaggregator(hdr, key, missing):
     flds = list(map(text_type, hdr))
 
     # determine output fields
@@ -533,24 +651,37 @@ def itermergeduplicates(table, key, missing):
     valflds = [f for f in flds if f not in keyflds]
     valfldidxs = [flds.index(f) for f in valflds]
     outhdr.extend(valflds)
-    yield tuple(outhdr)
 
-    # do the work
-    for k, grp in rowgroupby(it, key):
-        grp = list(grp)
-        if isinstance(key, string_types):
-            outrow = [k]
-        else:
-            outrow = list(k)
-        mergedvals = [set(row[i] for row in grp
-                          if len(row) > i and row[i] != missing)
-                      for i in valfldidxs]
-        normedvals = [vals.pop() if len(vals) == 1
-                      else missing if len(vals) == 0
-                      else Conflict(vals)
-                      for vals in mergedvals]
-        outrow.extend(normedvals)
-        yield tuple(outrow)
+    return outhdr, _MergeDuplicatesAggregator(valfldidxs, missing)
+
+
+class _MergeDuplicatesAggregator(Aggregator):
+    # holds the set of non-missing values found for each value field
+
+    def __init__(self, valfldidxs, missing):
+        self.valfldidxs = valfldidxs
+        self.missing = missing
+
+    def init(self):
+        return [set() for _ in self.valfldidxs]
+
+    def add(self, state, row):
+        missing = self.missing
+        for vals, i in zip(state, self.valfldidxs):
+            if len(row) > i and row[i] != missing:
+                vals.add(row[i])
+        return state
+
+    def merge(self, state, other):
+        for vals, othervals in zip(state, other):
+            vals |= othervals
+        return state
+
+    def finalize(self, state):
+        return [vals.pop() if len(vals) == 1
+                else self.missing if len(vals) == 0
+                else Conflict(vals)
+                for vals in state]
 
 
 def merge(*tables, **kwargs):
@@ -604,7 +735,7 @@ class Conflict(frozenset):
 
 
 def fold(table, key, f, value=None, presorted=False, buffersize=None,
-         tempdir=None, cache=True):
+         tempdir=None, cache=True, workers=None):
     """
     Reduce rows recursively via the Python standard :func:`reduce` function.
     E.g.::
@@ -627,13 +758,19 @@ def fold(table, key, f, value=None, presorted=False, buffersize=None,
         |   2 |    12 |
         +-----+-------+
 
+    If `workers` is given, the sort is skipped and groups are instead reduced
+    in parallel by a pool of `workers` processes, see
+    :func:`petl.transform.reductions.aggregate`. Each group is reduced in full
+    by a single process, so `f` need not be associative.
+
     See also :func:`petl.transform.reductions.aggregate`,
     :func:`petl.transform.reductions.rowreduce`.
 
     """
 
     return FoldView(table, key, f, value=value, presorted=presorted,
-                    buffersize=buffersize, tempdir=tempdir, cache=cache)
+                    buffersize=buffersize, tempdir=tempdir, cache=cache,
+                    workers=workers)
 
 
 Table.fold = fold
@@ -642,8 +779,8 @@ Table.fold = fold
 class FoldView(Table):
 
     def __init__(self, table, key, f, value=None, presorted=False,
-                 buffersize=None, tempdir=None, cache=True):
-        if presorted:
+                 buffersize=None, tempdir=None, cache=True, workers=None):
+        if presorted or workers:
             self.table = table
         else:
             self.table = sort(table, key, buffersize=buffersize,
@@ -651,8 +788,14 @@ class FoldView(Table):
         self.key = key
         self.f = f
         self.value = value
+        self.tempdir = tempdir
+        self.workers = workers
 
     def __iter__(self):
+        if self.workers:
+            return iterhashfold(self.table, self.key, self.f, self.value,
+                                True, workers=self.workers,
+                                tempdir=self.tempdir)
         return iterfold(self.table, self.key, self.f, self.value)
 
 
@@ -660,3 +803,872 @@ def iterfold(table, key, f, value):
     yield ('key', 'value')
     for k, grp in rowgroupby(table, key, value):
         yield k, reduce(f, grp)
+
+
+def _iterhashaggregate(it, getkey, getval, aggregator, sortkeys=True,
+                       flds=None, reducer=None, workers=None, buffersize=None,
+                       tempdir=None):
+    # accumulate an aggregator state for each key in a dict during a single
+    # pass, then yield (key, aggregate value) pairs, in key order if
+    # `sortkeys` is True, otherwise in the order each key was first seen; if
+    # `flds` is given, rows are wrapped as records before keys and values are
+    # extracted; if `reducer` is given, it is called with each key and
+    # aggregate value to produce the value yielded
+
+    if workers:
+        # N.B., keys are always sorted
+        for k, v in _iterparallelaggregate(it, getkey, getval, aggregator,
+                                           flds, reducer, workers, tempdir):
+            yield k, v
+        return
+
+    if buffersize is None:
+        buffersize = config.hash_buffersize
+    if not _ismergeable(aggregator):
+        # partial states cannot be spilled
+        buffersize = None
+    if flds is not None:
+        it = (Record(row, flds) for row in it)
+    init = aggregator.init
+    add = aggregator.add
+    # N.B., insertion order is only needed if keys are not going to be sorted
+    states = dict() if sortkeys else OrderedDict()
+    # when spilling, need to remember the row at which each key was first seen
+    # if keys are not going to be sorted
+    seqs = None if sortkeys else dict()
+    spill = None
+    for i, row in enumerate(it):
+        k = getkey(row)
+        try:
+            state = states[k]
+        except KeyError:
+            if buffersize is not None and len(states) >= buffersize:
+                # memory budget exceeded, flush partial states to disk
+                if spill is None:
+                    spill = _HashPartitions(0, tempdir)
+                _spillstates(spill, states, seqs)
+            state = init()
+            if seqs is not None:
+                seqs[k] = i
+        states[k] = add(state, row if getval is None else getval(row))
+
+    if spill is None:
+        if sortkeys:
+            keys = sorted(states, key=Comparable)
+        else:
+            keys = list(states)
+        items = ((k, None, states.pop(k)) for k in keys)
+    else:
+        _spillstates(spill, states, seqs)
+        spill.close()
+        items = _itermergespilled(spill, aggregator.merge, sortkeys,
+                                  buffersize, tempdir)
+
+    finalize = aggregator.finalize
+    for k, _, state in items:
+        # release each state as soon as it has been finalized
+        v = finalize(state)
+        if reducer is not None:
+            v = reducer(k, v)
+        yield k, v
+
+
+def _hashstates(it, getkey, getval, aggregator, states):
+    init = aggregator.init
+    add = aggregator.add
+    for row in it:
+        k = getkey(row)
+        try:
+            state = states[k]
+        except KeyError:
+            state = init()
+        states[k] = add(state, row if getval is None else getval(row))
+    return states
+
+
+def _spillstates(spill, states, seqs):
+    # items are (key, seq, state) where seq is the row at which the key was
+    # first seen, if needed
+    for k in list(states):
+        seq = None if seqs is None else seqs.pop(k)
+        spill.dump(k, (k, seq, states.pop(k)))
+
+
+def _itermergespilled(spill, merge, sortkeys, buffersize, tempdir):
+    # merge partial states spilled to each partition in turn, then merge
+    # the ordered results from each partition
+    if sortkeys:
+        getorder = lambda item: Comparable(item[0])
+    else:
+        getorder = operator.itemgetter(1)
+    depth = spill.depth + 1
+    process = lambda fn: _itermergestates(_iterchunk(fn), merge, sortkeys,
+                                          buffersize, tempdir, depth)
+    return _itermergepartitions(spill, process, getorder, tempdir)
+
+
+def _itermergestates(items, merge, sortkeys, buffersize, tempdir, depth):
+    # merge (key, seq, state) items for the same key, N.B., items are in the
+    # order spilled so states are merged in input order
+    states = dict()
+    spill = None
+    for k, seq, state in items:
+        if k in states:
+            prevseq, prevstate = states[k]
+            if seq is not None:
+                seq = min(prevseq, seq)
+            states[k] = seq, merge(prevstate, state)
+        else:
+            if (buffersize is not None and len(states) >= buffersize
+                    and depth < _spilldepth):
+                # still too many keys, partition again
+                if spill is None:
+                    spill = _HashPartitions(depth, tempdir)
+                for sk in list(states):
+                    sseq, sstate = states.pop(sk)
+                    spill.dump(sk, (sk, sseq, sstate))
+            states[k] = seq, state
+
+    if spill is None:
+        if sortkeys:
+            keys = sorted(states, key=Comparable)
+        else:
+            keys = sorted(states, key=lambda sk: states[sk][0])
+        for k in keys:
+            seq, state = states.pop(k)
+            yield k, seq, state
+    else:
+        for sk in list(states):
+            sseq, sstate = states.pop(sk)
+            spill.dump(sk, (sk, sseq, sstate))
+        spill.close()
+        for item in _itermergespilled(spill, merge, sortkeys, buffersize,
+                                      tempdir):
+            yield item
+
+
+def _iterparallelaggregate(it, getkey, getval, aggregator, flds, reducer,
+                           workers, tempdir):
+    initargs = (getkey, getval, aggregator, flds, reducer)
+
+    if reducer is None and _isincremental(aggregator):
+        # aggregate chunks of rows in the worker processes, then merge the
+        # partial states in input order so results match serial aggregation
+        chunks = iterchunks(it, config.parallel_chunksize)
+        merge = aggregator.merge
+        states = dict()
+        for partial in iterparallel(_aggregatechunk, chunks, workers,
+                                    initializer=_initaggregateworker,
+                                    initargs=initargs):
+            for k, state in partial.items():
+                if k in states:
+                    states[k] = merge(states[k], state)
+                else:
+                    states[k] = state
+        finalize = aggregator.finalize
+        for k in sorted(states, key=Comparable):
+            yield k, finalize(states.pop(k))
+
+    else:
+        # hash-partition rows into temporary files, so all rows for any key
+        # are aggregated by the same worker process, in input order
+        partitions = _hashpartition(it, getkey, flds, workers, tempdir)
+        results = list()
+        for partial in iterparallel(_aggregatepartition,
+                                    [p.name for p in partitions], workers,
+                                    initializer=_initaggregateworker,
+                                    initargs=initargs):
+            results.extend(partial)
+        del partitions
+        results.sort(key=lambda item: Comparable(item[0]))
+        for k, v in results:
+            yield k, v
+
+
+def _isincremental(aggregator):
+    # can partial states be merged without holding all values in memory
+    if isinstance(aggregator, _MultiAggregator):
+        return all(_isincremental(agg) for agg in aggregator.aggregators)
+    return not isinstance(aggregator, (_CollectAggregator, _FoldAggregator))
+
+
+def _ismergeable(aggregator):
+    # can partial states be merged at all
+    if isinstance(aggregator, _MultiAggregator):
+        return all(_ismergeable(agg) for agg in aggregator.aggregators)
+    return not isinstance(aggregator, _FoldAggregator)
+
+
+def _hashpartition(it, getkey, flds, n, tempdir):
+    spill = _HashPartitions(0, tempdir, n=n)
+    try:
+        for row in it:
+            k = getkey(row if flds is None else Record(row, flds))
+            spill.dump(k, row)
+    finally:
+        spill.close()
+    return spill.partitions
+
+
+# aggregation parameters for worker processes, see _initaggregateworker
+_worker = dict()
+
+
+def _initaggregateworker(getkey, getval, aggregator, flds, reducer):
+    _worker.update(getkey=getkey, getval=getval, aggregator=aggregator,
+                   flds=flds, reducer=reducer)
+
+
+def _workerrows(rows):
+    flds = _worker['flds']
+    if flds is not None:
+        rows = (Record(row, flds) for row in rows)
+    return rows
+
+
+def _aggregatechunk(rows):
+    # aggregate a chunk of rows into partial states
+    return _hashstates(_workerrows(rows), _worker['getkey'], _worker['getval'],
+                       _worker['aggregator'], dict())
+
+
+def _aggregatepartition(fn):
+    # fully aggregate all rows within a partition of keys
+    states = _hashstates(_workerrows(_iterchunk(fn)), _worker['getkey'],
+                         _worker['getval'], _worker['aggregator'], dict())
+    finalize = _worker['aggregator'].finalize
+    reducer = _worker['reducer']
+    results = list()
+    for k in list(states):
+        v = finalize(states.pop(k))
+        if reducer is not None:
+            v = reducer(k, v)
+        results.append((k, v))
+    return results
+
+
+def _hashgetter(hdr, spec):
+    if spec is None:
+        return None
+    elif callable(spec):
+        return spec
+    else:
+        return operator.itemgetter(*asindices(hdr, spec))
+
+
+def hashrowreduce(table, key, reducer, header=None, sortkeys=True,
+                  buffersize=None, tempdir=None):
+    """Alternative implementation of
+    :func:`petl.transform.reductions.rowreduce`, where rows are grouped by
+    constructing an in-memory dict of rows for each key during a single pass
+    over the table, rather than by sorting the table. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar'],
+        ...           ['b', 2],
+        ...           ['a', 3],
+        ...           ['b', 1],
+        ...           ['a', 7],
+        ...           ['c', 4],
+        ...           ['b', 9]]
+        >>> def sumbar(key, rows):
+        ...     return [key, sum(row[1] for row in rows)]
+        ...
+        >>> table2 = etl.hashrowreduce(table1, key='foo', reducer=sumbar,
+        ...                            header=['foo', 'barsum'])
+        >>> table2
+        +-----+--------+
+        | foo | barsum |
+        +=====+========+
+        | 'a' |     10 |
+        +-----+--------+
+        | 'b' |     12 |
+        +-----+--------+
+        | 'c' |      4 |
+        +-----+--------+
+
+    May be faster than :func:`petl.transform.reductions.rowreduce` where the
+    number of distinct keys is modest, although all rows are held in memory
+    until the pass over the table is complete.
+
+    If `sortkeys` is True (default) groups are output in key order, as for
+    :func:`petl.transform.reductions.rowreduce`. Otherwise groups are output
+    in the order in which each key was first seen. Key values must be
+    hashable.
+
+    If the number of distinct keys exceeds `buffersize` (by default
+    `petl.config.hash_buffersize`), partial groups of rows are spilled to
+    temporary files in `tempdir`, partitioned by the hash of the key, and each
+    partition is re-aggregated in turn once the pass over the table is
+    complete, so memory use is bounded by the number of distinct keys rather
+    than the number of rows. Set `buffersize` to None via the config to
+    disable spilling.
+
+    """
+
+    return HashRowReduceView(table, key, reducer, header=header,
+                             sortkeys=sortkeys, buffersize=buffersize,
+                             tempdir=tempdir)
+
+
+Table.hashrowreduce = hashrowreduce
+
+
+class HashRowReduceView(Table):
+
+    def __init__(self, source, key, reducer, header=None, sortkeys=True,
+                 buffersize=None, tempdir=None):
+        self.source = source
+        self.key = key
+        self.header = header
+        self.reducer = reducer
+        self.sortkeys = sortkeys
+        self.buffersize = buffersize
+        self.tempdir = tempdir
+
+    def __iter__(self):
+        return iterhashrowreduce(self.source, self.key, self.reducer,
+                                 self.header, self.sortkeys,
+                                 buffersize=self.buffersize,
+                                 tempdir=self.tempdir)
+
+
+def iterhashrowreduce(source, key, reducer, header, sortkeys, workers=None,
+                      buffersize=None, tempdir=None):
+    it = iter(source)
+    hdr = next(it)
+    if header is None:
+        # output header from source
+        header = hdr
+    yield tuple(header)
+
+    flds = list(map(text_type, hdr))
+    getkey = _hashgetter(hdr, key)
+    if callable(key):
+        reducer = _RecordsReducer(reducer, None)
+    else:
+        # rows are only wrapped as records as each group is reduced
+        reducer = _RecordsReducer(reducer, flds)
+        flds = None
+    for _, outrow in _iterhashaggregate(it, getkey, None, CollectList(),
+                                        sortkeys, flds=flds, reducer=reducer,
+                                        workers=workers,
+                                        buffersize=buffersize,
+                                        tempdir=tempdir):
+        yield outrow
+
+
+class _RecordsReducer(object):
+
+    def __init__(self, reducer, flds):
+        self.reducer = reducer
+        self.flds = flds
+
+    def __call__(self, k, rows):
+        if self.flds is not None:
+            rows = (Record(row, self.flds) for row in rows)
+        return tuple(self.reducer(k, iter(rows)))
+
+
+def hashaggregate(table, key, aggregation=None, value=None, sortkeys=True,
+                  buffersize=None, tempdir=None):
+    """Alternative implementation of
+    :func:`petl.transform.reductions.aggregate`, where rows are grouped by
+    constructing an in-memory dict during a single pass over the table, rather
+    than by sorting the table. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar', 'baz'],
+        ...           ['b', 2, True],
+        ...           ['a', 3, True],
+        ...           ['b', 2, False],
+        ...           ['c', 4, True],
+        ...           ['a', 7, False],
+        ...           ['b', 9, False]]
+        >>> table2 = etl.hashaggregate(table1, 'foo', sum, 'bar')
+        >>> table2
+        +-----+-------+
+        | foo | value |
+        +=====+=======+
+        | 'a' |    10 |
+        +-----+-------+
+        | 'b' |    13 |
+        +-----+-------+
+        | 'c' |     4 |
+        +-----+-------+
+
+        >>> # output groups in the order keys are first seen
+        ... table3 = etl.hashaggregate(table1, 'foo', sum, 'bar',
+        ...                            sortkeys=False)
+        >>> table3
+        +-----+-------+
+        | foo | value |
+        +=====+=======+
+        | 'b' |    13 |
+        +-----+-------+
+        | 'a' |    10 |
+        +-----+-------+
+        | 'c' |     4 |
+        +-----+-------+
+
+    The `aggregation` and `value` arguments are interpreted as for
+    :func:`petl.transform.reductions.aggregate`.
+
+    May be faster than :func:`petl.transform.reductions.aggregate` where the
+    number of distinct keys is modest. If the aggregation functions are
+    incremental (see :class:`petl.util.aggregators.Aggregator`) only an
+    aggregator state is held in memory for each key, otherwise values are held
+    in memory until the pass over the table is complete.
+
+    If `sortkeys` is True (default) groups are output in key order. Otherwise
+    groups are output in the order in which each key was first seen. Key
+    values must be hashable.
+
+    If the number of distinct keys exceeds `buffersize` (by default
+    `petl.config.hash_buffersize`), partial aggregator states are spilled to
+    temporary files in `tempdir`, partitioned by the hash of the key, and each
+    partition is re-aggregated in turn once the pass over the table is
+    complete, so memory use is bounded by the number of distinct keys rather
+    than the number of rows. Set `buffersize` to None via the config to
+    disable spilling.
+
+    """
+
+    if callable(aggregation):
+        return HashSimpleAggregateView(table, key, aggregation=aggregation,
+                                       value=value, sortkeys=sortkeys,
+                                       buffersize=buffersize, tempdir=tempdir)
+    elif aggregation is None or isinstance(aggregation, (list, tuple, dict)):
+        # ignore value arg
+        return HashMultiAggregateView(table, key, aggregation=aggregation,
+                                      sortkeys=sortkeys, buffersize=buffersize,
+                                      tempdir=tempdir)
+    else:
+        raise ArgumentError('expected aggregation is callable, list, tuple, '
+                            'dict or None')
+
+
+Table.hashaggregate = hashaggregate
+
+
+class HashSimpleAggregateView(Table):
+
+    def __init__(self, table, key, aggregation=list, value=None,
+                 sortkeys=True, buffersize=None, tempdir=None):
+        self.table = table
+        self.key = key
+        self.aggregation = aggregation
+        self.value = value
+        self.sortkeys = sortkeys
+        self.buffersize = buffersize
+        self.tempdir = tempdir
+
+    def __iter__(self):
+        return iterhashsimpleaggregate(self.table, self.key, self.aggregation,
+                                       self.value, self.sortkeys,
+                                       buffersize=self.buffersize,
+                                       tempdir=self.tempdir)
+
+
+def iterhashsimpleaggregate(table, key, aggregation, value, sortkeys,
+                            workers=None, buffersize=None, tempdir=None):
+    it = iter(table)
+    hdr = next(it)
+    yield _aggregateheader(key, ('value',))
+
+    aggregator = asaggregator(aggregation)
+    if aggregator is None:
+        aggregator = _CollectAggregator(aggregation)
+    if value is None or callable(key) or callable(value):
+        flds = list(map(text_type, hdr))
+    else:
+        flds = None
+    getkey = _hashgetter(hdr, key)
+    getval = _hashgetter(hdr, value)
+    for k, v in _iterhashaggregate(it, getkey, getval, aggregator, sortkeys,
+                                   flds=flds, workers=workers,
+                                   buffersize=buffersize, tempdir=tempdir):
+        if isinstance(key, (list, tuple)):
+            yield tuple(k) + (v,)
+        else:
+            yield k, v
+
+
+class HashMultiAggregateView(MultiAggregateView):
+
+    def __init__(self, source, key, aggregation=None, sortkeys=True,
+                 buffersize=None, tempdir=None):
+        super(HashMultiAggregateView, self).__init__(
+            source, key, aggregation=aggregation, presorted=True,
+            tempdir=tempdir
+        )
+        self.sortkeys = sortkeys
+        self.buffersize = buffersize
+
+    def __iter__(self):
+        return iterhashmultiaggregate(self.source, self.key, self.aggregation,
+                                      self.sortkeys,
+                                      buffersize=self.buffersize,
+                                      tempdir=self.tempdir)
+
+
+def iterhashmultiaggregate(source, key, aggregation, sortkeys, workers=None,
+                           buffersize=None, tempdir=None):
+    it = iter(source)
+    hdr = next(it)
+
+    aggregation = _normaggregation(aggregation)
+    aggregator = _multiaggregator(hdr, aggregation)
+    yield _aggregateheader(key, aggregation)
+
+    if callable(key) or any(srcfld is None
+                            for srcfld, _ in aggregation.values()):
+        flds = list(map(text_type, hdr))
+    else:
+        flds = None
+    getkey = _hashgetter(hdr, key)
+    for k, vals in _iterhashaggregate(it, getkey, None, aggregator, sortkeys,
+                                      flds=flds, workers=workers,
+                                      buffersize=buffersize, tempdir=tempdir):
+        # handle compound key
+        if isinstance(key, (list, tuple)):
+            outrow = list(k)
+        else:
+            outrow = [k]
+        outrow.extend(vals)
+        yield tuple(outrow)
+
+
+def hashmergeduplicates(table, key, missing=None, sortkeys=True,
+                        buffersize=None, tempdir=None):
+    """Alternative implementation of
+    :func:`petl.transform.reductions.mergeduplicates`, where rows are grouped
+    by constructing an in-memory dict during a single pass over the table,
+    rather than by sorting the table.
+
+    If `sortkeys` is True (default) merged rows are output in key order.
+    Otherwise merged rows are output in the order in which each key was first
+    seen.
+
+    If the number of distinct keys exceeds `buffersize`, partially merged
+    rows are spilled to temporary files in `tempdir`, as for
+    :func:`petl.transform.reductions.hashaggregate`.
+
+    """
+
+    return HashMergeDuplicatesView(table, key, missing=missing,
+                                   sortkeys=sortkeys, buffersize=buffersize,
+                                   tempdir=tempdir)
+
+
+Table.hashmergeduplicates = hashmergeduplicates
+
+
+class HashMergeDuplicatesView(Table):
+
+    def __init__(self, table, key, missing=None, sortkeys=True,
+                 buffersize=None, tempdir=None):
+        self.table = table
+        self.key = key
+        self.missing = missing
+        self.sortkeys = sortkeys
+        self.buffersize = buffersize
+        self.tempdir = tempdir
+
+    def __iter__(self):
+        return iterhashmergeduplicates(self.table, self.key, self.missing,
+                                       self.sortkeys, self.buffersize,
+                                       self.tempdir)
+
+
+def iterhashmergeduplicates(table, key, missing, sortkeys, buffersize=None,
+                            tempdir=None):
+    it = iter(table)
+    hdr = next(it)
+    outhdr, aggregator = _mergeduplicatesaggregator(hdr, key, missing)
+    yield tuple(outhdr)
+
+    getkey = _hashgetter(hdr, key)
+    for k, vals in _iterhashaggregate(it, getkey, None, aggregator, sortkeys,
+                                      buffersize=buffersize, tempdir=tempdir):
+        if isinstance(key, string_types):
+            outrow = [k]
+        else:
+            outrow = list(k)
+        outrow.extend(vals)
+        yield tuple(outrow)
+
+
+def hashfold(table, key, f, value=None, sortkeys=True):
+    """Alternative implementation of :func:`petl.transform.reductions.fold`,
+    where values are reduced during a single pass over the table, keeping only
+    the current reduced value for each key in an in-memory dict, rather than
+    by sorting the table. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['id', 'count'],
+        ...           [2, 4],
+        ...           [1, 3],
+        ...           [2, 8],
+        ...           [1, 5]]
+        >>> import operator
+        >>> table2 = etl.hashfold(table1, 'id', operator.add, 'count')
+        >>> table2
+        +-----+-------+
+        | key | value |
+        +=====+=======+
+        |   1 |     8 |
+        +-----+-------+
+        |   2 |    12 |
+        +-----+-------+
+
+    If `sortkeys` is True (default) results are output in key order.
+    Otherwise results are output in the order in which each key was first
+    seen. N.B., reduced values are never spilled to disk, because `f` is not
+    required to be associative.
+
+    """
+
+    return HashFoldView(table, key, f, value=value, sortkeys=sortkeys)
+
+
+Table.hashfold = hashfold
+
+
+class HashFoldView(Table):
+
+    def __init__(self, table, key, f, value=None, sortkeys=True):
+        self.table = table
+        self.key = key
+        self.f = f
+        self.value = value
+        self.sortkeys = sortkeys
+
+    def __iter__(self):
+        return iterhashfold(self.table, self.key, self.f, self.value,
+                            self.sortkeys)
+
+
+def iterhashfold(table, key, f, value, sortkeys, workers=None, tempdir=None):
+    it = iter(table)
+    hdr = next(it)
+    yield ('key', 'value')
+
+    # whole rows are reduced as records, as for fold
+    if value is None or callable(key) or callable(value):
+        flds = list(map(text_type, hdr))
+    else:
+        flds = None
+    getkey = _hashgetter(hdr, key)
+    getval = _hashgetter(hdr, value)
+    for k, v in _iterhashaggregate(it, getkey, getval, _FoldAggregator(f),
+                                   sortkeys, flds=flds, workers=workers,
+                                   tempdir=tempdir):
+        yield k, v
+
+
+class _FoldAggregator(Aggregator):
+    # keeps only the current reduced value, N.B., merging partial states is
+    # only valid if `f` is associative
+
+    def __init__(self, f):
+        self.f = f
+
+    def init(self):
+        return []
+
+    def add(self, state, value):
+        if state:
+            state[0] = self.f(state[0], value)
+        else:
+            state.append(value)
+        return state
+
+    def merge(self, state, other):
+        if state and other:
+            state[0] = self.f(state[0], other[0])
+            return state
+        return state or other
+
+    def finalize(self, state):
+        return state[0]
+
+
+def hashgroupselectfirst(table, key, sortkeys=True, buffersize=None,
+                         tempdir=None):
+    """Alternative implementation of
+    :func:`petl.transform.reductions.groupselectfirst`, where only the first
+    row for each key is kept in an in-memory dict during a single pass over
+    the table, rather than sorting the table. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar', 'baz'],
+        ...           ['A', 1, True],
+        ...           ['C', 7, False],
+        ...           ['B', 2, False],
+        ...           ['C', 9, True]]
+        >>> table2 = etl.hashgroupselectfirst(table1, key='foo')
+        >>> table2
+        +-----+-----+-------+
+        | foo | bar | baz   |
+        +=====+=====+=======+
+        | 'A' |   1 | True  |
+        +-----+-----+-------+
+        | 'B' |   2 | False |
+        +-----+-----+-------+
+        | 'C' |   7 | False |
+        +-----+-----+-------+
+
+        >>> # output rows in the order keys are first seen
+        ... table3 = etl.hashgroupselectfirst(table1, key='foo',
+        ...                                   sortkeys=False)
+        >>> table3
+        +-----+-----+-------+
+        | foo | bar | baz   |
+        +=====+=====+=======+
+        | 'A' |   1 | True  |
+        +-----+-----+-------+
+        | 'C' |   7 | False |
+        +-----+-----+-------+
+        | 'B' |   2 | False |
+        +-----+-----+-------+
+
+    If `sortkeys` is True (default) rows are output in key order, as for
+    :func:`petl.transform.reductions.groupselectfirst`. Otherwise rows are
+    output in the order in which each key was first seen. Memory use is
+    proportional to the number of distinct keys, which must be hashable, and
+    rows are spilled to temporary files if there are more than `buffersize`
+    keys, as for :func:`petl.transform.reductions.hashaggregate`.
+
+    """
+
+    return HashGroupSelectView(table, key, First(), sortkeys=sortkeys,
+                               buffersize=buffersize, tempdir=tempdir)
+
+
+Table.hashgroupselectfirst = hashgroupselectfirst
+
+
+def hashgroupselectlast(table, key, sortkeys=True, buffersize=None,
+                        tempdir=None):
+    """Alternative implementation of
+    :func:`petl.transform.reductions.groupselectlast`, where only the last row
+    seen for each key is kept in an in-memory dict during a single pass over
+    the table, rather than sorting the table. Other arguments are as for
+    :func:`petl.transform.reductions.hashgroupselectfirst`.
+
+    """
+
+    return HashGroupSelectView(table, key, Last(), sortkeys=sortkeys,
+                               buffersize=buffersize, tempdir=tempdir)
+
+
+Table.hashgroupselectlast = hashgroupselectlast
+
+
+def hashgroupselectmin(table, key, value, sortkeys=True, buffersize=None,
+                       tempdir=None):
+    """Alternative implementation of
+    :func:`petl.transform.reductions.groupselectmin`, where only the row with
+    the minimum of the `value` field so far is kept for each key in an
+    in-memory dict during a single pass over the table, rather than sorting
+    the table. N.B., will only return one row for each group, the first of
+    any rows with the same (minimum) value. Other arguments are as for
+    :func:`petl.transform.reductions.hashgroupselectfirst`.
+
+    """
+
+    return HashGroupSelectView(table, key, value=value, sortkeys=sortkeys,
+                               buffersize=buffersize, tempdir=tempdir)
+
+
+Table.hashgroupselectmin = hashgroupselectmin
+
+
+def hashgroupselectmax(table, key, value, sortkeys=True, buffersize=None,
+                       tempdir=None):
+    """Alternative implementation of
+    :func:`petl.transform.reductions.groupselectmax`, where only the row with
+    the maximum of the `value` field so far is kept for each key in an
+    in-memory dict during a single pass over the table, rather than sorting
+    the table. N.B., will only return one row for each group, the first of
+    any rows with the same (maximum) value. Other arguments are as for
+    :func:`petl.transform.reductions.hashgroupselectfirst`.
+
+    """
+
+    return HashGroupSelectView(table, key, value=value, reverse=True,
+                               sortkeys=sortkeys, buffersize=buffersize,
+                               tempdir=tempdir)
+
+
+Table.hashgroupselectmax = hashgroupselectmax
+
+
+class HashGroupSelectView(Table):
+
+    def __init__(self, table, key, aggregator=None, value=None, reverse=False,
+                 sortkeys=True, buffersize=None, tempdir=None):
+        self.table = table
+        self.key = key
+        self.aggregator = aggregator
+        self.value = value
+        self.reverse = reverse
+        self.sortkeys = sortkeys
+        self.buffersize = buffersize
+        self.tempdir = tempdir
+
+    def __iter__(self):
+        return iterhashgroupselect(self.table, self.key, self.aggregator,
+                                   self.value, self.reverse, self.sortkeys,
+                                   self.buffersize, self.tempdir)
+
+
+def iterhashgroupselect(table, key, aggregator, value, reverse, sortkeys,
+                        buffersize, tempdir):
+    it = iter(table)
+    hdr = next(it)
+    yield tuple(hdr)
+
+    if callable(key) or callable(value):
+        flds = list(map(text_type, hdr))
+    else:
+        flds = None
+    getkey = _hashgetter(hdr, key)
+    if aggregator is None:
+        aggregator = _SelectAggregator(_hashgetter(hdr, value), reverse)
+    for _, row in _iterhashaggregate(it, getkey, None, aggregator, sortkeys,
+                                     flds=flds, buffersize=buffersize,
+                                     tempdir=tempdir):
+        yield tuple(row)
+
+
+class _SelectAggregator(Aggregator):
+    # keeps the row with the minimum (or maximum if `reverse`) value, where
+    # the first row wins any ties, as for a stable sort
+
+    def __init__(self, getvalue, reverse=False):
+        self.getvalue = getvalue
+        self.reverse = reverse
+
+    def init(self):
+        return ()
+
+    def _better(self, v, other):
+        if self.reverse:
+            return Comparable(v) > Comparable(other)
+        return Comparable(v) < Comparable(other)
+
+    def add(self, state, row):
+        v = self.getvalue(row)
+        if not state or self._better(v, state[0]):
+            return v, row
+        return state
+
+    def merge(self, state, other):
+        if other and (not state or self._better(other[0], state[0])):
+            return other
+        return state
+
+    def finalize(self, state):
+        return state[1]
@@ -2,12 +2,23 @@ from __future__ import absolute_import, print_function, division
 
 
 import operator
-from petl.compat import next, string_types, callable, text_type
+import logging
+from tempfile import NamedTemporaryFile
+from petl.compat import next, string_types, callable, text_type, pickle, \
+    OrderedDict
 from petl.comparison import Comparable
 
 
 from petl.errors import ArgumentError
-from petl.util.base import asindices, expr, Table, values, Record
+from petl.util.base import asindices, expr, Expr, Table, values, Record
+from petl.util.materialise import IndexedView
+from petl.util.batches import iterbatches, batchrows, batchcolumns
+from petl.transform.sorts import _iterchunk, _NamedTempFileDeleteOnGC
+import petl.config as config
+
+
+logger = logging.getLogger(__name__)
+debug = logger.debug
 
 
 def select(table, *args, **kwargs):
@@ -59,6 +70,17 @@ def select(table, *args, **kwargs):
 
     """
 
+    view = _selectview(table, args, kwargs)
+
+    # fuse consecutive selections, so all conditions are tested in one pass
+    if isinstance(table, (RowSelectView, FieldSelectView)):
+        return FusedSelectView(table.source, [table, view])
+    elif isinstance(table, FusedSelectView):
+        return FusedSelectView(table.source, table.conditions + [view])
+    return view
+
+
+def _selectview(table, args, kwargs):
     missing = kwargs.get('missing', None)
     complement = kwargs.get('complement', False)
 
@@ -95,6 +117,19 @@ class RowSelectView(Table):
         return iterrowselect(self.source, self.where, self.missing,
                              self.complement)
 
+    def selecter(self, hdr):
+        return _rowselecter(hdr, self.where, self.missing, self.complement)
+
+    def _iterbatches(self, size, missing):
+        return iterselectbatches(self.source, [self], size, self.missing)
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        def steps(hdr):
+            return tuple(hdr), [(True, self.selecter(hdr))]
+
+        return self.source, steps
+
 
 class FieldSelectView(Table):
 
@@ -109,6 +144,41 @@ class FieldSelectView(Table):
         return iterfieldselect(self.source, self.field, self.where,
                                self.complement, self.missing)
 
+    def selecter(self, hdr):
+        return _fieldselecter(hdr, self.field, self.where, self.complement,
+                              self.missing)
+
+    def _iterbatches(self, size, missing):
+        return iterselectbatches(self.source, [self], size, self.missing)
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        def steps(hdr):
+            return tuple(hdr), [(True, self.selecter(hdr))]
+
+        return self.source, steps
+
+
+class FusedSelectView(Table):
+
+    def __init__(self, source, conditions):
+        self.source = source
+        self.conditions = conditions
+
+    def __iter__(self):
+        return iterfusedselect(self.source, self.conditions)
+
+    def _iterbatches(self, size, missing):
+        return iterselectbatches(self.source, self.conditions, size, missing)
+
+    def _fuse(self):
+        # see petl.transform.fusion.optimize()
+        def steps(hdr):
+            return tuple(hdr), [(True, c.selecter(hdr))
+                                for c in self.conditions]
+
+        return self.source, steps
+
 
 def iterfieldselect(source, field, where, complement, missing):
     it = iter(source)
@@ -128,12 +198,73 @@ def iterfieldselect(source, field, where, complement, missing):
 def iterrowselect(source, where, missing, complement):
     it = iter(source)
     hdr = next(it)
-    flds = list(map(text_type, hdr))
     yield tuple(hdr)
-    it = (Record(row, flds, missing=missing) for row in it)
+    test = _rowselecter(hdr, where, missing, complement)
+    for row in it:
+        if test(row):
+            yield tuple(row)
+
+
+def iterfusedselect(source, conditions):
+    it = iter(source)
+    hdr = next(it)
+    yield tuple(hdr)
+    tests = [c.selecter(hdr) for c in conditions]
     for row in it:
-        if bool(where(row)) != complement:  # XOR
-            yield tuple(row)  # need to convert back to tuple?
+        for test in tests:
+            if not test(row):
+                break
+        else:
+            yield tuple(row)
+
+
+def iterselectbatches(source, conditions, size, missing):
+    batches = iterbatches(source, size, missing)
+    hdr = next(batches)
+    yield hdr
+    tests = [c.selecter(hdr) for c in conditions]
+    for cols in batches:
+        rows = batchrows(cols)
+        for test in tests:
+            rows = [row for row in rows if test(row)]
+        if rows:
+            yield batchcolumns(rows, len(hdr), missing)
+
+
+def _fieldselecter(hdr, field, where, complement, missing):
+    getv = operator.itemgetter(*asindices(hdr, field))
+
+    def test(row):
+        try:
+            v = getv(row)
+        except IndexError:
+            v = missing
+        return bool(where(v)) != complement  # XOR
+
+    return test
+
+
+def _rowselecter(hdr, where, missing, complement):
+    # returns a function testing whether a data row is selected, compiling
+    # expressions so that no record need be constructed for each row
+    flds = list(map(text_type, hdr))
+
+    def rectest(row):
+        return bool(where(Record(row, flds, missing=missing))) != complement
+
+    compiled = where.compile(hdr) if isinstance(where, Expr) else None
+    if compiled is None:
+        return rectest
+
+    n = len(hdr)
+
+    def test(row):
+        if len(row) < n:
+            # short row, fall back to record with missing values
+            return rectest(row)
+        return bool(compiled(row)) != complement
+
+    return test
 
 
 def rowlenselect(table, n, complement=False):
@@ -158,9 +289,13 @@ Table.selectop = selectop
 
 
 def selecteq(table, field, value, complement=False):
-    """Select rows where the given field equals the given value."""
+    """Select rows where the given field equals the given value. Uses an
+    index if `table` is indexed by `field`, see
+    :func:`petl.util.materialise.indexed`."""
 
-    return selectop(table, field, value, operator.eq, complement=complement)
+    fallback = selectop(table, field, value, operator.eq,
+                        complement=complement)
+    return _indexselect(table, field, complement, fallback, 'eq', value)
 
 
 Table.selecteq = selecteq
@@ -180,8 +315,10 @@ Table.ne = selectne
 def selectlt(table, field, value, complement=False):
     """Select rows where the given field is less than the given value."""
 
-    value = Comparable(value)
-    return selectop(table, field, value, operator.lt, complement=complement)
+    fallback = selectop(table, field, Comparable(value), operator.lt,
+                        complement=complement)
+    return _indexselect(table, field, complement, fallback, 'range', None,
+                        (value,), False, False)
 
 
 Table.selectlt = selectlt
@@ -192,8 +329,10 @@ def selectle(table, field, value, complement=False):
     """Select rows where the given field is less than or equal to the given
     value."""
 
-    value = Comparable(value)
-    return selectop(table, field, value, operator.le, complement=complement)
+    fallback = selectop(table, field, Comparable(value), operator.le,
+                        complement=complement)
+    return _indexselect(table, field, complement, fallback, 'range', None,
+                        (value,), False, True)
 
 
 Table.selectle = selectle
@@ -203,8 +342,10 @@ Table.le = selectle
 def selectgt(table, field, value, complement=False):
     """Select rows where the given field is greater than the given value."""
 
-    value = Comparable(value)
-    return selectop(table, field, value, operator.gt, complement=complement)
+    fallback = selectop(table, field, Comparable(value), operator.gt,
+                        complement=complement)
+    return _indexselect(table, field, complement, fallback, 'range',
+                        (value,), None, False, False)
 
 
 Table.selectgt = selectgt
@@ -215,8 +356,10 @@ def selectge(table, field, value, complement=False):
     """Select rows where the given field is greater than or equal to the given
     value."""
 
-    value = Comparable(value)
-    return selectop(table, field, value, operator.ge, complement=complement)
+    fallback = selectop(table, field, Comparable(value), operator.ge,
+                        complement=complement)
+    return _indexselect(table, field, complement, fallback, 'range',
+                        (value,), None, True, False)
 
 
 Table.selectge = selectge
@@ -234,10 +377,16 @@ Table.selectcontains = selectcontains
 
 
 def selectin(table, field, value, complement=False):
-    """Select rows where the given field is a member of the given value."""
+    """Select rows where the given field is a member of the given value.
+    Uses an index if `table` is indexed by `field`, see
+    :func:`petl.util.materialise.indexed`."""
 
-    return select(table, field, lambda v: v in value,
-                  complement=complement)
+    fallback = select(table, field, lambda v: v in value,
+                      complement=complement)
+    if isinstance(value, string_types):
+        # substring semantics
+        return fallback
+    return _indexselect(table, field, complement, fallback, 'isin', value)
 
 
 Table.selectin = selectin
@@ -284,10 +433,12 @@ def selectrangeopenleft(table, field, minv, maxv, complement=False):
     """Select rows where the given field is greater than or equal to `minv` and
     less than `maxv`."""
 
-    minv = Comparable(minv)
-    maxv = Comparable(maxv)
-    return select(table, field, lambda v: minv <= v < maxv,
-                  complement=complement)
+    cminv = Comparable(minv)
+    cmaxv = Comparable(maxv)
+    fallback = select(table, field, lambda v: cminv <= v < cmaxv,
+                      complement=complement)
+    return _indexselect(table, field, complement, fallback, 'range',
+                        (minv,), (maxv,), True, False)
 
 
 Table.selectrangeopenleft = selectrangeopenleft
@@ -297,10 +448,12 @@ def selectrangeopenright(table, field, minv, maxv, complement=False):
     """Select rows where the given field is greater than `minv` and
     less than or equal to `maxv`."""
 
-    minv = Comparable(minv)
-    maxv = Comparable(maxv)
-    return select(table, field, lambda v: minv < v <= maxv,
-                  complement=complement)
+    cminv = Comparable(minv)
+    cmaxv = Comparable(maxv)
+    fallback = select(table, field, lambda v: cminv < v <= cmaxv,
+                      complement=complement)
+    return _indexselect(table, field, complement, fallback, 'range',
+                        (minv,), (maxv,), False, True)
 
 
 Table.selectrangeopenright = selectrangeopenright
@@ -310,10 +463,12 @@ def selectrangeopen(table, field, minv, maxv, complement=False):
     """Select rows where the given field is greater than or equal to `minv` and
     less than or equal to `maxv`."""
 
-    minv = Comparable(minv)
-    maxv = Comparable(maxv)
-    return select(table, field, lambda v: minv <= v <= maxv,
-                  complement=complement)
+    cminv = Comparable(minv)
+    cmaxv = Comparable(maxv)
+    fallback = select(table, field, lambda v: cminv <= v <= cmaxv,
+                      complement=complement)
+    return _indexselect(table, field, complement, fallback, 'range',
+                        (minv,), (maxv,), True, True)
 
 
 Table.selectrangeopen = selectrangeopen
@@ -323,15 +478,59 @@ def selectrangeclosed(table, field, minv, maxv, complement=False):
     """Select rows where the given field is greater than `minv` and
     less than `maxv`."""
 
-    minv = Comparable(minv)
-    maxv = Comparable(maxv)
-    return select(table, field, lambda v: minv < Comparable(v) < maxv,
-                  complement=complement)
+    cminv = Comparable(minv)
+    cmaxv = Comparable(maxv)
+    fallback = select(table, field, lambda v: cminv < Comparable(v) < cmaxv,
+                      complement=complement)
+    return _indexselect(table, field, complement, fallback, 'range',
+                        (minv,), (maxv,), False, False)
 
 
 Table.selectrangeclosed = selectrangeclosed
 
 
+def _indexselect(table, field, complement, fallback, method, *args):
+    # use an index of an indexed table if there is one, see IndexSelectView
+    if complement or not isinstance(table, IndexedView):
+        return fallback
+    return IndexSelectView(table, field, fallback, method, args)
+
+
+class IndexSelectView(Table):
+
+    def __init__(self, source, field, fallback, method, args):
+        self.source = source
+        self.field = field
+        self.fallback = fallback
+        self.method = method
+        self.args = args
+
+    def __iter__(self):
+        return iterindexselect(self.source, self.field, self.fallback,
+                               self.method, self.args)
+
+
+def iterindexselect(source, field, fallback, method, args):
+    kinds = ('sorted',) if method == 'range' else ('hash', 'sorted')
+    index = source.getindex(field, kinds)
+    positions = None
+    if index is not None:
+        try:
+            positions = getattr(index, method)(*args)
+        except TypeError:
+            # e.g., unhashable value
+            pass
+    if positions is None:
+        # no suitable index, scan the table
+        for row in fallback:
+            yield row
+    else:
+        hdr, rows = source.store.materialise()
+        yield hdr
+        for i in positions:
+            yield rows[i]
+
+
 def selecttrue(table, field, complement=False):
     """Select rows where the given field evaluates `True`."""
 
@@ -472,6 +671,10 @@ def facet(table, key):
 
     See also :func:`petl.util.materialise.facetcolumns`.
 
+    N.B., each of the returned tables reads the whole of the input table when
+    iterated, see :func:`petl.transform.selects.partition` for an alternative
+    that reads the input table only once.
+
     """
 
     fct = dict()
@@ -530,3 +733,228 @@ def biselect(table, *args, **kwargs):
 
 
 Table.biselect = biselect
+
+
+def partition(table, key, buffersize=None, tempdir=None):
+    """
+    Return a dictionary mapping field values to tables, as
+    :func:`petl.transform.selects.facet`, but reading the input table only
+    once, routing each row to a buffer for its value of the `key` field(s).
+    E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar', 'baz'],
+        ...           ['a', 4, 9.3],
+        ...           ['a', 2, 88.2],
+        ...           ['b', 1, 23.3],
+        ...           ['c', 8, 42.0],
+        ...           ['d', 7, 100.9],
+        ...           ['c', 2]]
+        >>> foo = etl.partition(table1, 'foo')
+        >>> list(foo.keys())
+        ['a', 'b', 'c', 'd']
+        >>> foo['c']
+        +-----+-----+------+
+        | foo | bar | baz  |
+        +=====+=====+======+
+        | 'c' |   8 | 42.0 |
+        +-----+-----+------+
+        | 'c' |   2 |      |
+        +-----+-----+------+
+
+    The input table is read when this function is called, and keys are in the
+    order first found. If the number of rows exceeds `buffersize` (by default
+    `petl.config.sort_buffersize`), buffered rows are appended to a temporary
+    file for each key whenever the buffers are full, so memory use is bounded
+    however many keys there are. Temporary files are created in `tempdir` and
+    deleted when the returned tables are garbage collected.
+
+    """
+
+    hdr, parts = _partition(table, lambda hdr: _keygetter(hdr, key),
+                            buffersize, tempdir)
+    return OrderedDict((k, PartitionView(hdr, part))
+                       for k, part in parts.items())
+
+
+Table.partition = partition
+
+
+def bipartition(table, *args, **kwargs):
+    """
+    Return two tables, the first containing selected rows, the second
+    containing remaining rows, as :func:`petl.transform.selects.biselect`,
+    but reading the input table only once, see
+    :func:`petl.transform.selects.partition`. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar'],
+        ...           ['a', 4],
+        ...           ['b', 1],
+        ...           ['a', 2],
+        ...           ['c', 8]]
+        >>> table2, table3 = etl.bipartition(table1, "{foo} == 'a'")
+        >>> table2
+        +-----+-----+
+        | foo | bar |
+        +=====+=====+
+        | 'a' |   4 |
+        +-----+-----+
+        | 'a' |   2 |
+        +-----+-----+
+
+        >>> table3
+        +-----+-----+
+        | foo | bar |
+        +=====+=====+
+        | 'b' |   1 |
+        +-----+-----+
+        | 'c' |   8 |
+        +-----+-----+
+
+    The `buffersize` and `tempdir` keyword arguments are passed through to
+    :func:`petl.transform.selects.partition`, and other arguments are as
+    :func:`petl.transform.selects.select`.
+
+    """
+
+    buffersize = kwargs.pop('buffersize', None)
+    tempdir = kwargs.pop('tempdir', None)
+    kwargs['complement'] = False
+    view = _selectview(table, args, kwargs)
+    hdr, parts = _partition(table, view.selecter, buffersize, tempdir)
+    return (PartitionView(hdr, parts.get(True, [])),
+            PartitionView(hdr, parts.get(False, [])))
+
+
+Table.bipartition = bipartition
+
+
+def tofacets(table, key, source, write=None, append=None, buffersize=None,
+             **kwargs):
+    """
+    Write the rows for each value of the `key` field(s) to a separate file,
+    reading the input table only once. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar'],
+        ...           ['a', 4],
+        ...           ['b', 1],
+        ...           ['a', 2]]
+        >>> etl.tofacets(table1, 'foo', 'example_{}.csv')
+        >>> etl.fromcsv('example_a.csv')
+        +-----+-----+
+        | foo | bar |
+        +=====+=====+
+        | 'a' | '4' |
+        +-----+-----+
+        | 'a' | '2' |
+        +-----+-----+
+
+    The `source` argument is either a string, formatted with the key value
+    to give the file name for each facet, or a function returning the file
+    name or source for a key value.
+
+    Buffered rows are written whenever there are `buffersize` rows (by
+    default `petl.config.sort_buffersize`) in all the buffers, using the
+    `write` function (:func:`petl.io.csv.tocsv` by default) for the first
+    rows for each key, then the `append` function
+    (:func:`petl.io.csv.appendcsv` by default). Any other keyword arguments
+    are passed through to these functions.
+
+    """
+
+    if write is None:
+        from petl.io.csv import tocsv as write
+    if append is None:
+        from petl.io.csv import appendcsv as append
+    if callable(source):
+        getsource = source
+    else:
+        getsource = source.format
+    sources = dict()
+
+    def flush(hdr, buffers, final):
+        for k, rows in buffers.items():
+            if k in sources:
+                append([hdr] + rows, sources[k], **kwargs)
+            else:
+                sources[k] = getsource(k)
+                write([hdr] + rows, sources[k], **kwargs)
+
+    _routerows(table, lambda hdr: _keygetter(hdr, key), flush, buffersize)
+
+
+Table.tofacets = tofacets
+
+
+class PartitionView(Table):
+
+    def __init__(self, hdr, rows):
+        self.hdr = hdr
+        # N.B., either a list of rows, or a temporary file of pickled rows,
+        # which is deleted when the view is garbage collected
+        self.rows = rows
+
+    def __iter__(self):
+        yield tuple(self.hdr)
+        if isinstance(self.rows, list):
+            for row in self.rows:
+                yield row
+        else:
+            for row in _iterchunk(self.rows.name):
+                yield row
+
+
+def _keygetter(hdr, key):
+    indices = asindices(hdr, key)
+    return operator.itemgetter(*indices)
+
+
+def _routerows(table, getkeyer, flush, buffersize):
+    # group rows in buffers by key, calling flush(hdr, buffers, final)
+    # whenever there are buffersize rows in all buffers, and at the end
+    if buffersize is None:
+        buffersize = config.sort_buffersize
+    it = iter(table)
+    hdr = tuple(next(it))
+    getkey = getkeyer(hdr)
+    buffers = OrderedDict()
+    n = 0
+    for row in it:
+        k = getkey(row)
+        try:
+            buffers[k].append(tuple(row))
+        except KeyError:
+            buffers[k] = [tuple(row)]
+        n += 1
+        if buffersize is not None and n >= buffersize:
+            flush(hdr, buffers, False)
+            buffers = OrderedDict()
+            n = 0
+    flush(hdr, buffers, True)
+    return hdr
+
+
+def _partition(table, getkeyer, buffersize, tempdir):
+    # returns the header and a dictionary mapping keys to lists of rows, if
+    # all rows fit in the buffers, otherwise to temporary files of rows
+    parts = OrderedDict()
+
+    def flush(hdr, buffers, final):
+        if final and not parts:
+            parts.update(buffers)
+            return
+        for k, rows in buffers.items():
+            if k not in parts:
+                with NamedTemporaryFile(dir=tempdir, delete=False,
+                                        mode='wb') as f:
+                    # N.B., deleted when all references to the wrapper are gone
+                    parts[k] = _NamedTempFileDeleteOnGC(f.name)
+                    debug('created temporary partition file %s' % f.name)
+            with open(parts[k].name, 'ab') as f:
+                for row in rows:
+                    pickle.dump(row, f, protocol=-1)
+
+    hdr = _routerows(table, getkeyer, flush, buffersize)
+    return hdr, parts
@@ -1,15 +1,21 @@
 from __future__ import absolute_import, print_function, division
 
 
-from petl.compat import Counter, next
+import itertools
+import hashlib
+import operator
+from petl.compat import Counter, next, string_types, pickle, PY2
+
+
 from petl.comparison import Comparable
-from petl.util.base import header, Table
+from petl.errors import ArgumentError
+from petl.util.base import header, Table, asindices
 from petl.transform.sorts import sort
 from petl.transform.basics import cut
 
 
 def complement(a, b, presorted=False, buffersize=None, tempdir=None,
-               cache=True, strict=False):
+               cache=True, strict=False, digest=None):
     """
     Return rows in `a` that are not in `b`. E.g.::
 
@@ -93,8 +99,23 @@ def complement(a, b, presorted=False, buffersize=None, tempdir=None,
     If `strict` is `True` then strict set-like behaviour is used, i.e., 
     only rows in `a` not found in `b` are returned.
 
+    If `digest` is True, rows are compared by a fixed-size digest of each row
+    rather than by value, which may be much faster for wide tables. Only
+    digests are sorted, along with the position of each row in `a`, and
+    the rows to be returned are then fetched from `a` in a second pass, so
+    rows are returned in their original order rather than sorted, and the
+    `presorted` argument is ignored. Alternatively, `digest` may be a field
+    name or index, or list of field names or indices, in which case rows are
+    compared only on the digest of those fields, as located in the header of
+    `a`. N.B., digests are computed from the :func:`repr` of values, so
+    values which compare equal but have different representations, e.g.,
+    ``1`` and ``1.0``, are not matched.
+
     """
 
+    if digest:
+        return DigestComplementView(a, b, digest, strict=strict,
+                                    buffersize=buffersize, tempdir=tempdir)
     return ComplementView(a, b, presorted=presorted, buffersize=buffersize,
                           tempdir=tempdir, cache=cache, strict=strict)
 
@@ -166,7 +187,7 @@ def itercomplement(ta, tb, strict):
 
 
 def recordcomplement(a, b, buffersize=None, tempdir=None, cache=True,
-                     strict=False):
+                     strict=False, digest=None):
     """
     Find records in `a` that are not in `b`. E.g.::
 
@@ -218,14 +239,14 @@ def recordcomplement(a, b, buffersize=None, tempdir=None, cache=True,
     # make sure fields are in the same order
     bv = cut(b, *ha)
     return complement(a, bv, buffersize=buffersize, tempdir=tempdir,
-                      cache=cache, strict=strict)
+                      cache=cache, strict=strict, digest=digest)
 
 
 Table.recordcomplement = recordcomplement
 
 
 def diff(a, b, presorted=False, buffersize=None, tempdir=None, cache=True,
-         strict=False):
+         strict=False, digest=None):
     """
     Find the difference between rows in two tables. Returns a pair of tables.
     E.g.::
@@ -275,22 +296,31 @@ def diff(a, b, presorted=False, buffersize=None, tempdir=None, cache=True,
 
     If `strict` is `True` then strict set-like behaviour is used.
 
+    The `digest` argument is passed through to
+    :func:`petl.transform.setops.complement`, in which case neither table is
+    sorted. Any fields given are located in the header of `a`.
+
     """
 
-    if not presorted:
+    if digest and digest is not True:
+        digest = asindices(header(a), digest)
+    if not presorted and not digest:
         a = sort(a)
         b = sort(b)
     added = complement(b, a, presorted=True, buffersize=buffersize,
-                       tempdir=tempdir, cache=cache, strict=strict)
+                       tempdir=tempdir, cache=cache, strict=strict,
+                       digest=digest)
     subtracted = complement(a, b, presorted=True, buffersize=buffersize,
-                            tempdir=tempdir, cache=cache, strict=strict)
+                            tempdir=tempdir, cache=cache, strict=strict,
+                            digest=digest)
     return added, subtracted
 
 
 Table.diff = diff
 
 
-def recorddiff(a, b, buffersize=None, tempdir=None, cache=True, strict=False):
+def recorddiff(a, b, buffersize=None, tempdir=None, cache=True, strict=False,
+               digest=None):
     """
     Find the difference between records in two tables. E.g.::
 
@@ -335,12 +365,15 @@ def recorddiff(a, b, buffersize=None, tempdir=None, cache=True, strict=False):
 
     If `strict` is `True` then strict set-like behaviour is used.
 
+    The `digest` argument is passed through to
+    :func:`petl.transform.setops.complement`.
+
     """
 
     added = recordcomplement(b, a, buffersize=buffersize, tempdir=tempdir,
-                             cache=cache, strict=strict)
+                             cache=cache, strict=strict, digest=digest)
     subtracted = recordcomplement(a, b, buffersize=buffersize, tempdir=tempdir,
-                                  cache=cache, strict=strict)
+                                  cache=cache, strict=strict, digest=digest)
     return added, subtracted
 
 
@@ -348,7 +381,7 @@ Table.recorddiff = recorddiff
 
 
 def intersection(a, b, presorted=False, buffersize=None, tempdir=None,
-                 cache=True):
+                 cache=True, digest=None):
     """
     Return rows in `a` that are also in `b`. E.g.::
 
@@ -379,8 +412,14 @@ def intersection(a, b, presorted=False, buffersize=None, tempdir=None,
     `buffersize`, `tempdir` and `cache` arguments under the
     :func:`petl.transform.sorts.sort` function.
 
+    If `digest` is given, rows are compared by digest, and returned in their
+    original order, as for :func:`petl.transform.setops.complement`.
+
     """
 
+    if digest:
+        return DigestComplementView(a, b, digest, intersection=True,
+                                    buffersize=buffersize, tempdir=tempdir)
     return IntersectionView(a, b, presorted=presorted, buffersize=buffersize,
                             tempdir=tempdir, cache=cache)
 
@@ -427,7 +466,7 @@ def iterintersection(a, b):
         pass
 
 
-def hashcomplement(a, b, strict=False):
+def hashcomplement(a, b, strict=False, digest=None, key=None):
     """
     Alternative implementation of :func:`petl.transform.setops.complement`,
     where the complement is executed by constructing an in-memory set for all
@@ -442,9 +481,36 @@ def hashcomplement(a, b, strict=False):
     If `strict` is `True` then strict set-like behaviour is used, i.e., 
     only rows in `a` not found in `b` are returned.
 
+    If `digest` is given, only a fixed-size digest of each row in `b` is held
+    in memory, see :func:`petl.transform.setops.complement`.
+
+    If `key` is given, rows are compared by the values of the `key` field(s)
+    only, and only those values (or their digest if `digest` is True) are held
+    in memory, e.g.::
+
+        >>> import petl as etl
+        >>> a = [['id', 'foo', 'bar'],
+        ...      [1, 'a', True],
+        ...      [2, 'b', False],
+        ...      [3, 'c', True]]
+        >>> b = [['bar', 'id'],
+        ...      [False, 2],
+        ...      [True, 4]]
+        >>> etl.hashcomplement(a, b, key='id')
+        +----+-----+------+
+        | id | foo | bar  |
+        +====+=====+======+
+        |  1 | 'a' | True |
+        +----+-----+------+
+        |  3 | 'c' | True |
+        +----+-----+------+
+
+    Key fields are located by name in the header of each table, so need not
+    be in the same position.
+
     """
 
-    return HashComplementView(a, b, strict=strict)
+    return HashComplementView(a, b, strict=strict, digest=digest, key=key)
 
 
 Table.hashcomplement = hashcomplement
@@ -452,34 +518,37 @@ Table.hashcomplement = hashcomplement
 
 class HashComplementView(Table):
 
-    def __init__(self, a, b, strict=False):
+    def __init__(self, a, b, strict=False, digest=None, key=None):
         self.a = a
         self.b = b
         self.strict = strict
+        self.digest = digest
+        self.key = key
 
     def __iter__(self):
-        return iterhashcomplement(self.a, self.b, self.strict)
+        return iterhashcomplement(self.a, self.b, self.strict, self.digest,
+                                  self.key)
 
 
-def iterhashcomplement(a, b, strict):
+def iterhashcomplement(a, b, strict, digest=None, key=None):
     ita = iter(a)
     ahdr = next(ita)
     yield tuple(ahdr)
-    itb = iter(b)
-    next(itb)  # discard b header, assume same as a
 
+    getkey = _rowkeyer(ahdr, digest, key)
     # N.B., need to account for possibility of duplicate rows
-    bcnt = Counter(tuple(row) for row in itb)
+    bcnt = _countkeys(b, ahdr, digest, key)
     for ar in ita:
         t = tuple(ar)
-        if bcnt[t] > 0:
+        d = getkey(t)
+        if bcnt[d] > 0:
             if not strict:
-                bcnt[t] -= 1
+                bcnt[d] -= 1
         else:
             yield t
 
 
-def hashintersection(a, b):
+def hashintersection(a, b, *tables, **kwargs):
     """
     Alternative implementation of
     :func:`petl.transform.setops.intersection`, where the intersection
@@ -489,9 +558,41 @@ def hashintersection(a, b):
     May be faster and/or more resource efficient where the right table is small
     and the left table is large.
 
+    If `digest` is given, only a fixed-size digest of each row in `b` is held
+    in memory, see :func:`petl.transform.setops.complement`.
+
+    If `key` is given, rows are compared by the values of the `key` field(s)
+    only, see :func:`petl.transform.setops.hashcomplement`.
+
+    Any number of further tables may be given, in which case rows of `a`
+    found in all the other tables are returned. Each table is iterated once,
+    and no more than the distinct rows (or keys) of `b` are held in memory,
+    so the cost is linear in the total number of rows, e.g.::
+
+        >>> import petl as etl
+        >>> a = [['id', 'foo'],
+        ...      [1, 'a'],
+        ...      [2, 'b'],
+        ...      [3, 'c'],
+        ...      [4, 'd']]
+        >>> b = [['id'], [1], [2], [3]]
+        >>> c = [['id'], [4], [3], [2]]
+        >>> d = [['id'], [3], [2], [2]]
+        >>> etl.hashintersection(a, b, c, d, key='id')
+        +----+-----+
+        | id | foo |
+        +====+=====+
+        |  2 | 'b' |
+        +----+-----+
+        |  3 | 'c' |
+        +----+-----+
+
+    Duplicate rows are returned as many times as they are found in all of the
+    tables.
+
     """
 
-    return HashIntersectionView(a, b)
+    return HashIntersectionView(a, (b,) + tables, **kwargs)
 
 
 Table.hashintersection = hashintersection
@@ -499,25 +600,359 @@ Table.hashintersection = hashintersection
 
 class HashIntersectionView(Table):
 
-    def __init__(self, a, b):
+    def __init__(self, a, b, digest=None, key=None):
         self.a = a
+        # N.B., b may be a single table or a tuple of tables
         self.b = b
+        self.digest = digest
+        self.key = key
 
     def __iter__(self):
-        return iterhashintersection(self.a, self.b)
+        return iterhashintersection(self.a, self.b, self.digest, self.key)
 
 
-def iterhashintersection(a, b):
+def iterhashintersection(a, b, digest=None, key=None):
     ita = iter(a)
     ahdr = next(ita)
     yield tuple(ahdr)
-    itb = iter(b)
-    next(itb)  # discard b header, assume same as a
 
+    others = b if isinstance(b, tuple) else (b,)
+    getkey = _rowkeyer(ahdr, digest, key)
     # N.B., need to account for possibility of duplicate rows
-    bcnt = Counter(tuple(row) for row in itb)
+    bcnt = _countkeys(others[0], ahdr, digest, key)
+    for other in others[1:]:
+        # keep only keys also found in the other table, with the lower count
+        cnt = Counter()
+        for d in _iterkeys(other, ahdr, digest, key):
+            if cnt[d] < bcnt[d]:
+                cnt[d] += 1
+        bcnt = cnt
     for ar in ita:
         t = tuple(ar)
-        if bcnt[t] > 0:
+        d = getkey(t)
+        if bcnt[d] > 0:
             yield t
-            bcnt[t] -= 1
+            bcnt[d] -= 1
+
+
+def _rowkeyer(hdr, digest, key):
+    # returns a function computing the value by which rows are compared, i.e.,
+    # the row or the `key` field values as a tuple, or their digest
+    if key is None:
+        return _rowdigester(hdr, digest)
+    if digest not in (None, False, True):
+        raise ArgumentError('digest must be a boolean if key is given')
+    indices = asindices(hdr, key)
+    if digest:
+        return _rowdigester(hdr, indices)
+    getvals = operator.itemgetter(*indices)
+    if len(indices) == 1:
+        return lambda row: (getvals(row),)
+    return getvals
+
+
+def _iterkeys(table, ahdr, digest, key):
+    it = iter(table)
+    hdr = next(it)
+    if key is None:
+        # assume same header as a
+        hdr = ahdr
+    getkey = _rowkeyer(hdr, digest, key)
+    for row in it:
+        yield getkey(row)
+
+
+def _countkeys(table, ahdr, digest, key):
+    return Counter(_iterkeys(table, ahdr, digest, key))
+
+
+try:
+    from hashlib import blake2b
+except ImportError:
+    # python < 3.6
+    def _hash(data):
+        return hashlib.md5(data).digest()
+else:
+    def _hash(data):
+        return blake2b(data, digest_size=16).digest()
+
+
+def _rowdigester(hdr, digest):
+    # returns a function computing a 16 byte digest of each row, or of the
+    # given fields, or if `digest` is not set, the row itself as a tuple
+    if not digest:
+        return tuple
+    if digest is True:
+        getvals = tuple
+    else:
+        getvals = operator.itemgetter(*asindices(hdr, digest))
+
+    def getdigest(row):
+        r = repr(getvals(row))
+        if not isinstance(r, bytes):
+            r = r.encode('utf-8')
+        return _hash(r)
+
+    return getdigest
+
+
+class DigestComplementView(Table):
+
+    def __init__(self, a, b, digest, strict=False, intersection=False,
+                 buffersize=None, tempdir=None):
+        self.a = a
+        self.b = b
+        self.digest = digest
+        self.strict = strict
+        self.intersection = intersection
+        self.buffersize = buffersize
+        self.tempdir = tempdir
+
+    def __iter__(self):
+        return iterdigestcomplement(self.a, self.b, self.digest, self.strict,
+                                    self.intersection, self.buffersize,
+                                    self.tempdir)
+
+
+class _DigestView(Table):
+    # (digest, position) for each data row of a table
+
+    def __init__(self, table, getdigest):
+        self.table = table
+        self.getdigest = getdigest
+
+    def __iter__(self):
+        it = iter(self.table)
+        next(it)
+        yield ('digest', 'position')
+        getdigest = self.getdigest
+        for i, row in enumerate(it):
+            yield getdigest(row), i
+
+
+def iterdigestcomplement(a, b, digest, strict, intersection, buffersize,
+                         tempdir):
+    ita = iter(a)
+    ahdr = next(ita)
+    yield tuple(ahdr)
+
+    # sort digests only, then find the positions of rows to return
+    getdigest = _rowdigester(ahdr, digest)
+    da = sort(_DigestView(a, getdigest), buffersize=buffersize,
+              tempdir=tempdir, cache=False)
+    db = sort(_DigestView(b, getdigest), buffersize=buffersize,
+              tempdir=tempdir, cache=False)
+    positions = _DigestPositionsView(da, db, strict, intersection)
+    positions = sort(positions, buffersize=buffersize, tempdir=tempdir,
+                     cache=False)
+
+    # fetch rows from a
+    itpos = iter(positions)
+    next(itpos)  # skip header
+    target = next(itpos, None)
+    for i, row in enumerate(ita):
+        if target is None:
+            break
+        if i == target[0]:
+            yield tuple(row)
+            target = next(itpos, None)
+
+
+class _DigestPositionsView(Table):
+    # positions of rows in a to be returned, given (digest, position) rows
+    # from a and b sorted by digest
+
+    def __init__(self, da, db, strict, intersection):
+        self.da = da
+        self.db = db
+        self.strict = strict
+        self.intersection = intersection
+
+    def __iter__(self):
+        yield ('position',)
+        getdigest = operator.itemgetter(0)
+        ita = iter(self.da)
+        next(ita)
+        itb = iter(self.db)
+        next(itb)
+        groupsb = itertools.groupby(itb, key=getdigest)
+        db, rowsb = next(groupsb, (None, ()))
+        for da, rowsa in itertools.groupby(ita, key=getdigest):
+            while db is not None and db < da:
+                db, rowsb = next(groupsb, (None, ()))
+            # number of rows in b with the same digest
+            nb = sum(1 for _ in rowsb) if db == da else 0
+            if self.intersection:
+                # rows in a matched by rows in b
+                rowsa = itertools.islice(rowsa, nb)
+            elif nb and self.strict:
+                continue
+            else:
+                # rows in a not cancelled out by rows in b
+                rowsa = itertools.islice(rowsa, nb, None)
+            for _, pos in rowsa:
+                yield pos,
+
+
+def capturechanges(table, key, store, name='snapshot', unchanged=False,
+                   changefield='change', missing=None):
+    """
+    Compare a snapshot of a table with the previous snapshot, as recorded in
+    a persistent store of a digest of each row by key, classifying rows as
+    inserted, updated, deleted or (optionally) unchanged, and updating the
+    store. E.g.::
+
+        >>> import petl as etl
+        >>> import sqlite3
+        >>> store = sqlite3.connect(':memory:')
+        >>> table1 = [['id', 'foo', 'bar'],
+        ...           [1, 'a', True],
+        ...           [2, 'b', False],
+        ...           [3, 'c', True]]
+        >>> table2 = [['id', 'foo', 'bar'],
+        ...           [1, 'a', True],
+        ...           [3, 'c', False],
+        ...           [4, 'd', True]]
+        >>> changes1 = etl.capturechanges(table1, 'id', store)
+        >>> changes1.lookall()
+        +----+-----+-------+------------+
+        | id | foo | bar   | change     |
+        +====+=====+=======+============+
+        |  1 | 'a' | True  | 'inserted' |
+        +----+-----+-------+------------+
+        |  2 | 'b' | False | 'inserted' |
+        +----+-----+-------+------------+
+        |  3 | 'c' | True  | 'inserted' |
+        +----+-----+-------+------------+
+
+        >>> changes2 = etl.capturechanges(table2, 'id', store)
+        >>> changes2.lookall()
+        +----+------+-------+------------+
+        | id | foo  | bar   | change     |
+        +====+======+=======+============+
+        |  3 | 'c'  | False | 'updated'  |
+        +----+------+-------+------------+
+        |  4 | 'd'  | True  | 'inserted' |
+        +----+------+-------+------------+
+        |  2 | None | None  | 'deleted'  |
+        +----+------+-------+------------+
+
+    The `store` argument may be a :mod:`sqlite3` connection or the name of a
+    sqlite3 database file, in which the digests are held in a table named
+    `name`, which is created if necessary, so several snapshots may share a
+    store.
+
+    The table is iterated once, in input order, looking up each key in the
+    store, so work is proportional to the size of the new snapshot and memory
+    use is bounded. Rows with keys not seen in the new snapshot are then
+    output as deleted, with fields other than the key set to `missing`,
+    because only a digest of each row is stored. Unchanged rows are only
+    output if `unchanged` is True. The type of change is added as a field
+    named `changefield`.
+
+    N.B., iterating the view updates the store, so the view should be
+    iterated once, e.g., via :func:`petl.util.materialise.listoflists` or by
+    writing it out. The update is committed only once all rows have been
+    iterated, and rolled back if iteration is abandoned or fails. Values are
+    compared via their :func:`repr`, see :func:`petl.transform.setops.diff`.
+
+    """
+
+    return CaptureChangesView(table, key, store, name=name,
+                              unchanged=unchanged, changefield=changefield,
+                              missing=missing)
+
+
+Table.capturechanges = capturechanges
+
+
+class CaptureChangesView(Table):
+
+    def __init__(self, table, key, store, name='snapshot', unchanged=False,
+                 changefield='change', missing=None):
+        self.table = table
+        self.key = key
+        if isinstance(store, string_types):
+            import sqlite3
+            store = sqlite3.connect(store)
+        self.store = store
+        self.name = name
+        self.unchanged = unchanged
+        self.changefield = changefield
+        self.missing = missing
+
+    def __iter__(self):
+        return itercapturechanges(self.table, self.key, self.store,
+                                  self.name, self.unchanged, self.changefield,
+                                  self.missing)
+
+
+def itercapturechanges(table, key, store, name, unchanged, changefield,
+                       missing):
+    it = iter(table)
+    hdr = next(it)
+    yield tuple(hdr) + (changefield,)
+
+    keyindices = asindices(hdr, key)
+    getkey = operator.itemgetter(*keyindices)
+    getdigest = _rowdigester(hdr, True)
+    quoted = '"%s"' % name.replace('"', '""')
+
+    cursor = store.cursor()
+    try:
+        cursor.execute('CREATE TABLE IF NOT EXISTS %s (key TEXT PRIMARY KEY, '
+                       'keyvalues BLOB, digest BLOB, run INTEGER)' % quoted)
+        cursor.execute('CREATE INDEX IF NOT EXISTS "%s_run" ON %s (run)'
+                       % (name.replace('"', '""'), quoted))
+        cursor.execute('SELECT MAX(run) FROM %s' % quoted)
+        run = (cursor.fetchone()[0] or 0) + 1
+        select = 'SELECT digest FROM %s WHERE key = ?' % quoted
+        insert = 'INSERT INTO %s VALUES (?, ?, ?, ?)' % quoted
+        update = 'UPDATE %s SET digest = ?, run = ? WHERE key = ?' % quoted
+
+        for row in it:
+            row = tuple(row)
+            k = getkey(row)
+            if len(keyindices) == 1:
+                k = k,
+            krepr = repr(k)
+            digest = _sqlblob(getdigest(row))
+            cursor.execute(select, (krepr,))
+            found = cursor.fetchone()
+            if found is None:
+                cursor.execute(insert, (krepr, _sqlblob(pickle.dumps(k, 2)),
+                                        digest, run))
+                yield row + ('inserted',)
+            else:
+                cursor.execute(update, (digest, run, krepr))
+                if bytes(found[0]) != bytes(digest):
+                    yield row + ('updated',)
+                elif unchanged:
+                    yield row + ('unchanged',)
+
+        # keys not seen in this run have been deleted
+        cursor.execute('SELECT keyvalues FROM %s WHERE run < ?' % quoted,
+                       (run,))
+        for (keyvalues,) in cursor:
+            k = pickle.loads(bytes(keyvalues))
+            outrow = [missing] * len(hdr)
+            for i, v in zip(keyindices, k):
+                outrow[i] = v
+            yield tuple(outrow) + ('deleted',)
+        cursor.execute('DELETE FROM %s WHERE run < ?' % quoted, (run,))
+
+    except BaseException:
+        # includes GeneratorExit, leave the store as it was
+        store.rollback()
+        raise
+    else:
+        store.commit()
+    finally:
+        cursor.close()
+
+
+def _sqlblob(data):
+    # N.B., sqlite3 requires buffer objects for blobs under python 2
+    if PY2:
+        return buffer(data)
+    return data
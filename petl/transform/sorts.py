@@ -565,3 +565,55 @@ def issorted(table, key=None, reverse=False, strict=False):
 
 
 Table.issorted = issorted
+
+
+# number of temporary files rows or partial states are spilled to when a
+# hash-based transformation exceeds its memory budget, and the maximum depth
+# to which a partition may be partitioned again
+_spillpartitions = 16
+_spilldepth = 8
+
+
+class _HashPartitions(object):
+    # a set of temporary files, to which pickled objects are written according
+    # to the hash of a key, using a different digit of the hash at each depth
+    # of partitioning so that keys are divided differently if a partition
+    # needs partitioning again
+
+    def __init__(self, depth, tempdir, n=_spillpartitions):
+        self.depth = depth
+        self.files = list()
+        # N.B., files will be deleted when the wrappers are garbage collected
+        self.partitions = list()
+        for _ in range(n):
+            with NamedTemporaryFile(dir=tempdir, delete=False,
+                                    mode='wb') as f:
+                self.partitions.append(_NamedTempFileDeleteOnGC(f.name))
+            self.files.append(open(f.name, 'wb'))
+
+    def dump(self, k, obj):
+        n = len(self.files)
+        f = self.files[hash(k) // n ** self.depth % n]
+        pickle.dump(obj, f, protocol=-1)
+
+    def close(self):
+        for f in self.files:
+            f.close()
+
+
+def _itermergepartitions(spill, process, getorder, tempdir):
+    # apply `process` to the name of each non-empty partition in turn, writing
+    # the results, which should be ordered by `getorder`, to a temporary file,
+    # then merge the results from all partitions
+    runs = list()
+    for partition in spill.partitions:
+        if not os.path.getsize(partition.name):
+            continue
+        with NamedTemporaryFile(dir=tempdir, delete=False, mode='wb') as f:
+            run = _NamedTempFileDeleteOnGC(f.name)
+            for item in process(partition.name):
+                pickle.dump(item, f, protocol=-1)
+        runs.append(run)
+    runiters = [_iterchunk(run.name) for run in runs]
+    for item in _mergesorted(getorder, False, *runiters):
+        yield item
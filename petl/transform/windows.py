@@ -0,0 +1,339 @@
+from __future__ import absolute_import, print_function, division
+
+
+import math
+import itertools
+import operator
+from collections import deque
+
+
+from petl.compat import OrderedDict, next
+from petl.comparison import Comparable
+from petl.errors import ArgumentError
+from petl.util.base import Table, asindices
+from petl.transform.sorts import sort
+
+
+def window(table, key, windows, order=None, presorted=False, buffersize=None,
+           tempdir=None, cache=True):
+    """
+    Add fields computed by window functions over the rows in each partition
+    of the table, where rows are partitioned by the `key` field(s) and
+    ordered within each partition by the `order` field(s). E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'day', 'bar'],
+        ...           ['a', 2, 7],
+        ...           ['b', 1, 2],
+        ...           ['a', 1, 3],
+        ...           ['b', 2, 1],
+        ...           ['a', 3, 5],
+        ...           ['b', 3, 9]]
+        >>> windows = [('n', etl.RowNumber()),
+        ...            ('prevbar', etl.Lag('bar')),
+        ...            ('nextbar', etl.Lead('bar')),
+        ...            ('rollbar', etl.RollingSum('bar', 2)),
+        ...            ('cumbar', etl.CumSum('bar'))]
+        >>> table2 = etl.window(table1, 'foo', windows, order='day')
+        >>> table2.lookall()
+        +-----+-----+-----+---+---------+---------+---------+--------+
+        | foo | day | bar | n | prevbar | nextbar | rollbar | cumbar |
+        +=====+=====+=====+===+=========+=========+=========+========+
+        | 'a' |   1 |   3 | 1 | None    |       7 |       3 |      3 |
+        +-----+-----+-----+---+---------+---------+---------+--------+
+        | 'a' |   2 |   7 | 2 |       3 |       5 |      10 |     10 |
+        +-----+-----+-----+---+---------+---------+---------+--------+
+        | 'a' |   3 |   5 | 3 |       7 | None    |      12 |     15 |
+        +-----+-----+-----+---+---------+---------+---------+--------+
+        | 'b' |   1 |   2 | 1 | None    |       1 |       2 |      2 |
+        +-----+-----+-----+---+---------+---------+---------+--------+
+        | 'b' |   2 |   1 | 2 |       2 |       9 |       3 |      3 |
+        +-----+-----+-----+---+---------+---------+---------+--------+
+        | 'b' |   3 |   9 | 3 |       1 | None    |      10 |     12 |
+        +-----+-----+-----+---+---------+---------+---------+--------+
+
+    The `windows` argument should be a dictionary (preferably an
+    :class:`collections.OrderedDict`) or a list of (field, function) pairs,
+    mapping each output field to a window function, i.e., an instance of
+    :class:`petl.transform.windows.RowNumber`,
+    :class:`petl.transform.windows.Rank`,
+    :class:`petl.transform.windows.Lag`,
+    :class:`petl.transform.windows.Lead`,
+    :class:`petl.transform.windows.RollingSum`,
+    :class:`petl.transform.windows.RollingMean` or
+    :class:`petl.transform.windows.CumSum`. The output fields are added after
+    the fields of the input table.
+
+    If `key` is None the whole table is a single partition. The `key` and
+    `order` arguments may each be a field name or index, or a list of field
+    names or indices.
+
+    Unless `presorted` is True the table is first sorted by the `key` then
+    `order` fields, via :func:`petl.transform.sorts.sort`, and the
+    `buffersize`, `tempdir` and `cache` arguments are passed through.
+    Window functions are then computed in a single pass, holding no more rows
+    than needed by the longest rolling, lag or lead window.
+
+    """
+
+    return WindowView(table, key, windows, order=order, presorted=presorted,
+                      buffersize=buffersize, tempdir=tempdir, cache=cache)
+
+
+Table.window = window
+
+
+class WindowView(Table):
+
+    def __init__(self, source, key, windows, order=None, presorted=False,
+                 buffersize=None, tempdir=None, cache=True):
+        sortkey = _aslist(key) + _aslist(order)
+        if presorted or not sortkey:
+            self.source = source
+        else:
+            self.source = sort(source, sortkey, buffersize=buffersize,
+                               tempdir=tempdir, cache=cache)
+        self.key = key
+        self.order = order
+        if isinstance(windows, (list, tuple)):
+            self.windows = OrderedDict(windows)
+        elif isinstance(windows, dict):
+            self.windows = windows
+        else:
+            raise ArgumentError('expected windows is dict, list or tuple')
+
+    def __iter__(self):
+        return iterwindow(self.source, self.key, self.windows, self.order)
+
+
+def _aslist(spec):
+    if spec is None:
+        return []
+    elif isinstance(spec, (list, tuple)):
+        return list(spec)
+    else:
+        return [spec]
+
+
+def _getter(hdr, spec):
+    indices = asindices(hdr, spec)
+    if not indices:
+        return None
+    return operator.itemgetter(*indices)
+
+
+def iterwindow(source, key, windows, order):
+    it = iter(source)
+    hdr = next(it)
+    outhdr = list(hdr)
+    outhdr.extend(windows.keys())
+    yield tuple(outhdr)
+
+    functions = list(windows.values())
+    getters = list()
+    for f in functions:
+        if f.field is not None:
+            getters.append(_getter(hdr, f.field))
+        elif isinstance(f, Rank):
+            if order is None:
+                raise ArgumentError('Rank requires either a field or an '
+                                    'order argument')
+            getters.append(_getter(hdr, order))
+        else:
+            getters.append(None)
+    # rows are output once the values any lead functions need have been seen
+    lookahead = max([f.lookahead for f in functions] + [0])
+
+    getkey = _getter(hdr, key) if key is not None else None
+    if getkey is None:
+        partitions = [it]
+    else:
+        partitions = (rows for _, rows in itertools.groupby(it, key=getkey))
+    for rows in partitions:
+        states = [f.init() for f in functions]
+        # rows and values computed so far for rows not yet output
+        pending = deque()
+        for row in rows:
+            pending.append((row, [
+                None if f.lookahead else f.step(state, getter(row)
+                                                if getter else row)
+                for f, state, getter in zip(functions, states, getters)
+            ]))
+            if len(pending) > lookahead:
+                yield _windowrow(pending, functions, getters)
+        while pending:
+            yield _windowrow(pending, functions, getters)
+
+
+def _windowrow(pending, functions, getters):
+    # output the first pending row, filling in values that depend on
+    # subsequent rows
+    row, values = pending[0]
+    for i, f in enumerate(functions):
+        if f.lookahead:
+            if f.lookahead < len(pending):
+                ahead = pending[f.lookahead][0]
+                values[i] = getters[i](ahead) if getters[i] else ahead
+            else:
+                values[i] = f.missing
+    pending.popleft()
+    return tuple(row) + tuple(values)
+
+
+class WindowFunction(object):
+    """Base class for window functions used by
+    :func:`petl.transform.windows.window`.
+
+    The `field` is a field name or index, or list of field names or indices,
+    whose values the function is computed from, or None if the function is
+    computed from whole rows. A state is created by :meth:`init` for each
+    partition, then :meth:`step` is called with the state and the value of
+    each row in turn and returns the function value for that row."""
+
+    field = None
+    lookahead = 0
+
+    def init(self):
+        raise NotImplementedError
+
+    def step(self, state, value):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.field)
+
+
+class RowNumber(WindowFunction):
+    """Number rows within each partition, starting from `start`."""
+
+    def __init__(self, start=1):
+        self.start = start
+
+    def init(self):
+        return [self.start - 1]
+
+    def step(self, state, value):
+        state[0] += 1
+        return state[0]
+
+    def __repr__(self):
+        return 'RowNumber(start=%r)' % self.start
+
+
+class Rank(WindowFunction):
+    """Rank rows within each partition by the value of `field`, or by the
+    `order` field(s) given to :func:`petl.transform.windows.window` if
+    `field` is None. Rows with equal values have the same rank. If `dense` is
+    False (default) ranks have gaps after ties, e.g., 1, 1, 3, otherwise
+    ranks are consecutive, e.g., 1, 1, 2. N.B., rows should be ordered by the
+    ranked values."""
+
+    def __init__(self, field=None, dense=False):
+        self.field = field
+        self.dense = dense
+
+    def init(self):
+        # number of rows, previous value, previous rank
+        return [0, None, 0]
+
+    def step(self, state, value):
+        n, prev, rank = state
+        if not n or Comparable(value) != Comparable(prev):
+            rank = rank + 1 if self.dense else n + 1
+        state[:] = n + 1, value, rank
+        return rank
+
+
+class Lag(WindowFunction):
+    """The value of `field` in the row `n` rows before, or `missing` if there
+    is no such row in the partition."""
+
+    def __init__(self, field, n=1, missing=None):
+        assert n >= 1, 'n must be at least 1'
+        self.field = field
+        self.n = n
+        self.missing = missing
+
+    def init(self):
+        return deque(maxlen=self.n)
+
+    def step(self, state, value):
+        if len(state) == self.n:
+            v = state[0]
+        else:
+            v = self.missing
+        state.append(value)
+        return v
+
+
+class Lead(WindowFunction):
+    """The value of `field` in the row `n` rows after, or `missing` if there
+    is no such row in the partition."""
+
+    def __init__(self, field, n=1, missing=None):
+        assert n >= 1, 'n must be at least 1'
+        self.field = field
+        self.lookahead = n
+        self.missing = missing
+
+    def init(self):
+        # N.B., values are taken from subsequent rows by the caller
+        return None
+
+
+class RollingSum(WindowFunction):
+    """Sum of the values of `field` over the current row and up to `n - 1`
+    preceding rows in the partition."""
+
+    def __init__(self, field, n):
+        assert n >= 1, 'n must be at least 1'
+        self.field = field
+        self.n = n
+
+    def init(self):
+        # values in the window, and their sum
+        return [deque(maxlen=self.n), 0]
+
+    def step(self, state, value):
+        values, total = state
+        if len(values) == self.n:
+            total -= values[0]
+        values.append(value)
+        total += value
+        if isinstance(total, float):
+            # rounding errors would accumulate in a running float total
+            total = _fsum(values)
+        state[1] = total
+        return total
+
+
+def _fsum(values):
+    # accurate float sum, or as sum() where fsum() can't sum the values,
+    # e.g., infinities of both signs
+    try:
+        return math.fsum(values)
+    except (ValueError, OverflowError):
+        return sum(values)
+
+
+class RollingMean(RollingSum):
+    """Mean of the values of `field` over the current row and up to `n - 1`
+    preceding rows in the partition."""
+
+    def step(self, state, value):
+        total = super(RollingMean, self).step(state, value)
+        return total / len(state[0])
+
+
+class CumSum(WindowFunction):
+    """Cumulative sum of the values of `field` within the partition."""
+
+    def __init__(self, field):
+        self.field = field
+
+    def init(self):
+        return [0]
+
+    def step(self, state, value):
+        state[0] += value
+        return state[0]
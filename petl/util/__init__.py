@@ -8,7 +8,8 @@ from petl.util.lookups import lookup, lookupone, dictlookup, dictlookupone, \
     recordlookup, recordlookupone
 
 from petl.util.parsers import dateparser, timeparser, datetimeparser, \
-    numparser, boolparser
+    numparser, boolparser, memoized, isodatetimeparser, isodateparser, \
+    isotimeparser
 
 from petl.util.vis import look, lookall, lookstr, lookallstr, see
 
@@ -19,11 +20,18 @@ from petl.util.counting import parsecounter, parsecounts, typecounter, \
     stringpatterns, rowlengths, nrows
 
 from petl.util.materialise import listoflists, listoftuples, tupleoflists, \
-    tupleoftuples, columns, facetcolumns
+    tupleoftuples, columns, facetcolumns, indexed
 
 from petl.util.timing import progress, clock
 
-from petl.util.statistics import limits, stats
+from petl.util.batches import iterbatches
+
+from petl.util.statistics import limits, stats, approxcountdistinct, \
+    approxquantiles, heavyhitters
+
+from petl.util.aggregators import Aggregator, Count, Sum, Min, Max, Mean, \
+    Variance, First, Last, CountDistinct, CollectList, ApproxCountDistinct, \
+    ApproxQuantiles, HeavyHitters
 
 from petl.util.misc import typeset, diffheaders, diffvalues, nthword, strjoin, \
     coalesce
@@ -0,0 +1,550 @@
+from __future__ import absolute_import, print_function, division
+
+
+import hashlib
+import math
+import random
+import struct
+from bisect import bisect_left
+
+
+class Aggregator(object):
+    """Base class for incremental aggregators, which can be used wherever an
+    aggregation function is accepted, e.g., by
+    :func:`petl.transform.reductions.aggregate`. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar'],
+        ...           ['a', 3],
+        ...           ['a', 7],
+        ...           ['b', 2],
+        ...           ['b', 1],
+        ...           ['b', 9],
+        ...           ['c', 4]]
+        >>> table2 = etl.aggregate(table1, 'foo', etl.Mean(), 'bar')
+        >>> table2
+        +-----+-------+
+        | foo | value |
+        +=====+=======+
+        | 'a' |   5.0 |
+        +-----+-------+
+        | 'b' |   4.0 |
+        +-----+-------+
+        | 'c' |   4.0 |
+        +-----+-------+
+
+    An aggregator does not need to see all values in a group at once. Instead
+    it maintains a state for each group, which is created by :meth:`init`,
+    updated with each value by :meth:`add` and converted into the aggregate
+    value by :meth:`finalize`. The states of two partial aggregations over the
+    same group can be combined by :meth:`merge`, where all values added to
+    `other` came after all values added to `state`.
+
+    Sub-classes should implement all four methods. States should be picklable
+    and :meth:`add` and :meth:`merge` must return the updated state, which
+    may be the same object updated in place.
+
+    Calling an aggregator on an iterable of values will aggregate all
+    values in a single pass.
+
+    """
+
+    def init(self):
+        raise NotImplementedError
+
+    def add(self, state, value):
+        raise NotImplementedError
+
+    def merge(self, state, other):
+        raise NotImplementedError
+
+    def finalize(self, state):
+        raise NotImplementedError
+
+    def __call__(self, values):
+        state = self.init()
+        add = self.add
+        for v in values:
+            state = add(state, v)
+        return self.finalize(state)
+
+    def __repr__(self):
+        return '%s()' % type(self).__name__
+
+
+class Count(Aggregator):
+    """Count the number of values."""
+
+    def init(self):
+        return 0
+
+    def add(self, state, value):
+        return state + 1
+
+    def merge(self, state, other):
+        return state + other
+
+    def finalize(self, state):
+        return state
+
+
+class Sum(Aggregator):
+    """Sum of values, starting from `start`."""
+
+    def __init__(self, start=0):
+        self.start = start
+
+    def init(self):
+        return self.start
+
+    def add(self, state, value):
+        return state + value
+
+    def merge(self, state, other):
+        if self.start:
+            # N.B., start has been added to both partial sums
+            return state + other - self.start
+        return state + other
+
+    def finalize(self, state):
+        return state
+
+
+class Min(Aggregator):
+    """Minimum value, or `None` if there are no values."""
+
+    def init(self):
+        return ()
+
+    def add(self, state, value):
+        if not state or value < state[0]:
+            return value,
+        return state
+
+    def merge(self, state, other):
+        if other and (not state or other[0] < state[0]):
+            return other
+        return state
+
+    def finalize(self, state):
+        return state[0] if state else None
+
+
+class Max(Aggregator):
+    """Maximum value, or `None` if there are no values."""
+
+    def init(self):
+        return ()
+
+    def add(self, state, value):
+        if not state or value > state[0]:
+            return value,
+        return state
+
+    def merge(self, state, other):
+        if other and (not state or other[0] > state[0]):
+            return other
+        return state
+
+    def finalize(self, state):
+        return state[0] if state else None
+
+
+class Mean(Aggregator):
+    """Arithmetic mean of values, or `None` if there are no values."""
+
+    def init(self):
+        return 0, 0
+
+    def add(self, state, value):
+        return state[0] + 1, state[1] + value
+
+    def merge(self, state, other):
+        return state[0] + other[0], state[1] + other[1]
+
+    def finalize(self, state):
+        n, total = state
+        return total / n if n else None
+
+
+class Variance(Aggregator):
+    """Variance of values, computed in a single pass via Welford's algorithm.
+    The sample variance is returned by default, or the population variance if
+    `population` is True. Returns `None` if there are too few values."""
+
+    def __init__(self, population=False):
+        self.population = population
+
+    def init(self):
+        return 0, 0.0, 0.0
+
+    def add(self, state, value):
+        n, mean, m2 = state
+        n += 1
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+        return n, mean, m2
+
+    def merge(self, state, other):
+        na, meana, m2a = state
+        nb, meanb, m2b = other
+        if not na:
+            return other
+        if not nb:
+            return state
+        n = na + nb
+        delta = meanb - meana
+        mean = meana + delta * nb / n
+        m2 = m2a + m2b + delta * delta * na * nb / n
+        return n, mean, m2
+
+    def finalize(self, state):
+        n, _, m2 = state
+        ddof = 0 if self.population else 1
+        if n - ddof <= 0:
+            return None
+        return m2 / (n - ddof)
+
+
+class First(Aggregator):
+    """First value, or `None` if there are no values."""
+
+    def init(self):
+        return ()
+
+    def add(self, state, value):
+        return state or (value,)
+
+    def merge(self, state, other):
+        return state or other
+
+    def finalize(self, state):
+        return state[0] if state else None
+
+
+class Last(Aggregator):
+    """Last value, or `None` if there are no values."""
+
+    def init(self):
+        return ()
+
+    def add(self, state, value):
+        return value,
+
+    def merge(self, state, other):
+        return other or state
+
+    def finalize(self, state):
+        return state[0] if state else None
+
+
+class CountDistinct(Aggregator):
+    """Count the number of distinct values. N.B., all distinct values are
+    held in memory."""
+
+    def init(self):
+        return set()
+
+    def add(self, state, value):
+        state.add(value)
+        return state
+
+    def merge(self, state, other):
+        state |= other
+        return state
+
+    def finalize(self, state):
+        return len(state)
+
+
+class CollectList(Aggregator):
+    """Collect all values into a list."""
+
+    def init(self):
+        return []
+
+    def add(self, state, value):
+        state.append(value)
+        return state
+
+    def merge(self, state, other):
+        state.extend(other)
+        return state
+
+    def finalize(self, state):
+        return state
+
+
+def _hash64(value):
+    # a 64-bit hash of the value that is stable between processes, unlike the
+    # builtin hash of strings, so that sketches built by different processes
+    # can be merged
+    r = repr(value)
+    if not isinstance(r, bytes):
+        r = r.encode('utf-8')
+    return struct.unpack('<Q', hashlib.md5(r).digest()[:8])[0]
+
+
+class ApproxCountDistinct(Aggregator):
+    """Approximate count of distinct values, using a HyperLogLog sketch of
+    ``2**precision`` registers, with a relative standard error of about
+    ``1.04 / sqrt(2**precision)``, i.e., about 0.8% with the default
+    `precision` of 14. Each state is at most ``2**precision`` bytes. Values
+    are distinguished by their :func:`repr`."""
+
+    def __init__(self, precision=14):
+        assert 4 <= precision <= 18, 'precision must be between 4 and 18'
+        self.precision = precision
+
+    def init(self):
+        # registers are held in a dict until enough are non-zero to make a
+        # dense array smaller, so small groups are cheap
+        return dict()
+
+    def _densify(self, state):
+        registers = bytearray(1 << self.precision)
+        for i, r in state.items():
+            registers[i] = r
+        return registers
+
+    def add(self, state, value):
+        p = self.precision
+        h = _hash64(value)
+        i = h >> (64 - p)
+        w = h & ((1 << (64 - p)) - 1)
+        # position of the leftmost 1 bit in the remaining bits
+        r = 64 - p - w.bit_length() + 1
+        if isinstance(state, dict):
+            if r > state.get(i, 0):
+                state[i] = r
+                if len(state) > (1 << p) // 32:
+                    return self._densify(state)
+        elif r > state[i]:
+            state[i] = r
+        return state
+
+    def merge(self, state, other):
+        if isinstance(state, dict) and isinstance(other, dict):
+            for i, r in other.items():
+                if r > state.get(i, 0):
+                    state[i] = r
+            if len(state) > (1 << self.precision) // 32:
+                return self._densify(state)
+            return state
+        if isinstance(state, dict):
+            state = self._densify(state)
+        if isinstance(other, dict):
+            other = other.items()
+        else:
+            other = enumerate(other)
+        for i, r in other:
+            if r > state[i]:
+                state[i] = r
+        return state
+
+    def finalize(self, state):
+        m = 1 << self.precision
+        if isinstance(state, dict):
+            registers = state.values()
+            zeros = m - len(state)
+        else:
+            registers = state
+            zeros = state.count(0)
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        z = zeros + sum(2.0 ** -r for r in registers if r)
+        estimate = alpha * m * m / z
+        if estimate <= 2.5 * m and zeros:
+            # small range correction, via linear counting
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def __repr__(self):
+        return 'ApproxCountDistinct(precision=%r)' % self.precision
+
+
+class ApproxQuantiles(Aggregator):
+    """Approximate quantiles of values, using a KLL sketch which holds about
+    ``3 * k`` values, with a rank error of roughly ``1.7 / k``, i.e., less
+    than 1% with the default `k` of 200. Values must be comparable.
+
+    If `q` is a number, the value at that quantile is returned, otherwise `q`
+    should be a sequence of quantiles and a tuple of values is returned, e.g.,
+    ``ApproxQuantiles(q=(.25, .5, .75))`` finds the quartiles. Returns `None`
+    (or a tuple of `None`) if there are no values.
+
+    Values are sampled at random when the sketch is compacted, so results
+    may vary between runs once more than about `k` values have been added.
+    Results are exact if fewer values have been added."""
+
+    def __init__(self, q=.5, k=200):
+        self.q = q
+        self.k = k
+
+    def init(self):
+        # a list of compactors, where each value held by the compactor at
+        # level h stands for 2**h values
+        return [[]]
+
+    def _capacity(self, state, h):
+        # lower levels get exponentially smaller capacities
+        depth = len(state) - h - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def _compress(self, state):
+        size = sum(len(c) for c in state)
+        while size >= sum(self._capacity(state, h)
+                          for h in range(len(state))):
+            for h, compactor in enumerate(state):
+                if len(compactor) >= self._capacity(state, h):
+                    if h + 1 == len(state):
+                        state.append([])
+                    # keep every other value, starting at random
+                    compactor.sort()
+                    state[h + 1].extend(compactor[random.randint(0, 1)::2])
+                    del compactor[:]
+                    break
+            size = sum(len(c) for c in state)
+        return state
+
+    def add(self, state, value):
+        state[0].append(value)
+        if len(state[0]) >= self._capacity(state, 0):
+            return self._compress(state)
+        return state
+
+    def merge(self, state, other):
+        while len(state) < len(other):
+            state.append([])
+        for compactor, othercompactor in zip(state, other):
+            compactor.extend(othercompactor)
+        return self._compress(state)
+
+    def finalize(self, state):
+        weighted = sorted((v, 1 << h) for h, compactor in enumerate(state)
+                          for v in compactor)
+        qs = (self.q,) if isinstance(self.q, (int, float)) else self.q
+        if weighted:
+            cumulative = list()
+            total = 0
+            for _, w in weighted:
+                total += w
+                cumulative.append(total)
+            result = tuple(
+                weighted[min(bisect_left(cumulative, q * total),
+                             len(weighted) - 1)][0]
+                for q in qs
+            )
+        else:
+            result = (None,) * len(qs)
+        if isinstance(self.q, (int, float)):
+            return result[0]
+        return result
+
+    def __repr__(self):
+        return 'ApproxQuantiles(q=%r, k=%r)' % (self.q, self.k)
+
+
+class HeavyHitters(Aggregator):
+    """Approximate the `n` most frequent values, using a count-min sketch of
+    `depth` rows of `width` counters to estimate counts, while tracking only
+    the `n` values with the highest estimated counts so far. Returns a list
+    of ``(value, count)`` pairs, most frequent first.
+
+    Estimated counts are never less than the true counts, and with
+    probability ``1 - exp(-depth)`` overestimate by no more than
+    ``e / width`` times the total number of values, i.e., about 0.13% with
+    the default `width` of 2048. Values are distinguished by their
+    :func:`repr`.
+
+    Counters are allocated as values are added, so a group of a few distinct
+    values costs little, but a group with many distinct values may hold up to
+    ``width * depth`` counters.
+
+    """
+
+    def __init__(self, n=10, width=2048, depth=4):
+        self.n = n
+        self.width = width
+        self.depth = depth
+
+    def init(self):
+        # non-zero counters by cell, and estimated counts of current
+        # candidates
+        return dict(), dict()
+
+    def _cells(self, value):
+        # one counter per row, via double hashing
+        h = _hash64(value)
+        h1, h2 = h & 0xffffffff, h >> 32
+        width = self.width
+        return [row * width + (h1 + row * h2) % width
+                for row in range(self.depth)]
+
+    def _estimate(self, counters, value):
+        return min(counters.get(i, 0) for i in self._cells(value))
+
+    def _offer(self, candidates, value, count):
+        if value in candidates or len(candidates) < self.n:
+            candidates[value] = count
+        else:
+            weakest = min(candidates, key=candidates.get)
+            if count > candidates[weakest]:
+                del candidates[weakest]
+                candidates[value] = count
+
+    def add(self, state, value):
+        counters, candidates = state
+        count = None
+        for i in self._cells(value):
+            c = counters[i] = counters.get(i, 0) + 1
+            if count is None or c < count:
+                count = c
+        self._offer(candidates, value, count)
+        return state
+
+    def merge(self, state, other):
+        counters, candidates = state
+        othercounters, othercandidates = other
+        for i, c in othercounters.items():
+            counters[i] = counters.get(i, 0) + c
+        values = set(candidates)
+        values.update(othercandidates)
+        candidates.clear()
+        for value in values:
+            self._offer(candidates, value, self._estimate(counters, value))
+        return state
+
+    def finalize(self, state):
+        _, candidates = state
+        return sorted(candidates.items(), key=lambda item: item[1],
+                      reverse=True)
+
+    def __repr__(self):
+        return 'HeavyHitters(n=%r, width=%r, depth=%r)' % (self.n, self.width,
+                                                           self.depth)
+
+
+# incremental equivalents of builtin aggregation functions
+_builtins = {len: Count, sum: Sum, min: Min, max: Max, list: CollectList}
+
+
+def asaggregator(f):
+    """Return an :class:`Aggregator` equivalent to the aggregation function
+    `f` if one is available, otherwise `None`. The builtin functions
+    :func:`len`, :func:`sum`, :func:`min`, :func:`max` and :func:`list` are
+    recognised."""
+
+    if isinstance(f, Aggregator):
+        return f
+    try:
+        cls = _builtins.get(f)
+    except TypeError:
+        # unhashable
+        return None
+    if cls is None:
+        return None
+    return cls()
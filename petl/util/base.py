@@ -583,6 +583,10 @@ class Record(tuple):
         except KeyError:
             return default
 
+    def __reduce__(self):
+        # support pickling, e.g., when spilling to temporary files
+        return Record, (tuple(self), self.flds, self.missing)
+
 
 def records(table, *sliceargs, **kwargs):
     """
@@ -657,14 +661,63 @@ def expr(s):
     So, e.g., the expression string ``"{foo} * {bar}"`` is converted to the
     function ``lambda rec: rec['foo'] * rec['bar']``
 
+    Once the header of a table is known, the expression can also be compiled
+    into a function operating directly on data rows, with field lookups
+    replaced by tuple indices, avoiding the construction of a record for
+    each row, e.g.::
+
+        >>> import petl as etl
+        >>> f = etl.expr("{foo} * {bar}")
+        >>> g = f.compile(['foo', 'bar'])
+        >>> g(('a', 3))
+        'aaa'
+
+    N.B., the compiled function raises :class:`IndexError` on short rows,
+    and :meth:`compile` returns `None` if the expression refers to a field
+    not in the header or to the record itself.
+
     """
 
-    prog = re.compile('\{([^}]+)\}')
+    return Expr(s)
+
+
+_exprprog = re.compile(r'\{([^}]+)\}')
+
+
+class Expr(object):
+    # function constructed from an expression string, see expr()
 
-    def repl(matchobj):
-        return "rec['%s']" % matchobj.group(1)
+    def __init__(self, s):
+        self.s = s
 
-    return eval("lambda rec: " + prog.sub(repl, s))
+        def repl(matchobj):
+            return "rec['%s']" % matchobj.group(1)
+
+        self.f = eval("lambda rec: " + _exprprog.sub(repl, s))
+
+    def __call__(self, rec):
+        return self.f(rec)
+
+    def __reduce__(self):
+        # the compiled function can't be pickled, so recompile
+        return Expr, (self.s,)
+
+    def compile(self, hdr):
+        flds = list(map(text_type, hdr))
+        names = _exprprog.findall(self.s)
+        if not all(n in flds for n in names):
+            return None
+        if re.search(r'\brec\b', _exprprog.sub('', self.s)):
+            # expression uses the record directly
+            return None
+
+        def repl(matchobj):
+            return "rec[%d]" % flds.index(matchobj.group(1))
+
+        return eval("lambda rec: " + _exprprog.sub(repl, self.s))
+
+    def __repr__(self):
+        return 'expr(%r)' % self.s
 
 
 def rowgroupby(table, key, value=None):
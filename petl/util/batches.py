@@ -0,0 +1,136 @@
+from __future__ import absolute_import, print_function, division
+
+
+from itertools import islice
+
+
+from petl.compat import izip_longest, next
+import petl.config as config
+from petl.util.base import Table
+
+
+def iterbatches(table, size=None, missing=None, strict=False):
+    """
+    Iterate over the table in column-oriented batches. The header is yielded
+    first, then each batch as a list of columns, one for each field, each a
+    list of values from up to `size` rows. E.g.::
+
+        >>> import petl as etl
+        >>> table = [['foo', 'bar'],
+        ...          ['a', 1],
+        ...          ['b', 2],
+        ...          ['c']]
+        >>> it = etl.iterbatches(table, 2)
+        >>> next(it)
+        ('foo', 'bar')
+        >>> next(it)
+        [['a', 'b'], [1, 2]]
+        >>> next(it)
+        [['c'], [None]]
+
+    Columns in a batch are all the same length, short rows being padded with
+    `missing` and long rows truncated to the length of the header. If `size`
+    is not given, `petl.config.batch_size` is used.
+
+    Tables which can produce batches more efficiently than one row at a time
+    do so, e.g., :func:`petl.io.csv.fromcsv`, :func:`petl.io.numpy.fromarray`,
+    :func:`petl.io.pandas.fromdataframe` and :func:`petl.io.db.fromdb` read
+    batches directly, and :func:`petl.transform.basics.cut`,
+    :func:`petl.transform.basics.cutout`,
+    :func:`petl.transform.basics.addfield`,
+    :func:`petl.transform.conversions.convert`,
+    :func:`petl.transform.selects.select` and
+    :func:`petl.transform.headers.rename` transform whole columns of each
+    batch from their source. Other tables are iterated by row, and rows
+    gathered into batches. Sinks such as :func:`petl.io.numpy.toarray`,
+    :func:`petl.io.pandas.todataframe` and :func:`petl.io.db.todb` consume
+    batches.
+
+    N.B., columns may be shared between the batches of a table and those of
+    tables derived from it, so should not be modified. Short rows are padded
+    before being transformed, so the results of transforms such as
+    :func:`petl.transform.conversions.convert` for short rows may differ from
+    row iteration.
+
+    If `strict` is True, rows are never padded or truncated, and a
+    :class:`ValueError` is raised for any row whose length differs from the
+    header. Batches are then only read directly from tables whose rows
+    always match the header, e.g., :func:`petl.io.numpy.fromarray`,
+    :func:`petl.io.pandas.fromdataframe`, :func:`petl.io.db.fromdb` and
+    :func:`petl.transform.basics.cut`, other tables being iterated by row.
+    Sinks which write rows, such as :func:`petl.io.db.todb`, read batches
+    this way.
+
+    """
+
+    if size is None:
+        size = config.batch_size
+    native = getattr(table, '_iterbatches', None)
+    if native is not None and (not strict or fixedrows(table)):
+        return native(size, missing)
+    return iterrowbatches(table, size, missing, strict)
+
+
+Table.iterbatches = iterbatches
+
+
+def fixedrows(table):
+    """Return True if the batches of the table read directly via
+    :func:`petl.util.batches.iterbatches` are the same as its rows, i.e., its
+    rows always have the same length as its header."""
+
+    return getattr(table, '_fixedrows', False)
+
+
+def iterrowbatches(rows, size, missing=None, strict=False):
+    """Gather rows into batches of columns, where the first row is the header,
+    see :func:`petl.util.batches.iterbatches`."""
+
+    it = iter(rows)
+    try:
+        hdr = tuple(next(it))
+    except StopIteration:
+        # no header, e.g., empty file
+        return
+    yield hdr
+    n = len(hdr)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield batchcolumns(chunk, n, missing, strict)
+
+
+def batchcolumns(rows, n, missing=None, strict=False):
+    """Transpose a list of rows into a list of `n` columns, padding short rows
+    with `missing` and truncating long rows, or raising :class:`ValueError`
+    for rows which are not of length `n` if `strict` is True."""
+
+    if strict:
+        for row in rows:
+            if len(row) != n:
+                raise ValueError('row has %d values but the header has %d '
+                                 'fields: %r' % (len(row), n, row))
+    cols = [list(c) for c in izip_longest(*rows, fillvalue=missing)]
+    if len(cols) > n:
+        del cols[n:]
+    while len(cols) < n:
+        cols.append([missing] * len(rows))
+    return cols
+
+
+def batchrows(cols):
+    """Transpose a batch of columns into a list of row tuples."""
+
+    return list(zip(*cols))
+
+
+def iterbatchrows(batches):
+    """Iterate over the header then rows of the given batches, i.e., undo
+    :func:`petl.util.batches.iterbatches`."""
+
+    it = iter(batches)
+    yield next(it)
+    for cols in it:
+        for row in zip(*cols):
+            yield row
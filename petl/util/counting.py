@@ -16,8 +16,17 @@ def nrows(table):
         >>> etl.nrows(table)
         2
 
+    If the table is read from a file with a row index, e.g., via the `index`
+    argument to :func:`petl.io.csv.fromcsv`, the count is taken from the
+    index.
+
     """
 
+    native = getattr(table, '_nrows', None)
+    if native is not None:
+        n = native()
+        if n is not None:
+            return n
     return sum(1 for _ in data(table))
 
 
@@ -2,10 +2,12 @@ from __future__ import absolute_import, print_function, division
 
 
 import operator
+from bisect import bisect_left, bisect_right
 from itertools import islice
 from petl.compat import izip_longest, text_type, OrderedDict, next
 
 
+from petl.comparison import Comparable
 from petl.util.base import asindices, Table
 
 
@@ -162,3 +164,190 @@ class CacheView(Table):
             # does the cache contain a complete copy of the inner table?
             if not self.n or len(self.cache) < self.n:
                 self.cachecomplete = True
+
+
+def indexed(table, field, kind='hash'):
+    """
+    Wrap the table with a cache of all rows, and a secondary index of row
+    positions by the value of the given field, which is used by
+    :func:`petl.transform.selects.selecteq`,
+    :func:`petl.transform.selects.selectin` and range selections, to avoid
+    scanning the whole table for each selection. E.g.::
+
+        >>> import petl as etl
+        >>> table1 = [['foo', 'bar'],
+        ...           ['a', 4],
+        ...           ['b', 1],
+        ...           ['a', 2],
+        ...           ['c', 8]]
+        >>> table2 = etl.indexed(table1, 'foo').indexed('bar', kind='sorted')
+        >>> table2.selecteq('foo', 'a')
+        +-----+-----+
+        | foo | bar |
+        +=====+=====+
+        | 'a' |   4 |
+        +-----+-----+
+        | 'a' |   2 |
+        +-----+-----+
+
+        >>> table2.selectrangeclosed('bar', 1, 8)
+        +-----+-----+
+        | foo | bar |
+        +=====+=====+
+        | 'a' |   4 |
+        +-----+-----+
+        | 'a' |   2 |
+        +-----+-----+
+
+    If `kind` is 'hash' the index maps each value to row positions, and
+    is used for equality and membership selections. If `kind` is 'sorted' the
+    index holds the values in sorted order, and is also used for range
+    selections, via the :mod:`bisect` module. The `field` may be a field name
+    or index, or a list of field names or indices to index by tuples of
+    values.
+
+    The rows are cached, and each index is built, when first needed, and
+    reused for all subsequent selections. Calling this function on an indexed
+    table returns a table sharing the cache and existing indexes. Selections
+    return rows in their original order, and a selection not matching an
+    index, or with `complement=True`, is done by scanning the cached rows as
+    usual.
+
+    """
+
+    return IndexedView(table, field, kind)
+
+
+Table.indexed = indexed
+
+
+class IndexedView(Table):
+
+    def __init__(self, source, field, kind='hash'):
+        if kind not in ('hash', 'sorted'):
+            raise ValueError('kind must be hash or sorted, found %r' % kind)
+        if isinstance(source, IndexedView):
+            # share cached rows and indexes
+            self.store = source.store
+            self.specs = source.specs + [(field, kind)]
+        else:
+            self.store = _IndexStore(source)
+            self.specs = [(field, kind)]
+
+    def __iter__(self):
+        hdr, rows = self.store.materialise()
+        yield hdr
+        for row in rows:
+            yield row
+
+    def getindex(self, field, kinds=('hash', 'sorted')):
+        """Return an index of the given field, of one of the given kinds, or
+        None if there is no such index."""
+
+        hdr, _ = self.store.materialise()
+        indices = tuple(asindices(hdr, field))
+        for kind in kinds:
+            for f, k in self.specs:
+                if k == kind and tuple(asindices(hdr, f)) == indices:
+                    return self.store.getindex(indices, kind)
+        return None
+
+
+class _IndexStore(object):
+    # rows and indexes shared by indexed views of the same source
+
+    def __init__(self, source):
+        self.source = source
+        self.hdr = None
+        self.rows = None
+        self.indexes = dict()
+
+    def materialise(self):
+        if self.rows is None:
+            it = iter(self.source)
+            hdr = tuple(next(it))
+            self.rows = [tuple(row) for row in it]
+            self.hdr = hdr
+        return self.hdr, self.rows
+
+    def getindex(self, indices, kind):
+        key = indices, kind
+        if key not in self.indexes:
+            cls = _HashIndex if kind == 'hash' else _SortedIndex
+            try:
+                self.indexes[key] = cls(self.rows, indices)
+            except TypeError:
+                # e.g., unhashable values, selections will scan instead
+                self.indexes[key] = None
+        return self.indexes[key]
+
+
+def _indexvalues(rows, indices):
+    # values of the indexed field(s) for each row, short rows have None
+    getvalue = operator.itemgetter(*indices)
+    for row in rows:
+        try:
+            yield getvalue(row)
+        except IndexError:
+            yield None
+
+
+class _HashIndex(object):
+    # maps values to row positions
+
+    def __init__(self, rows, indices):
+        self.positions = dict()
+        for i, v in enumerate(_indexvalues(rows, indices)):
+            try:
+                self.positions[v].append(i)
+            except KeyError:
+                self.positions[v] = [i]
+
+    def eq(self, value):
+        return self.positions.get(value, [])
+
+    def isin(self, values):
+        positions = list()
+        for v in set(values):
+            positions.extend(self.positions.get(v, ()))
+        positions.sort()
+        return positions
+
+    def range(self, minv, maxv, mininclusive, maxinclusive):
+        return None
+
+
+class _SortedIndex(object):
+    # values in sorted order, with the row position of each
+
+    def __init__(self, rows, indices):
+        pairs = sorted(((Comparable(v), i) for i, v
+                        in enumerate(_indexvalues(rows, indices))),
+                       key=operator.itemgetter(0))
+        self.values = [v for v, _ in pairs]
+        self.positions = [i for _, i in pairs]
+
+    def eq(self, value):
+        value = Comparable(value)
+        lo = bisect_left(self.values, value)
+        hi = bisect_right(self.values, value, lo)
+        return sorted(self.positions[lo:hi])
+
+    def isin(self, values):
+        positions = list()
+        for v in set(values):
+            positions.extend(self.eq(v))
+        positions.sort()
+        return positions
+
+    def range(self, minv, maxv, mininclusive, maxinclusive):
+        # N.B., bounds are given as 1-tuples, or None if unbounded, as None
+        # is a value like any other
+        lo, hi = 0, len(self.values)
+        if minv is not None:
+            bisect = bisect_left if mininclusive else bisect_right
+            lo = bisect(self.values, Comparable(minv[0]))
+        if maxv is not None:
+            bisect = bisect_right if maxinclusive else bisect_left
+            hi = max(lo, bisect(self.values, Comparable(maxv[0])))
+        return sorted(self.positions[lo:hi])
@@ -0,0 +1,169 @@
+from __future__ import absolute_import, print_function, division
+
+
+import sys
+import multiprocessing
+from collections import deque
+from itertools import islice
+
+
+from petl.compat import pickle, PY2, Queue
+from petl.errors import ArgumentError
+import petl.config as config
+
+
+def iterchunks(it, chunksize):
+    """Yield lists of up to `chunksize` items from the iterable `it`."""
+
+    it = iter(it)
+    while True:
+        chunk = list(islice(it, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iterparallel(func, tasks, workers, initializer=None, initargs=(),
+                 maxinflight=None, ordered=True):
+    """Apply `func` to each item of `tasks` using a pool of `workers`
+    processes, yielding results in the same order as the tasks, or as soon
+    as they are ready if `ordered` is False.
+
+    Tasks are consumed lazily, with no more than `maxinflight` tasks (by
+    default twice the number of workers) submitted to the pool ahead of the
+    result currently being waited for, so that memory use is bounded if the
+    results are consumed more slowly than the tasks are produced.
+
+    The optional `initializer` is called with `initargs` in each worker
+    process when it starts, and can be used to set up state shared by all
+    tasks. N.B., `func` and each task must be picklable, as must `initargs`
+    where worker processes are spawned rather than forked (e.g., on Windows).
+
+    The pool is terminated if the generator is closed before all results have
+    been consumed.
+
+    """
+
+    if maxinflight is None:
+        maxinflight = 2 * workers
+    if not _forking():
+        _checkpicklable(initargs)
+    pool = multiprocessing.Pool(workers, initializer, initargs)
+    try:
+        if ordered:
+            results = _iterordered(pool, func, tasks, maxinflight)
+        else:
+            results = _iterunordered(pool, func, tasks, maxinflight)
+        for result in results:
+            yield result
+    except BaseException:
+        # includes GeneratorExit, don't wait for outstanding tasks
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+
+def _iterordered(pool, func, tasks, maxinflight):
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(func, (task,)))
+        if len(pending) >= maxinflight:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _iterunordered(pool, func, tasks, maxinflight):
+    # results are put on a queue by the pool's result handler thread as they
+    # arrive, errors raised by func being returned rather than raised so the
+    # callback is always called
+    done = Queue()
+    kwargs = dict(callback=done.put)
+    if not PY2:
+        # e.g., result can't be pickled
+        kwargs['error_callback'] = lambda e: done.put((False, e))
+    inflight = 0
+    for task in tasks:
+        pool.apply_async(_trycall, ((func, task),), **kwargs)
+        inflight += 1
+        if inflight >= maxinflight:
+            yield _unwrap(done.get())
+            inflight -= 1
+    while inflight:
+        yield _unwrap(done.get())
+        inflight -= 1
+
+
+def _trycall(args):
+    func, task = args
+    try:
+        return True, func(task)
+    except Exception as e:
+        return False, e
+
+
+def _unwrap(outcome):
+    ok, value = outcome
+    if not ok:
+        raise value
+    return value
+
+
+def iterparallelmap(factory, args, rows, workers, chunksize=None):
+    """Apply a row function to each of `rows` using a pool of `workers`
+    processes, yielding results in the same order as the rows.
+
+    The row function is constructed in each worker process by calling
+    `factory` with `args`, so needn't itself be picklable, and rows are sent
+    to the processes in chunks of `chunksize` rows (by default
+    `petl.config.parallel_chunksize`), see
+    :func:`petl.util.parallel.iterparallel`.
+
+    """
+
+    if chunksize is None:
+        chunksize = config.parallel_chunksize
+    chunks = iterchunks(rows, chunksize)
+    for results in iterparallel(_mapchunk, chunks, workers,
+                                initializer=_initmapworker,
+                                initargs=(factory, args)):
+        for row in results:
+            yield row
+
+
+# row function for worker processes, see _initmapworker
+_worker = dict()
+
+
+def _initmapworker(factory, args):
+    _worker['f'] = factory(*args)
+
+
+def _mapchunk(rows):
+    f = _worker['f']
+    return [f(row) for row in rows]
+
+
+def _forking():
+    # are worker processes forked, inheriting rather than unpickling the
+    # pool's initializer arguments
+    get_start_method = getattr(multiprocessing, 'get_start_method', None)
+    if get_start_method is None:
+        # python 2
+        return sys.platform != 'win32'
+    return get_start_method() == 'fork'
+
+
+def _checkpicklable(initargs):
+    try:
+        pickle.dumps(initargs, pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise ArgumentError(
+            'functions and arguments used by worker processes must be '
+            'picklable where processes are spawned rather than forked, e.g., '
+            'functions must be defined at module level and not be lambdas '
+            '(%s: %s)' % (type(e).__name__, e)
+        )
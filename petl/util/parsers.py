@@ -1,11 +1,14 @@
 from __future__ import absolute_import, print_function, division
 
 
+import re
 import datetime
-from petl.compat import long
+from petl.compat import long, OrderedDict, string_types
+from petl.errors import ArgumentError
+import petl.config as config
 
 
-def datetimeparser(fmt, strict=True):
+def datetimeparser(fmt, strict=True, memoize=False):
     """Return a function to parse strings as :class:`datetime.datetime` objects
     using a given format. E.g.::
 
@@ -23,20 +26,33 @@ def datetimeparser(fmt, strict=True):
     If ``strict=False`` then if an error occurs when parsing, the original
     value will be returned as-is, and no error will be raised.
 
+    If ``memoize`` is True or a cache size, parsed values are cached, see
+    :func:`petl.util.parsers.memoized`.
+
+    Formats made only of the directives ``%Y``, ``%m``, ``%d``, ``%H``,
+    ``%M`` and ``%S`` and literal characters, e.g., ``'%Y%m%d'`` or
+    ``'%Y-%m-%d %H:%M:%S'``, are parsed by slicing values of exactly the
+    corresponding width, which is much faster than
+    :meth:`datetime.datetime.strptime`. Other values and formats are parsed
+    by :meth:`datetime.datetime.strptime`. For ISO 8601 values see also
+    :func:`petl.util.parsers.isodatetimeparser`.
+
     """
 
+    parse = _strptimer(fmt, 'datetime')
+
     def parser(value):
         try:
-            return datetime.datetime.strptime(value.strip(), fmt)
+            return parse(value.strip())
         except Exception as e:
             if strict:
                 raise e
             else:
                 return value
-    return parser
+    return _memoize(parser, memoize)
 
 
-def dateparser(fmt, strict=True):
+def dateparser(fmt, strict=True, memoize=False):
     """Return a function to parse strings as :class:`datetime.date` objects
     using a given format. E.g.::
 
@@ -54,20 +70,26 @@ def dateparser(fmt, strict=True):
     If ``strict=False`` then if an error occurs when parsing, the original
     value will be returned as-is, and no error will be raised.
 
+    If ``memoize`` is True or a cache size, parsed values are cached, see
+    :func:`petl.util.parsers.memoized`. Fixed width formats are parsed
+    quickly as for :func:`petl.util.parsers.datetimeparser`.
+
     """
 
+    parse = _strptimer(fmt, 'date')
+
     def parser(value):
         try:
-            return datetime.datetime.strptime(value.strip(), fmt).date()
+            return parse(value.strip())
         except Exception as e:
             if strict:
                 raise e
             else:
                 return value
-    return parser
+    return _memoize(parser, memoize)
 
 
-def timeparser(fmt, strict=True):
+def timeparser(fmt, strict=True, memoize=False):
     """Return a function to parse strings as :class:`datetime.time` objects
     using a given format. E.g.::
 
@@ -93,23 +115,221 @@ def timeparser(fmt, strict=True):
     If ``strict=False`` then if an error occurs when parsing, the original
     value will be returned as-is, and no error will be raised.
 
+    If ``memoize`` is True or a cache size, parsed values are cached, see
+    :func:`petl.util.parsers.memoized`. Fixed width formats are parsed
+    quickly as for :func:`petl.util.parsers.datetimeparser`.
+
+    """
+
+    parse = _strptimer(fmt, 'time')
+
+    def parser(value):
+        try:
+            return parse(value.strip())
+        except Exception as e:
+            if strict:
+                raise e
+            else:
+                return value
+    return _memoize(parser, memoize)
+
+
+def isodatetimeparser(strict=True, memoize=False):
+    """Return a function to parse ISO 8601 strings of the form
+    ``YYYY-MM-DD[(T| )HH:MM[:SS[.ffffff]]]`` as :class:`datetime.datetime`
+    objects. E.g.::
+
+        >>> from petl import isodatetimeparser
+        >>> isodatetime = isodatetimeparser()
+        >>> isodatetime('2002-12-25T13:45:00')
+        datetime.datetime(2002, 12, 25, 13, 45)
+        >>> isodatetime('2002-12-25 13:45:00.500000')
+        datetime.datetime(2002, 12, 25, 13, 45, 0, 500000)
+
+    Values are checked against this form and then parsed via
+    :meth:`datetime.datetime.fromisoformat` where available (Python 3.7 and
+    later), which is much faster than :meth:`datetime.datetime.strptime`.
+    Other values, e.g., with time zone offsets, or the other ISO 8601 formats
+    accepted by :meth:`datetime.datetime.fromisoformat` in Python 3.11 and
+    later, are not parsed, so results are the same on every version of
+    Python.
+
+    If ``strict=False`` then if an error occurs when parsing, the original
+    value will be returned as-is, and no error will be raised. If
+    ``memoize`` is True or a cache size, parsed values are cached, see
+    :func:`petl.util.parsers.memoized`.
+
+    """
+
+    return _isoparser(datetime.datetime, strict, memoize)
+
+
+def isodateparser(strict=True, memoize=False):
+    """Return a function to parse ISO 8601 strings (``YYYY-MM-DD``) as
+    :class:`datetime.date` objects, via :meth:`datetime.date.fromisoformat`
+    where available. E.g.::
+
+        >>> from petl import isodateparser
+        >>> isodate = isodateparser()
+        >>> isodate('2002-12-25')
+        datetime.date(2002, 12, 25)
+
+    See also :func:`petl.util.parsers.isodatetimeparser`.
+
+    """
+
+    return _isoparser(datetime.date, strict, memoize)
+
+
+def isotimeparser(strict=True, memoize=False):
+    """Return a function to parse ISO 8601 strings (``HH:MM[:SS[.ffffff]]``)
+    as :class:`datetime.time` objects, via
+    :meth:`datetime.time.fromisoformat` where available. E.g.::
+
+        >>> from petl import isotimeparser
+        >>> isotime = isotimeparser()
+        >>> isotime('13:45:30')
+        datetime.time(13, 45, 30)
+
+    See also :func:`petl.util.parsers.isodatetimeparser`.
+
     """
 
+    return _isoparser(datetime.time, strict, memoize)
+
+
+def _isoparser(cls, strict, memoize):
+    parse = _fromisoformat(cls)
+
     def parser(value):
         try:
-            return datetime.datetime.strptime(value.strip(), fmt).time()
+            return parse(value.strip())
         except Exception as e:
             if strict:
                 raise e
             else:
                 return value
-    return parser
+
+    return _memoize(parser, memoize)
+
+
+_isodateprog = r'([0-9]{4})-([0-9]{2})-([0-9]{2})'
+_isotimeprog = r'([0-9]{2}):([0-9]{2})(?::([0-9]{2})(?:\.([0-9]{1,6}))?)?'
+_isoprogs = {
+    datetime.datetime: re.compile(
+        _isodateprog + r'(?:[T ]' + _isotimeprog + r')?\Z'
+    ),
+    datetime.date: re.compile(_isodateprog + r'\Z'),
+    datetime.time: re.compile(_isotimeprog + r'\Z'),
+}
+
+
+def _fromisoformat(cls, native=True):
+    # parse ISO 8601 values of the documented forms, via fromisoformat where
+    # available and it accepts the value on every version of Python, i.e.,
+    # unless a fraction of a second has other than 3 or 6 digits
+    prog = _isoprogs[cls]
+    fromisoformat = getattr(cls, 'fromisoformat', None) if native else None
+
+    def parse(value):
+        m = prog.match(value)
+        if m is None:
+            raise ValueError('invalid isoformat string: %r' % value)
+        digits = None
+        if cls is not datetime.date and m.lastindex == prog.groups:
+            digits = m.group(prog.groups)
+        if fromisoformat is not None \
+                and (digits is None or len(digits) in (3, 6)):
+            return fromisoformat(value)
+        parts = [int(p) if p else 0 for p in m.groups()]
+        if digits is not None:
+            # scale fraction of a second to microseconds
+            parts[-1] = int(digits) * 10 ** (6 - len(digits))
+        return cls(*parts)
+
+    return parse
+
+
+# widths of the numeric directives parsed by slicing, see _strptimer
+_fixedwidths = {'Y': 4, 'm': 2, 'd': 2, 'H': 2, 'M': 2, 'S': 2}
+
+
+def _strptimer(fmt, kind):
+    # returns a function parsing a string with the given format as a
+    # datetime, date or time via strptime, or first by slicing for fixed width
+    # formats
+    def strptime(value):
+        dt = datetime.datetime.strptime(value, fmt)
+        if kind == 'date':
+            return dt.date()
+        elif kind == 'time':
+            return dt.time()
+        return dt
+
+    fixed = _fixedwidthparser(fmt, kind)
+    if fixed is None:
+        return strptime
+    match, construct = fixed
+
+    def parse(value):
+        if match(value):
+            try:
+                return construct(value)
+            except ValueError:
+                # e.g., day out of range, let strptime raise the error
+                pass
+        return strptime(value)
+
+    return parse
+
+
+def _fixedwidthparser(fmt, kind):
+    # returns a function matching strings of the fixed width format and a
+    # function constructing a datetime, date or time from matching strings by
+    # slicing, or None if the format is not fixed width
+    if not isinstance(fmt, string_types):
+        return None
+    pattern = ''
+    slices = dict()
+    pos = 0
+    i = 0
+    while i < len(fmt):
+        c = fmt[i]
+        if c == '%':
+            d = fmt[i+1:i+2]
+            if d == '%':
+                pattern += '%'
+                pos += 1
+            elif d in _fixedwidths and d not in slices:
+                w = _fixedwidths[d]
+                slices[d] = 'int(v[%d:%d])' % (pos, pos + w)
+                pattern += r'\d{%d}' % w
+                pos += w
+            else:
+                return None
+            i += 2
+        else:
+            # N.B., strptime also matches other amounts of whitespace, such
+            # values are left to strptime
+            pattern += re.escape(c)
+            pos += 1
+            i += 1
+    # all parsed values are checked by constructing a datetime, even if only
+    # the date or time is returned, strptime defaulting to 1900-01-01
+    fields = [slices.get('Y', '1900'), slices.get('m', '1'),
+              slices.get('d', '1')]
+    fields += [slices.get(d, '0') for d in 'HMS']
+    suffix = {'date': '.date()', 'time': '.time()'}.get(kind, '')
+    construct = eval('lambda v: datetime(%s)%s' % (', '.join(fields), suffix),
+                     {'datetime': datetime.datetime})
+    return re.compile(pattern + r'\Z').match, construct
 
 
 def boolparser(true_strings=('true', 't', 'yes', 'y', '1'),
                false_strings=('false', 'f', 'no', 'n', '0'),
                case_sensitive=False,
-               strict=True):
+               strict=True,
+               memoize=False):
     """Return a function to parse strings as :class:`bool` objects using a
     given set of string representations for `True` and `False`. E.g.::
 
@@ -139,6 +359,9 @@ def boolparser(true_strings=('true', 't', 'yes', 'y', '1'),
     If ``strict=False`` then if an error occurs when parsing, the original
     value will be returned as-is, and no error will be raised.
 
+    If ``memoize`` is True or a cache size, parsed values are cached, see
+    :func:`petl.util.parsers.memoized`.
+
     """
 
     if not case_sensitive:
@@ -159,15 +382,18 @@ def boolparser(true_strings=('true', 't', 'yes', 'y', '1'),
         else:
             return value
 
-    return parser
+    return _memoize(parser, memoize)
 
 
-def numparser(strict=False):
+def numparser(strict=False, memoize=False):
     """Return a function that will attempt to parse the value as a number,
     trying :func:`int`, :func:`long`, :func:`float` and :func:`complex` in
     that order. If all fail, return the value as-is, unless ``strict=True``,
     in which case raise the underlying exception.
 
+    If ``memoize`` is True or a cache size, parsed values are cached, see
+    :func:`petl.util.parsers.memoized`.
+
     """
 
     def f(v):
@@ -190,4 +416,91 @@ def numparser(strict=False):
                 raise e
         return v
 
-    return f
+    return _memoize(f, memoize)
+
+
+def memoized(f, maxsize=None):
+    """Return a function caching the results of calling the function `f`
+    with a single value, e.g., a converter or parser, for up to `maxsize`
+    distinct values (by default `petl.config.memoize_maxsize`), discarding
+    the least recently used values when the cache is full. E.g.::
+
+        >>> from petl import memoized
+        >>> f = memoized(str.upper, maxsize=2)
+        >>> [f(v) for v in ['a', 'b', 'a', 'c', 'b', 'c']]
+        ['A', 'B', 'A', 'C', 'B', 'C']
+        >>> f.hits, f.misses, f.hitrate
+        (2, 4, 0.3333333333333333)
+
+    Caching is worthwhile where values are repeated and the function is
+    expensive relative to a dictionary lookup, e.g., parsing dates. Values
+    of different types are cached separately, values which aren't hashable
+    are not cached, and errors are not cached. See also the ``memoize``
+    arguments of :func:`petl.transform.conversions.convert` and the parser
+    functions in :mod:`petl.util.parsers`.
+
+    """
+
+    return MemoizedFunction(f, maxsize)
+
+
+class MemoizedFunction(object):
+    """Function with a bounded least recently used cache of results, see
+    :func:`petl.util.parsers.memoized`. The `hits` and `misses` attributes
+    count calls whose results were and were not found in the cache."""
+
+    def __init__(self, f, maxsize=None):
+        self.f = f
+        if maxsize is None:
+            maxsize = config.memoize_maxsize
+        if maxsize < 1:
+            raise ArgumentError('maxsize must be at least 1, not %r'
+                                % maxsize)
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, v):
+        cache = self.cache
+        k = (v.__class__, v)
+        try:
+            result = cache.pop(k)
+        except KeyError:
+            self.misses += 1
+            result = self.f(v)
+            if len(cache) >= self.maxsize:
+                # discard least recently used
+                cache.popitem(last=False)
+        except TypeError:
+            # not hashable
+            self.misses += 1
+            return self.f(v)
+        else:
+            self.hits += 1
+        cache[k] = result
+        return result
+
+    @property
+    def hitrate(self):
+        """Proportion of calls whose results were found in the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def __repr__(self):
+        return 'memoized(%r, maxsize=%r) (hits=%r, misses=%r, size=%r)' \
+               % (self.f, self.maxsize, self.hits, self.misses,
+                  len(self.cache))
+
+
+def _memoize(f, memoize):
+    # memoize is False, True or a cache size, where a size of 0 is off
+    if not memoize:
+        return f
+    elif memoize is True:
+        return MemoizedFunction(f)
+    elif memoize < 0:
+        raise ArgumentError('memoize must be a boolean or a cache size, not '
+                            '%r' % memoize)
+    else:
+        return MemoizedFunction(f, memoize)
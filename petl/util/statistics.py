@@ -5,6 +5,8 @@ from collections import namedtuple
 
 
 from petl.util.base import values, Table
+from petl.util.aggregators import ApproxCountDistinct, ApproxQuantiles, \
+    HeavyHitters
 
 
 def limits(table, field):
@@ -89,6 +91,90 @@ def stats(table, field):
 Table.stats = stats
 
 
+def approxcountdistinct(table, field, precision=14):
+    """
+    Estimate the number of distinct values under the given field, in a single
+    pass and bounded memory, via a HyperLogLog sketch. E.g.::
+
+        >>> import petl as etl
+        >>> table = [['foo', 'bar']] + [['a', i % 100] for i in range(1000)]
+        >>> etl.approxcountdistinct(table, 'bar')
+        100
+
+    The relative standard error of the estimate is about
+    ``1.04 / sqrt(2**precision)``. See also
+    :class:`petl.util.aggregators.ApproxCountDistinct`, which can be used to
+    estimate distinct counts for each group via
+    :func:`petl.transform.reductions.aggregate`.
+
+    The `field` argument can be a field name or index (starting from zero).
+
+    """
+
+    return ApproxCountDistinct(precision=precision)(values(table, field))
+
+
+Table.approxcountdistinct = approxcountdistinct
+
+
+def approxquantiles(table, field, q=(.25, .5, .75), k=200):
+    """
+    Estimate quantiles of the values under the given field, in a single pass
+    and bounded memory, via a KLL sketch. E.g.::
+
+        >>> import petl as etl
+        >>> table = [['foo', 'bar']] + [['a', i] for i in range(101)]
+        >>> etl.approxquantiles(table, 'bar')
+        (25, 50, 75)
+        >>> etl.approxquantiles(table, 'bar', q=.9)
+        90
+
+    If `q` is a number a single value is returned, otherwise a tuple of values
+    is returned, one for each quantile in `q`. The rank error of each value
+    is roughly ``1.7 / k``. See also
+    :class:`petl.util.aggregators.ApproxQuantiles`.
+
+    The `field` argument can be a field name or index (starting from zero).
+
+    """
+
+    return ApproxQuantiles(q=q, k=k)(values(table, field))
+
+
+Table.approxquantiles = approxquantiles
+
+
+def heavyhitters(table, field, n=10, width=2048, depth=4):
+    """
+    Estimate the `n` most frequent values under the given field, in a single
+    pass and bounded memory, via a count-min sketch. E.g.::
+
+        >>> import petl as etl
+        >>> table = [['foo', 'bar'],
+        ...          ['a', 1],
+        ...          ['b', 2],
+        ...          ['c', 2],
+        ...          ['d', 3],
+        ...          ['e', 2],
+        ...          ['f', 3]]
+        >>> etl.heavyhitters(table, 'bar', n=2)
+        [(2, 3), (3, 2)]
+
+    Returns a list of ``(value, count)`` pairs, most frequent first. Counts
+    may be overestimated by up to about ``e / width`` times the number of
+    rows. See also :class:`petl.util.aggregators.HeavyHitters` and
+    :func:`petl.util.counting.valuecounts`, which counts all values exactly.
+
+    The `field` argument can be a field name or index (starting from zero).
+
+    """
+
+    return HeavyHitters(n=n, width=width, depth=depth)(values(table, field))
+
+
+Table.heavyhitters = heavyhitters
+
+
 def onlinestats(xi, n, mean=0, variance=0):
     # function to calculate online mean and variance
     meanprv = mean